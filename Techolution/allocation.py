@@ -0,0 +1,182 @@
+"""
+Capacity allocation for AI-Driven Talent Management System
+Splits employees' weekly hours across projects with a sparse linear program
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+from matching_engine import MatchingEngine, DEFAULT_TOP_K
+from assignment import iter_project_results
+
+logger = logging.getLogger(__name__)
+
+# Candidate employees per project, and projects per employee, in the first solve
+DEFAULT_CANDIDATES_PER_PROJECT = 20
+DEFAULT_PROJECTS_PER_EMPLOYEE = 10
+
+# Rounds that add employees with spare hours to projects with unmet demand
+DEFAULT_DEEPENING_ROUNDS = 2
+
+# Relative objective improvement below which the rounds stop
+MIN_IMPROVEMENT = 0.001
+
+# Lowest overall score worth allocating hours to (the greedy complementary-role bar)
+ALLOCATION_MIN_SCORE = 40
+
+# Allocations below this many hours are solver noise
+MIN_ALLOCATED_HOURS = 0.5
+
+
+class CapacityAllocator:
+    """Allocates weekly hours of employees to project demand, maximizing score-weighted hours"""
+
+    def __init__(self, engine: MatchingEngine, candidates_per_project: int = DEFAULT_CANDIDATES_PER_PROJECT,
+                 projects_per_employee: int = DEFAULT_PROJECTS_PER_EMPLOYEE,
+                 max_rounds: int = DEFAULT_DEEPENING_ROUNDS, min_score: float = ALLOCATION_MIN_SCORE):
+        self.engine = engine
+        self.candidates_per_project = candidates_per_project
+        self.projects_per_employee = projects_per_employee
+        self.max_rounds = max_rounds
+        self.min_score = min_score
+
+    def _candidate_edges(self, approx: np.ndarray, projects: np.ndarray, depth: int,
+                         available: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(project, employee) edges to the best-scoring available employees of each project"""
+        engine = self.engine
+        mask = engine.emp_active & (engine.emp_hours > 0)
+        if available is not None:
+            mask &= available
+        columns = np.flatnonzero(mask)
+        if len(columns) == 0 or len(projects) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        values = approx[np.ix_(projects, columns)]
+        values = np.where(values >= self.min_score, values, -np.inf)
+        k = min(depth, len(columns))
+        top = np.argpartition(-values, k - 1, axis=1)[:, :k]
+        keep = np.isfinite(np.take_along_axis(values, top, axis=1))
+        project_ids = np.broadcast_to(projects[:, None], top.shape)
+        return project_ids[keep], columns[top[keep]]
+
+    def _employee_edges(self, approx: np.ndarray, projects: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(project, employee) edges from every employee to their best-scoring projects"""
+        engine = self.engine
+        employees = np.flatnonzero(engine.emp_active & (engine.emp_hours > 0))
+        if len(employees) == 0 or len(projects) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        values = approx[np.ix_(projects, employees)].T
+        values = np.where(values >= self.min_score, values, -np.inf)
+        k = min(self.projects_per_employee, len(projects))
+        top = np.argpartition(-values, k - 1, axis=1)[:, :k]
+        keep = np.isfinite(np.take_along_axis(values, top, axis=1))
+        employee_ids = np.broadcast_to(employees[:, None], top.shape)
+        return projects[top[keep]], employee_ids[keep]
+
+    def _merge_edges(self, edge_projects: np.ndarray, edge_employees: np.ndarray,
+                     new_projects: np.ndarray, new_employees: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Edge lists extended by the new edges they don't have yet, and how many were added"""
+        width = self.engine.num_employees
+        fresh = ~np.isin(new_projects * width + new_employees, edge_projects * width + edge_employees)
+        return (np.concatenate([edge_projects, new_projects[fresh]]),
+                np.concatenate([edge_employees, new_employees[fresh]]), int(fresh.sum()))
+
+    def _solve_lp(self, edge_projects: np.ndarray, edge_employees: np.ndarray,
+                  approx: np.ndarray, demand: np.ndarray) -> np.ndarray:
+        """Hours per edge maximizing score-weighted hours under capacity and demand limits"""
+        engine = self.engine
+        num_edges = len(edge_projects)
+        edge_ids = np.arange(num_edges)
+
+        # One row per employee (hours available) then one per project (hours needed)
+        constraints = sparse.csr_matrix(
+            (np.ones(2 * num_edges),
+             (np.concatenate([edge_employees, engine.num_employees + edge_projects]),
+              np.concatenate([edge_ids, edge_ids]))),
+            shape=(engine.num_employees + engine.num_projects, num_edges)
+        )
+        limits = np.concatenate([np.where(engine.emp_active, engine.emp_hours, 0), demand])
+        upper = np.minimum(engine.emp_hours[edge_employees], demand[edge_projects])
+
+        solution = linprog(
+            -approx[edge_projects, edge_employees], A_ub=constraints, b_ub=limits,
+            bounds=np.column_stack([np.zeros(num_edges), upper]), method='highs'
+        )
+        if solution.status != 0:
+            raise RuntimeError(f"Capacity allocation failed: {solution.message}")
+        return solution.x
+
+    def solve(self, overall: np.ndarray) -> List[List[Tuple[int, float]]]:
+        """(employee index, weekly hours) allocations for every project"""
+        engine = self.engine
+        demand = np.where(engine.proj_active, engine.proj_demand_hours, 0)
+        active_projects = np.flatnonzero(demand > 0)
+        allocations = [[] for _ in range(engine.num_projects)]
+        if len(active_projects) == 0:
+            return allocations
+
+        approx = np.round(overall * 100, 2)
+        edge_projects, edge_employees = self._candidate_edges(approx, active_projects, self.candidates_per_project)
+
+        # Every employee also brings edges to their own best projects, so the hours of
+        # people outside the popular shortlists are still on offer
+        edge_projects, edge_employees, _ = self._merge_edges(
+            edge_projects, edge_employees, *self._employee_edges(approx, active_projects))
+        hours = self._solve_lp(edge_projects, edge_employees, approx, demand)
+
+        # Projects still short of hours look for employees that still have hours to spare
+        objective = float(approx[edge_projects, edge_employees] @ hours)
+        for _ in range(self.max_rounds):
+            allocated = np.bincount(edge_projects, weights=hours, minlength=engine.num_projects)
+            spent = np.bincount(edge_employees, weights=hours, minlength=engine.num_employees)
+            short = active_projects[allocated[active_projects] < demand[active_projects] - MIN_ALLOCATED_HOURS]
+            spare = engine.emp_hours - spent >= MIN_ALLOCATED_HOURS
+            edge_projects, edge_employees, added = self._merge_edges(
+                edge_projects, edge_employees,
+                *self._candidate_edges(approx, short, self.candidates_per_project, spare))
+            if not added:
+                break
+            hours = self._solve_lp(edge_projects, edge_employees, approx, demand)
+
+            new_objective = float(approx[edge_projects, edge_employees] @ hours)
+            if new_objective - objective < objective * MIN_IMPROVEMENT:
+                break
+            objective = new_objective
+
+        # Each project's people ordered by hours, then score
+        used = hours >= MIN_ALLOCATED_HOURS
+        order = np.lexsort((-approx[edge_projects, edge_employees], -hours, edge_projects))
+        for edge in order[used[order]].tolist():
+            allocations[edge_projects[edge]].append((int(edge_employees[edge]), round(float(hours[edge]), 2)))
+
+        staffed = float(hours[used].sum())
+        people = len(np.unique(edge_employees[used]))
+        logger.info(f"Capacity allocation staffed {staffed:.0f} of {demand.sum():.0f} demanded hours "
+                    f"with {people} employees over {len(edge_projects)} candidate edges")
+        return allocations
+
+    def results(self, overall: np.ndarray, allocations: List[List[Tuple[int, float]]],
+                top_k: int = DEFAULT_TOP_K, progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """Result dicts in the same shape as the greedy matching run, with allocated hours"""
+        return list(self.iter_results(overall, allocations, top_k, progress))
+
+    def iter_results(self, overall: np.ndarray, allocations: List[List[Tuple[int, float]]],
+                     top_k: int = DEFAULT_TOP_K, progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Dict]:
+        """Yield the result dicts project by project, each with its demand and allocated hours"""
+        def describe(match: Dict, hours: float):
+            match['allocated_hours'] = hours
+            match['selection_reason'] = (
+                f"Allocated {hours:g} of {match['capacity']:g} weekly hours for {', '.join(match['skills'][:3])} skills"
+            )
+
+        results = iter_project_results(self.engine, overall, allocations, describe, top_k, progress)
+        active = [p for p in range(self.engine.num_projects) if self.engine.proj_active[p]]
+        for result, p in zip(results, active):
+            result['demand_hours'] = float(self.engine.proj_demand_hours[p])
+            result['allocated_hours'] = round(sum(hours for _, hours in allocations[p]), 2)
+            yield result
@@ -0,0 +1,157 @@
+"""
+Approximate candidate index for AI-Driven Talent Management System
+Clustered (IVF) maximum inner product search over employee score vectors for very large rosters
+"""
+
+import numpy as np
+from scipy import sparse
+from typing import Optional
+import logging
+from matching_engine import PROFICIENCY_LEVELS, DEFAULT_TOP_K
+
+logger = logging.getLogger(__name__)
+
+# Search knobs: clusters scanned per project and candidates kept for exact scoring
+DEFAULT_PROBES = 8
+DEFAULT_CANDIDATES = 500
+
+# k-means rounds used to train the cluster centroids
+DEFAULT_ITERATIONS = 10
+
+
+class ClusteredIndex:
+    """Employees grouped by k-means into inverted lists, searched by inner product with a project query"""
+
+    def __init__(self, engine, clusters: int = 0, iterations: int = DEFAULT_ITERATIONS, seed: int = 0):
+        """Train the clusters on the engine's current employee rows (0 clusters picks about sqrt(n))"""
+        self.engine = engine
+        self.vectors = self._employee_vectors()
+        self.skill_width = self.vectors.shape[1] - len(PROFICIENCY_LEVELS) - 1  # skill and bonus columns
+        num_employees = self.vectors.shape[0]
+        if clusters <= 0:
+            clusters = int(round(np.sqrt(num_employees)))
+        self.num_clusters = max(1, min(clusters, num_employees))
+
+        self.centroids, assignment = self._kmeans(np.random.default_rng(seed), iterations)
+
+        # Inverted lists: employees of cluster c are order[offsets[c]:offsets[c + 1]]
+        self.order = np.argsort(assignment, kind='stable')
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=self.num_clusters))])
+        logger.info(f"ANN index ready: {num_employees} employees in {self.num_clusters} clusters")
+
+    def _employee_vectors(self) -> sparse.csr_matrix:
+        """Rows whose inner product with a project query approximates the pair's overall score"""
+        engine = self.engine
+        num_employees = engine.num_employees
+        has_skills = (~engine.emp_empty).astype(np.float64)
+
+        # Skill overlap as a cosine of the incidence rows, standing in for the Jaccard match
+        norms = np.sqrt(np.maximum(engine.emp_skill_counts, 1.0))
+        skills = sparse.diags(0.4 / norms) @ engine.emp_skill_matrix
+
+        # Skill bonus and domain bonus each employee would earn from every scoring domain
+        columns = np.arange(len(engine.domain_names), dtype=np.uint64)
+        has_domain = (engine.emp_scoring_mask[:, None] & (np.uint64(1) << columns)[None, :]) != 0
+        skill_bonus = 0.4 * np.where(has_domain, np.minimum(0.3, engine.emp_domain_counts * 0.1), 0.0)
+        domain_bonus = np.minimum(0.2, engine.emp_domain_counts * 0.05)
+
+        # One-hot proficiency level (the query carries the level's proficiency scores) and capacity
+        levels = np.zeros((num_employees, len(PROFICIENCY_LEVELS)))
+        levels[np.arange(num_employees), engine.emp_levels - 1] = 1.0
+        capacity = (engine.capacity_scores * 0.1)[:, None]
+
+        dense = np.hstack([skill_bonus * has_skills[:, None], domain_bonus * has_skills[:, None], levels, capacity])
+        return sparse.hstack([sparse.diags(has_skills) @ skills, sparse.csr_matrix(dense)], format='csr')
+
+    def query(self, project_index: int) -> np.ndarray:
+        """Dense query vector of a project"""
+        engine = self.engine
+        skills = np.zeros(engine.proj_skill_matrix.shape[1])
+        if not engine.proj_empty[project_index]:
+            tokens = engine.proj_skill_matrix[project_index].indices
+            skills[tokens] = 1.0 / np.sqrt(max(len(tokens), 1))
+
+        num_domains = len(engine.domain_names)
+        hits = engine.proj_domain_hits[project_index].astype(np.float64)
+        domain = np.zeros(num_domains)
+        if engine.proj_domain_key[project_index] >= 0:
+            domain[engine.proj_domain_key[project_index]] = 1.0
+        if engine.proj_empty[project_index]:
+            hits[:] = 0
+            domain[:] = 0
+
+        # Proficiency score of every employee level for this project's level
+        emp_levels = np.arange(1, len(PROFICIENCY_LEVELS) + 1, dtype=np.float64)
+        proj_level = engine.proj_levels[project_index]
+        proficiency = np.where(emp_levels >= proj_level, 1.0 + (emp_levels - proj_level) * 0.1,
+                               np.maximum(0.1, emp_levels / proj_level))
+        return np.concatenate([skills, hits, domain, proficiency * 0.3, [1.0]])
+
+    def _nearest(self, centroids: np.ndarray) -> np.ndarray:
+        """Nearest centroid of every employee vector, in blocks of rows"""
+        half_norms = 0.5 * (centroids ** 2).sum(axis=1)
+        step = max(1, self.engine.block_cells // max(1, len(centroids)))
+        assignment = np.empty(self.vectors.shape[0], dtype=np.int64)
+        for start in range(0, self.vectors.shape[0], step):
+            block = self.vectors[start:start + step] @ centroids.T
+            assignment[start:start + step] = np.argmax(block - half_norms[None, :], axis=1)
+        return assignment
+
+    def _kmeans(self, rng: np.random.Generator, iterations: int):
+        """Centroids and cluster assignment from Lloyd's iterations on the sparse vectors"""
+        num_employees = self.vectors.shape[0]
+        if num_employees == 0:
+            return np.zeros((1, self.vectors.shape[1])), np.empty(0, dtype=np.int64)
+
+        seeds = rng.choice(num_employees, self.num_clusters, replace=False)
+        centroids = self.vectors[seeds].toarray()
+        assignment = self._nearest(centroids)
+        for _ in range(iterations):
+            members = sparse.csr_matrix(
+                (np.ones(num_employees), (assignment, np.arange(num_employees))),
+                shape=(self.num_clusters, num_employees)
+            )
+            counts = np.bincount(assignment, minlength=self.num_clusters)
+            filled = counts > 0
+            centroids[filled] = (members @ self.vectors).toarray()[filled] / counts[filled, None]
+            new_assignment = self._nearest(centroids)
+            if np.array_equal(new_assignment, assignment):
+                break
+            assignment = new_assignment
+        return centroids, assignment
+
+    def search(self, project_index: int, probes: int = DEFAULT_PROBES,
+               candidates: int = DEFAULT_CANDIDATES) -> np.ndarray:
+        """Active, eligible employees with the highest estimated scores in the project's closest clusters"""
+        engine = self.engine
+        query = self.query(project_index)
+        probes = min(probes, self.num_clusters)
+        closest = np.argpartition(-(self.centroids @ query), probes - 1)[:probes]
+        members = np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in closest.tolist()])
+
+        keep = engine.emp_active[members]
+        eligible = engine.eligible(project_index)
+        if eligible is not None:
+            keep &= eligible[members]
+        members = members[keep]
+        if len(members) > candidates:
+            # Skill terms from the vectors, the rest of the score exactly (availability included)
+            skill_terms = self.vectors[members, :self.skill_width] @ query[:self.skill_width]
+            estimates = skill_terms + engine.candidate_index().skill_free_scores([project_index], members)[0]
+            members = members[np.argpartition(-estimates, candidates - 1)[:candidates]]
+        return np.sort(members)
+
+
+def recall_at_k(exact: np.ndarray, approximate: np.ndarray, k: int = DEFAULT_TOP_K,
+                rows: Optional[np.ndarray] = None) -> float:
+    """Share of each project's approximate top k that reaches the exact k-th best score (ties count as hits)"""
+    rows = np.arange(exact.shape[0]) if rows is None else np.asarray(rows)
+    if len(rows) == 0 or exact.shape[1] == 0:
+        return 1.0
+    k = min(k, exact.shape[1])
+    hits = 0
+    for p in rows.tolist():
+        kth = np.partition(exact[p], exact.shape[1] - k)[exact.shape[1] - k]
+        top = np.argpartition(-approximate[p], k - 1)[:k]
+        hits += int((exact[p, top] >= kth).sum())
+    return hits / (len(rows) * k)
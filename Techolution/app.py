@@ -1,8 +1,6 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory, session, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, session, redirect, url_for, flash
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import LabelEncoder
 import json
 import os
@@ -10,6 +8,11 @@ from datetime import datetime, timedelta
 import warnings
 import hashlib
 import secrets
+import threading
+import time
+import queue
+import uuid
+from functools import wraps
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -18,10 +21,44 @@ from reportlab.lib import colors
 import matplotlib.pyplot as plt
 import io
 import base64
+from matching_engine import MatchingEngine
+from incremental_matching import IncrementalMatcher
+from assignment import GlobalAssigner
+from allocation import CapacityAllocator
+from database import get_db_manager, convert_to_date_string
+from migrate_data import sync_csv_to_database, dataset_paths, DATASET_STEMS, CSV_CHUNK_ROWS
+from taxonomy import TaxonomyLoader, DEFAULT_TAXONOMY_PATH
+from semantic import employee_text, project_text
+from ann_index import DEFAULT_PROBES, recall_at_k
+from result_cache import ResultCache, DEFAULT_MEMORY_ENTRIES, cache_key, dataframe_fingerprint
+from matching_jobs import JobManager, DEFAULT_POOL_SIZE, DEFAULT_RETAINED_JOBS
+from result_index import ResultIndex, DEFAULT_LIMIT
+from compact_results import CompactResults, EmployeeTable, MATCH_KEYS, PLAIN_MATCH_KEYS
+from history_writer import HistoryWriter, DEFAULT_QUEUE_SIZE
+from dataset_cache import DatasetCache, file_hash
+from dataset_formats import FORMATS, dataset_format, read_frame
+from ingest_jobs import IngestManager
 warnings.filterwarnings('ignore')
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'datasets'
+app.config['TAXONOMY_PATH'] = os.environ.get('TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+app.config['MATCHING_WORKERS'] = int(os.environ.get('MATCHING_WORKERS', 1))  # > 1 scores projects in worker processes
+app.config['ASSIGNMENT_MODE'] = os.environ.get('ASSIGNMENT_MODE', 'greedy')  # 'greedy' (project order), 'global' or 'capacity'
+app.config['CANDIDATE_PRUNING'] = os.environ.get('CANDIDATE_PRUNING', '1') != '0'  # fully score only skill-index candidates
+app.config['ANN_CANDIDATES'] = int(os.environ.get('ANN_CANDIDATES', 0))  # > 0 fully scores only this many ANN candidates per project
+app.config['ANN_PROBES'] = int(os.environ.get('ANN_PROBES', DEFAULT_PROBES))  # clusters scanned per project
+app.config['ANN_CLUSTERS'] = int(os.environ.get('ANN_CLUSTERS', 0))  # 0 picks about sqrt(employees)
+app.config['SEMANTIC_WEIGHT'] = float(os.environ.get('SEMANTIC_WEIGHT', 0))  # weight of the TF-IDF relevance in overall scores
+app.config['SEMANTIC_CACHE_FOLDER'] = os.environ.get('SEMANTIC_CACHE_FOLDER', os.path.join('cache', 'tfidf'))
+app.config['DATASET_CACHE_FOLDER'] = os.environ.get('DATASET_CACHE_FOLDER', os.path.join('cache', 'datasets'))  # preprocessed datasets, '' disables
+app.config['RESULT_CACHE_SIZE'] = int(os.environ.get('RESULT_CACHE_SIZE', DEFAULT_MEMORY_ENTRIES))  # matching runs kept in memory, 0 disables
+app.config['RESULT_CACHE_FOLDER'] = os.environ.get('RESULT_CACHE_FOLDER')  # optional on-disk tier for matching runs
+app.config['MATCHING_JOB_POOL'] = int(os.environ.get('MATCHING_JOB_POOL', DEFAULT_POOL_SIZE))  # background matching jobs run at once, each on its own engine
+app.config['MATCHING_JOB_RETENTION'] = int(os.environ.get('MATCHING_JOB_RETENTION', DEFAULT_RETAINED_JOBS))  # finished jobs kept
+app.config['MATCHING_HISTORY'] = os.environ.get('MATCHING_HISTORY', '1') != '0'  # persist every run's scored pairs to matching_results
+app.config['MATCHING_HISTORY_QUEUE'] = int(os.environ.get('MATCHING_HISTORY_QUEUE', DEFAULT_QUEUE_SIZE))  # runs waiting to be written
+app.config['UPLOAD_CHUNK_ROWS'] = int(os.environ.get('UPLOAD_CHUNK_ROWS', CSV_CHUNK_ROWS))  # rows of an upload read and written at a time
 app.secret_key = 'your-secret-key-change-this-in-production'
 
 
@@ -178,49 +215,152 @@ Just let me know what you'd like to know more about!"""
 employees_df = None
 projects_df = None
 matching_results = None
+matching_engine = None  # Precomputed score arrays for the loaded datasets
+matching_session = None  # Cached scores and teams of the last matching run, patched on row changes
+matching_mode = None  # Assignment mode of the last matching run
+matching_stats = None  # Pairs scored and pruned by the candidate index in the last matching run
+taxonomy_loader = TaxonomyLoader(app.config['TAXONOMY_PATH'])  # Domain taxonomy, recompiled on file change
+result_cache = ResultCache(app.config['RESULT_CACHE_SIZE'], app.config['RESULT_CACHE_FOLDER'])  # Matching runs by data and settings
+dataset_fingerprint = None  # (employees_df, projects_df, content hash) of the loaded datasets
+data_version = None  # Database data version the loaded datasets were read at, None when they came from elsewhere
+dataset_cache = DatasetCache(app.config['DATASET_CACHE_FOLDER'])  # Preprocessed datasets per source version, for fast (re)loads
+result_index = None  # Filter, sort and paging lookups over matching_results, rebuilt when it is replaced
+matching_lock = threading.RLock()  # Serializes matching runs, data loads and row edits (jobs take it only to read and publish)
 used_employees_global = set()  # Track globally used employees
+matching_jobs = JobManager(lambda mode, progress: perform_matching_job(mode, progress),  # Background matching runs
+                           app.config['MATCHING_JOB_POOL'], app.config['MATCHING_JOB_RETENTION'])
+history_writer = HistoryWriter(get_db_manager, app.config['MATCHING_HISTORY_QUEUE'])  # Writes run scores off the request thread
+ingest_jobs = IngestManager(lambda files, progress: ingest_uploads(files, progress))  # Background upload ingestions
 
+def with_matching_lock(func):
+    """Run a function while holding the matching lock"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with matching_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+def snapshot_frame(df, fields):
+    """Database rows with the dataset column names and the types a CSV read of them would have"""
+    df = df.rename(columns=fields).replace('', np.nan)
+    df = df.drop(columns=[column for column in OPTIONAL_COLUMNS if column in df and df[column].isna().all()])
+    for column in df.columns:
+        if df[column].dtype == object:
+            numbers = pd.to_numeric(df[column], errors='coerce')
+            if numbers.isna().sum() == df[column].isna().sum():
+                df[column] = numbers
+        if df[column].dtype.kind == 'f' and df[column].notna().all() and (df[column] % 1 == 0).all():
+            df[column] = df[column].astype(np.int64)
+    return df
+
+def load_database_snapshot():
+    """Preprocessed datasets of the database's current version (seeded from the CSV files when empty)
+
+    Returns 'warm' when they came from the dataset cache, 'cold' when they were read and preprocessed,
+    and None when the database has no data.
+    """
+    global employees_df, projects_df, data_version
+    
+    db = get_db_manager()
+    origin, version = db.get_data_origin(), db.get_data_version()
+    cached = dataset_cache.get(DatasetCache.key('database', origin, version))
+    if cached is not None:
+        employees_df, projects_df = cached
+        preprocess_data(preprocessed=True)
+        data_version = version
+        return 'warm'
+    
+    version, employees, projects = db.get_snapshot()
+    if employees.empty and projects.empty:
+        if not dataset_paths():
+            return None
+        sync_csv_to_database(db)
+        version, employees, projects = db.get_snapshot()
+        if employees.empty and projects.empty:
+            return None
+    
+    employees_df = snapshot_frame(employees, EMPLOYEE_FIELDS)
+    projects_df = snapshot_frame(projects, PROJECT_FIELDS)
+    preprocess_data()
+    dataset_cache.put(DatasetCache.key('database', origin, version), employees_df, projects_df)
+    data_version = version
+    return 'cold'
+
+def read_dataset_files():
+    """Read the dataset files (CSV, compressed CSV, Parquet or Feather), converting Excel files when there are none"""
+    global employees_df, projects_df
+    
+    # Check if dataset files exist, if not try to convert from Excel or create sample data
+    paths = dataset_paths()
+    
+    # Load employees data
+    if 'employees' in paths:
+        employees_df = read_frame(paths['employees'])
+    elif os.path.exists('datasets/Employees.csv.xlsx'):
+        # Convert Excel to CSV
+        try:
+            employees_df = pd.read_excel('datasets/Employees.csv.xlsx')
+            employees_df.to_csv('datasets/Employees.csv', index=False)
+            print("Converted Employees.xlsx to CSV")
+        except Exception as e:
+            print(f"Error converting Excel file: {e}")
+            employees_df = create_sample_employees_data()
+    else:
+        employees_df = create_sample_employees_data()
+    
+    # Load projects data
+    if 'projects' in paths:
+        projects_df = read_frame(paths['projects'])
+    elif os.path.exists('datasets/Projects.csv.xlsx'):
+        # Convert Excel to CSV
+        try:
+            projects_df = pd.read_excel('datasets/Projects.csv.xlsx')
+            projects_df.to_csv('datasets/Projects.csv', index=False)
+            print("Converted Projects.xlsx to CSV")
+        except Exception as e:
+            print(f"Error converting Excel file: {e}")
+            projects_df = create_sample_projects_data()
+    else:
+        projects_df = create_sample_projects_data()
+
+def load_dataset_files():
+    """Preprocessed datasets of the dataset files, from the dataset cache when both files were loaded before"""
+    global employees_df, projects_df
+    
+    paths = dataset_paths()
+    key = DatasetCache.key('files', file_hash([paths['employees'], paths['projects']])) if len(paths) == 2 else None
+    cached = dataset_cache.get(key) if key else None
+    if cached is not None:
+        employees_df, projects_df = cached
+        preprocess_data(preprocessed=True)
+        return 'warm'
+    
+    read_dataset_files()
+    preprocess_data()
+    if key:
+        dataset_cache.put(key, employees_df, projects_df)
+    return 'cold'
+
+@with_matching_lock
 def load_data():
-    """Load and preprocess the datasets"""
+    """Load and preprocess the datasets, from the database when it has them"""
     global employees_df, projects_df
     
     try:
-        # Check if CSV files exist, if not try to convert from Excel or create sample data
-        employees_csv_exists = os.path.exists('datasets/Employees.csv')
-        projects_csv_exists = os.path.exists('datasets/Projects.csv')
-        
-        # Load employees data
-        if employees_csv_exists:
-            employees_df = pd.read_csv('datasets/Employees.csv')
-        elif os.path.exists('datasets/Employees.csv.xlsx'):
-            # Convert Excel to CSV
-            try:
-                employees_df = pd.read_excel('datasets/Employees.csv.xlsx')
-                employees_df.to_csv('datasets/Employees.csv', index=False)
-                print("Converted Employees.xlsx to CSV")
-            except Exception as e:
-                print(f"Error converting Excel file: {e}")
-                employees_df = create_sample_employees_data()
+        started = time.time()
+        previous_fingerprint = dataset_fingerprint[2] if dataset_fingerprint else None
+        load = load_database_snapshot()
+        if load:
+            source = f"the database at data version {data_version}"
         else:
-            employees_df = create_sample_employees_data()
-        
-        # Load projects data
-        if projects_csv_exists:
-            projects_df = pd.read_csv('datasets/Projects.csv')
-        elif os.path.exists('datasets/Projects.csv.xlsx'):
-            # Convert Excel to CSV
-            try:
-                projects_df = pd.read_excel('datasets/Projects.csv.xlsx')
-                projects_df.to_csv('datasets/Projects.csv', index=False)
-                print("Converted Projects.xlsx to CSV")
-            except Exception as e:
-                print(f"Error converting Excel file: {e}")
-                projects_df = create_sample_projects_data()
-        else:
-            projects_df = create_sample_projects_data()
+            load = load_dataset_files()
+            source = "the CSV files"
+        print(f"Loaded {len(employees_df)} employees and {len(projects_df)} projects from {source} "
+              f"in {time.time() - started:.3f}s ({'warm, from the dataset cache' if load == 'warm' else 'cold'})")
         
-        # Data preprocessing
-        preprocess_data()
+        # Cached matching runs of other content are dropped from memory
+        if current_fingerprint() != previous_fingerprint:
+            result_cache.invalidate()
         
     except Exception as e:
         print(f"Error loading data: {e}")
@@ -266,27 +406,47 @@ def load_data():
 #         'Experience_years': [3, 2, 1, 4, 5]
 #     })
 
-def preprocess_data():
-    """Preprocess the data for analysis"""
-    global employees_df, projects_df
+def preprocess_employees(df):
+    """Preprocess employee rows in place"""
+    # Convert date columns
+    if 'Available Date' in df.columns:
+        df['Available Date'] = pd.to_datetime(df['Available Date'], errors='coerce')
     
-    if employees_df is not None and not employees_df.empty:
-        # Convert date columns
-        if 'Available Date' in employees_df.columns:
-            employees_df['Available Date'] = pd.to_datetime(employees_df['Available Date'], errors='coerce')
-        
-        # Create skill vectors
-        if 'Skills' in employees_df.columns:
-            employees_df['Skills_List'] = employees_df['Skills'].str.split(',').apply(lambda x: [s.strip() for s in x] if pd.notna(x) else [])
+    # Create skill vectors
+    if 'Skills' in df.columns:
+        df['Skills_List'] = df['Skills'].str.split(',').apply(lambda x: [s.strip() for s in x] if isinstance(x, list) else [])
+    return df
+
+def preprocess_projects(df):
+    """Preprocess project rows in place"""
+    # Convert date columns
+    if 'Hard_Deadline' in df.columns:
+        df['Hard_Deadline'] = pd.to_datetime(df['Hard_Deadline'], errors='coerce')
     
-    if projects_df is not None and not projects_df.empty:
-        # Convert date columns
-        if 'Hard_Deadline' in projects_df.columns:
-            projects_df['Hard_Deadline'] = pd.to_datetime(projects_df['Hard_Deadline'], errors='coerce')
-        
-        # Create domain vectors
-        if 'Domain' in projects_df.columns:
-            projects_df['Domain_List'] = projects_df['Domain'].str.split(',').apply(lambda x: [s.strip() for s in x] if pd.notna(x) else [])
+    # Create domain vectors
+    if 'Domain' in df.columns:
+        df['Domain_List'] = df['Domain'].str.split(',').apply(lambda x: [s.strip() for s in x] if isinstance(x, list) else [])
+    return df
+
+def preprocess_data(preprocessed=False):
+    """Preprocess the data for analysis (frames from the dataset cache only need the engine rebuilt)"""
+    global employees_df, projects_df, matching_engine, matching_session, dataset_fingerprint, data_version
+    
+    # Score arrays are rebuilt lazily for the new data
+    matching_engine = None
+    matching_session = None
+    dataset_fingerprint = None
+    data_version = None  # set again by load_database_snapshot for database snapshots
+    
+    if employees_df is not None and not employees_df.empty and not preprocessed:
+        preprocess_employees(employees_df)
+    
+    if projects_df is not None and not projects_df.empty and not preprocessed:
+        preprocess_projects(projects_df)
+    
+    # Build the engine and its inverted skill index up front so the first match starts warm
+    if employees_df is not None and not employees_df.empty and projects_df is not None and not projects_df.empty:
+        get_matching_engine().candidate_index()
 
 def calculate_skill_match(employee_skills, project_requirements):
     """Calculate skill match score between employee and project"""
@@ -306,16 +466,6 @@ def calculate_skill_match(employee_skills, project_requirements):
         proj_req = set(str(project_requirements).split(','))
         proj_req = set(req.strip() for req in proj_req if req.strip())
     
-    # Domain-specific skill mapping for better matching
-    domain_skill_mapping = {
-        'ai/ml': ['AI', 'Machine Learning', 'Python Developer', 'Data Science', 'ML'],
-        'web development': ['Backend Developer', 'Full Stack Developer', 'FSD', 'Web Development', 'Frontend'],
-        'mobile development': ['Mobile Development', 'UI/UX', 'React Native', 'Mobile App', 'iOS', 'Android'],
-        'data science': ['Data Science', 'Python Developer', 'Machine Learning', 'Analytics', 'Big Data'],
-        'cloud computing': ['DevOps', 'Cloud Computing', 'Infrastructure', 'AWS', 'Azure'],
-        'e-commerce': ['Backend Developer', 'Web Development', 'E-commerce', 'Full Stack Developer']
-    }
-    
     # Calculate base Jaccard similarity
     intersection = len(emp_skills.intersection(proj_req))
     union = len(emp_skills.union(proj_req))
@@ -324,9 +474,8 @@ def calculate_skill_match(employee_skills, project_requirements):
     # Apply domain-specific bonus
     domain_bonus = 0
     project_req_str = str(project_requirements).lower()
-    for domain, skills in domain_skill_mapping.items():
-        if any(skill.lower() in project_req_str for skill in skills):
-            domain_skills = set(skill.lower() for skill in skills)
+    for domain_skills in taxonomy_loader.current.scoring_sets:
+        if any(skill in project_req_str for skill in domain_skills):
             emp_skills_lower = set(skill.lower() for skill in emp_skills)
             domain_intersection = len(emp_skills_lower.intersection(domain_skills))
             if domain_intersection > 0:
@@ -368,99 +517,334 @@ def calculate_capacity_score(emp_capacity, required_capacity=40):
     utilization = min(1.0, emp_capacity / required_capacity) 
     return utilization
 
-def perform_matching():
-    """Perform intelligent matching between employees and projects"""
-    global employees_df, projects_df, matching_results, used_employees_global
+def calculate_semantic_match(emp_description, project_title, project_domain):
+    """Calculate TF-IDF cosine similarity of the employee's previous project and the project"""
+    text_model = get_matching_engine().text_model
+    return text_model.similarity(employee_text(emp_description), project_text(project_title, project_domain))
+
+def get_matching_engine():
+    """Get the matching engine for the loaded datasets, building it if needed"""
+    global matching_engine
+    
+    # A changed taxonomy file recompiles the taxonomy and the engine's bitmasks
+    taxonomy = taxonomy_loader.get()
+    if matching_engine is None or matching_engine.taxonomy is not taxonomy:
+        matching_engine = MatchingEngine(employees_df, projects_df, taxonomy,
+                                         semantic_weight=app.config['SEMANTIC_WEIGHT'],
+                                         text_cache_dir=app.config['SEMANTIC_CACHE_FOLDER'])
+    return matching_engine
+
+def ann_settings(candidates=None, probes=None, clusters=None):
+    """Approximate search knobs from the config, or None when matching is exact"""
+    candidates = app.config['ANN_CANDIDATES'] if candidates is None else candidates
+    if candidates <= 0:
+        return None
+    return {
+        'candidates': candidates,
+        'probes': app.config['ANN_PROBES'] if probes is None else probes,
+        'clusters': app.config['ANN_CLUSTERS'] if clusters is None else clusters
+    }
+
+def current_fingerprint():
+    """Content hash of the loaded datasets, recomputed when they are replaced"""
+    global dataset_fingerprint
     
+    if (dataset_fingerprint is None or dataset_fingerprint[0] is not employees_df
+            or dataset_fingerprint[1] is not projects_df):
+        fingerprint = cache_key(dataframe_fingerprint(employees_df), dataframe_fingerprint(projects_df))
+        dataset_fingerprint = (employees_df, projects_df, fingerprint)
+    return dataset_fingerprint[2]
+
+def matching_cache_key(mode):
+    """Result cache key of a matching run: the datasets plus every setting that changes results"""
+    try:
+        with open(taxonomy_loader.path, 'rb') as f:
+            taxonomy_hash = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        taxonomy_hash = None
+    constraints = matching_engine.constraints if matching_engine is not None else None
+    # The match key layout too, so on-disk runs stored with other keys are not served
+    return cache_key(current_fingerprint(), mode, taxonomy_hash, app.config['SEMANTIC_WEIGHT'], ann_settings(),
+                     [constraint.__qualname__ for constraint in constraints] if constraints else None,
+                     MATCH_KEYS if app.config['SEMANTIC_WEIGHT'] else PLAIN_MATCH_KEYS)
+
+def matching_error(mode):
+    """Why matching cannot run on the loaded data in this mode, or None"""
     if employees_df is None or projects_df is None or employees_df.empty or projects_df.empty:
-        return {"error": "No data available for matching"}
+        return "No data available for matching"
+    if mode not in ('greedy', 'global', 'capacity'):
+        return f"Unknown assignment mode: {mode}"
+    return None
+
+@with_matching_lock
+def perform_matching(mode=None, progress=None, compact=False):
+    """Perform intelligent matching between employees and projects; progress(done, total) follows the projects
+    
+    Returns a list of result dicts, or with compact=True the packed results the app keeps.
+    """
+    mode = mode or app.config['ASSIGNMENT_MODE']
+    error = matching_error(mode)
+    if error:
+        return {"error": error}
+    
+    for _ in iter_matching(mode, progress):
+        pass
+    return matching_results if compact else list(matching_results)
+
+def iter_matching(mode, progress=None):
+    """Run matching and yield each project's result as soon as it is ready
+    
+    The matching lock is held until the generator is exhausted or closed; the run only becomes the
+    current results (and is cached) once every project has been yielded. Clients are served through
+    stream_matching, which never holds the lock while they read.
+    """
+    global matching_results, matching_session, matching_mode, matching_stats
+    
+    with matching_lock:
+        if progress is not None:
+            progress(0, len(projects_df))
+        
+        # Reset global used employees for new matching session
+        used_employees_global.clear()
+        
+        # Unchanged datasets and settings give the stored results of an earlier run
+        key = matching_cache_key(mode) if app.config['RESULT_CACHE_SIZE'] > 0 else None
+        cached = result_cache.get(key) if key else None
+        if cached is not None:
+            if not (mode == 'greedy' and matching_mode == 'greedy' and matching_session_current()):
+                matching_session = None
+            matching_mode = mode
+            matching_stats = dict(cached['stats'])
+            matching_results = cached['results']
+            if not isinstance(matching_results, CompactResults):
+                matching_results = CompactResults.from_dicts(matching_results)  # stored before results were packed
+            used_employees_global.update(matching_results.team_ids())
+            if progress is not None:
+                progress(len(matching_results), len(matching_results))
+            yield from matching_results
+            return
+        
+        matcher, stream = start_run(get_matching_engine(), mode, progress)
+        
+        # Results are kept packed into score columns; greedy runs pack theirs in the session
+        packed = []
+        for result in stream:
+            used_employees_global.update(rec['employee_id'] for rec in result['intelligent_team'])
+            if mode != 'greedy':
+                packed.append(matcher.employee_table.pack(result))
+            yield result
+        publish_run(matcher, mode, packed, key)
+
+def start_run(engine, mode, progress=None):
+    """A matcher for a fresh matching run on engine, and the stream of its results"""
+    # Scores are computed block by block against all employees at once; only the top
+    # matches and the team builder's candidate pools become dicts, already in the order
+    # a full sort by overall score would give
+    matcher = IncrementalMatcher(engine, create_intelligent_team)
+    if mode == 'greedy':
+        # Projects are scored a block ahead of team assembly, so results come out as they are built
+        stream = matcher.stream(workers=app.config['MATCHING_WORKERS'], prune=app.config['CANDIDATE_PRUNING'],
+                                ann=ann_settings(), progress=progress)
+    else:
+        # Staff all projects at once from the score matrix instead of in project order,
+        # or split employees' weekly hours across projects instead of staffing whole people;
+        # approximate runs leave everyone outside a project's candidates ineligible for it
+        matcher.score(workers=app.config['MATCHING_WORKERS'], prune=app.config['CANDIDATE_PRUNING'],
+                      ann=ann_settings())
+        overall = matcher.dense_overall()
+        solver = GlobalAssigner(matcher.engine) if mode == 'global' else CapacityAllocator(matcher.engine)
+        stream = solver.iter_results(overall, solver.solve(overall), progress=progress)
+    return matcher, stream
+
+def publish_run(matcher, mode, packed, key=None):
+    """Make a finished run the current results (packed holds them for non-greedy modes); returns them"""
+    global matching_results, matching_session, matching_mode, matching_stats
     
-    # Reset global used employees for new matching session
+    matching_session = matcher if mode == 'greedy' else None
+    matching_mode = mode
+    matching_stats = dict(matcher.stats, run_id=uuid.uuid4().hex)
+    matching_results = (matcher.results() if mode == 'greedy'
+                        else CompactResults(packed, matcher.employee_table))
     used_employees_global.clear()
+    used_employees_global.update(matching_results.team_ids())
+    if app.config['MATCHING_HISTORY']:
+        history_writer.submit(matching_stats['run_id'], matching_results.pairs())
+    if key:
+        result_cache.put(key, {'results': matching_results, 'stats': matching_stats})
+    return matching_results
+
+def perform_matching_job(mode=None, progress=None):
+    """Matching run of a background job, on its own engine so runs in the job pool overlap
+    
+    The datasets are read under the matching lock, then scored and staffed outside it; the lock is
+    taken again to publish the results, which become current only if the datasets and taxonomy are
+    still the ones the job read (otherwise the job keeps them to itself). Returns packed results.
+    """
+    global matching_engine
+    
+    mode = mode or app.config['ASSIGNMENT_MODE']
+    with matching_lock:
+        error = matching_error(mode)
+        if error:
+            return {"error": error}
+        if app.config['RESULT_CACHE_SIZE'] > 0 and result_cache.get(matching_cache_key(mode)) is not None:
+            return perform_matching(mode, progress, compact=True)
+        snapshot = (employees_df, projects_df, taxonomy_loader.get())
+    
+    if progress is not None:
+        progress(0, len(snapshot[1]))
+    engine = MatchingEngine(*snapshot, semantic_weight=app.config['SEMANTIC_WEIGHT'],
+                            text_cache_dir=app.config['SEMANTIC_CACHE_FOLDER'])
+    matcher, stream = start_run(engine, mode, progress)
+    packed = []
+    for result in stream:
+        if mode != 'greedy':
+            packed.append(matcher.employee_table.pack(result))
+    
+    with matching_lock:
+        if all(read is current for read, current in zip(snapshot, (employees_df, projects_df, taxonomy_loader.get()))):
+            matching_engine = engine  # built from the same datasets, so edits can patch the session
+            key = matching_cache_key(mode) if app.config['RESULT_CACHE_SIZE'] > 0 else None
+            return publish_run(matcher, mode, packed, key)
+    print("Datasets changed during a background matching run; its results were not published")
+    return matcher.results() if mode == 'greedy' else CompactResults(packed, matcher.employee_table)
+
+def stream_matching(mode, stats=None):
+    """Yield each project's result of a matching run as soon as it is ready, without holding the lock
+    
+    A worker thread drains iter_matching under the matching lock and hands the results over packed
+    through an unbounded queue, so it never waits on the reader: a slow or stalled client keeps no lock,
+    and one that stops early leaves the run to finish and become the current results. The run's stats
+    are copied into stats once it is done.
+    """
+    handoff = queue.Queue()
+    table = EmployeeTable()
+    
+    def run():
+        try:
+            with matching_lock:
+                for result in iter_matching(mode):
+                    handoff.put(('project', table.pack(result)))
+                handoff.put(('done', dict(matching_stats)))
+        except Exception as e:
+            handoff.put(('error', e))
+    
+    threading.Thread(target=run, name='matching-stream', daemon=True).start()
+    while True:
+        kind, value = handoff.get()
+        if kind == 'error':
+            raise value
+        if kind == 'done':
+            if stats is not None:
+                stats.update(value)
+            return
+        yield table.unpack(value)
+
+def score_pair_reference(employee, project):
+    """Score one employee against one project with the per-pair scoring functions"""
+    project_domain = project.get('Domain', '')
+    project_proficiency = project.get('Proficiency', 'Intermediate')
+    project_deadline = project.get('Hard_Deadline', datetime.now() + timedelta(days=30))
+    project_conflicts = project.get('Conflicts', 'None')
+    
+    emp_id = employee.get('Emp ID', f"Emp_{employee.name}")
+    emp_name = employee.get('Name', 'Unknown')
+    
+    # Handle skills safely
+    emp_skills_raw = employee.get('Skills_List', [])
+    if not emp_skills_raw:
+        emp_skills_raw = employee.get('Skills', '')
+        if emp_skills_raw and not pd.isna(emp_skills_raw):
+            emp_skills = [skill.strip() for skill in str(emp_skills_raw).split(',') if skill.strip()]
+        else:
+            emp_skills = []
+    else:
+        emp_skills = [str(skill).strip() for skill in emp_skills_raw if skill and str(skill).strip()]
+    
+    emp_proficiency = employee.get('Proficiency', 'Intermediate')
+    emp_capacity = employee.get('Capacity per week (hrs)', 40)
+    emp_available = employee.get('Available Date', datetime.now())
+    
+    # Ensure capacity is numeric
+    try:
+        emp_capacity = float(emp_capacity) if not pd.isna(emp_capacity) else 40
+    except (ValueError, TypeError):
+        emp_capacity = 40
+    
+    # Calculate various match scores with error handling
+    skill_score = calculate_skill_match(emp_skills, project_domain)
+    proficiency_score = calculate_proficiency_match(emp_proficiency, project_proficiency)
+    availability_score = calculate_availability_score(emp_available, project_deadline)
+    capacity_score = calculate_capacity_score(emp_capacity)
+    semantic_score = calculate_semantic_match(employee.get('Previous Project Description', ''),
+                                              project.get('Project_Title', ''), project_domain)
+    
+    # Apply domain-specific bonus
+    domain_bonus = calculate_domain_bonus(emp_skills, project_domain)
+    
+    # Apply conflict penalty
+    conflict_penalty = calculate_conflict_penalty(emp_id, project_conflicts)
+    
+    # Weighted overall score with bonuses and penalties
+    overall_score = (
+        skill_score * 0.4 +
+        proficiency_score * 0.3 +
+        availability_score * 0.2 +
+        capacity_score * 0.1 +
+        semantic_score * app.config['SEMANTIC_WEIGHT']
+    ) + domain_bonus - conflict_penalty
     
+    # Ensure score is between 0 and 1
+    overall_score = max(0, min(1, overall_score))
+    
+    match_data = {
+        'employee_id': str(emp_id),
+        'employee_name': str(emp_name),
+        'project_id': str(project.get('ID', f"Project_{project.name}")),
+        'project_title': str(project.get('Project_Title', 'Unknown Project')),
+        'skill_match': round(skill_score * 100, 2),
+        'proficiency_match': round(proficiency_score * 100, 2),
+        'availability_match': round(availability_score * 100, 2),
+        'capacity_match': round(capacity_score * 100, 2)
+    }
+    if app.config['SEMANTIC_WEIGHT']:
+        # Reported only when it counts towards the overall score
+        match_data['semantic_match'] = round(semantic_score * 100, 2)
+    match_data.update({
+        'overall_score': round(overall_score * 100, 2),
+        'skills': emp_skills,
+        'role': str(employee.get('Role', '')),
+        'proficiency': str(emp_proficiency),
+        'capacity': emp_capacity,
+        'location': str(employee.get('Location', '')),
+        'domain_bonus': round(domain_bonus * 100, 2),
+        'conflict_penalty': round(conflict_penalty * 100, 2)
+    })
+    
+    return match_data
+
+def perform_matching_reference():
+    """Per-pair matching loop kept as the reference for the vectorized engine"""
+    global employees_df, projects_df
+    
+    if employees_df is None or projects_df is None or employees_df.empty or projects_df.empty:
+        return {"error": "No data available for matching"}
+    
+    used_employees = set()
     results = []
     
     for _, project in projects_df.iterrows():
         project_id = project.get('ID', f"Project_{project.name}")
         project_title = project.get('Project_Title', 'Unknown Project')
         project_domain = project.get('Domain', '')
-        project_proficiency = project.get('Proficiency', 'Intermediate')
         project_duration = project.get('Duration', 12)
         project_deadline = project.get('Hard_Deadline', datetime.now() + timedelta(days=30))
-        project_conflicts = project.get('Conflicts', 'None')
         
         project_matches = []
         
         for _, employee in employees_df.iterrows():
             try:
-                emp_id = employee.get('Emp ID', f"Emp_{employee.name}")
-                emp_name = employee.get('Name', 'Unknown')
-                
-                # Handle skills safely
-                emp_skills_raw = employee.get('Skills_List', [])
-                if not emp_skills_raw:
-                    emp_skills_raw = employee.get('Skills', '')
-                    if emp_skills_raw and not pd.isna(emp_skills_raw):
-                        emp_skills = [skill.strip() for skill in str(emp_skills_raw).split(',') if skill.strip()]
-                    else:
-                        emp_skills = []
-                else:
-                    emp_skills = [str(skill).strip() for skill in emp_skills_raw if skill and str(skill).strip()]
-                
-                emp_proficiency = employee.get('Proficiency', 'Intermediate')
-                emp_capacity = employee.get('Capacity per week (hrs)', 40)
-                emp_available = employee.get('Available Date', datetime.now())
-                
-                # Ensure capacity is numeric
-                try:
-                    emp_capacity = float(emp_capacity) if not pd.isna(emp_capacity) else 40
-                except (ValueError, TypeError):
-                    emp_capacity = 40
-                
-                # Calculate various match scores with error handling
-                skill_score = calculate_skill_match(emp_skills, project_domain)
-                proficiency_score = calculate_proficiency_match(emp_proficiency, project_proficiency)
-                availability_score = calculate_availability_score(emp_available, project_deadline)
-                capacity_score = calculate_capacity_score(emp_capacity)
-                
-                # Apply domain-specific bonus
-                domain_bonus = calculate_domain_bonus(emp_skills, project_domain)
-                
-                # Apply conflict penalty
-                conflict_penalty = calculate_conflict_penalty(emp_id, project_conflicts)
-                
-                # Weighted overall score with bonuses and penalties
-                overall_score = (
-                    skill_score * 0.4 +
-                    proficiency_score * 0.3 +
-                    availability_score * 0.2 +
-                    capacity_score * 0.1
-                ) + domain_bonus - conflict_penalty
-                
-                # Ensure score is between 0 and 1
-                overall_score = max(0, min(1, overall_score))
-                
-                match_data = {
-                    'employee_id': str(emp_id),
-                    'employee_name': str(emp_name),
-                    'project_id': str(project_id),
-                    'project_title': str(project_title),
-                    'skill_match': round(skill_score * 100, 2),
-                    'proficiency_match': round(proficiency_score * 100, 2),
-                    'availability_match': round(availability_score * 100, 2),
-                    'capacity_match': round(capacity_score * 100, 2),
-                    'overall_score': round(overall_score * 100, 2),
-                    'skills': emp_skills,
-                    'role': str(employee.get('Role', '')),
-                    'proficiency': str(emp_proficiency),
-                    'capacity': emp_capacity,
-                    'location': str(employee.get('Location', '')),
-                    'domain_bonus': round(domain_bonus * 100, 2),
-                    'conflict_penalty': round(conflict_penalty * 100, 2)
-                }
-                
-                project_matches.append(match_data)
-                
+                project_matches.append(score_pair_reference(employee, project))
             except Exception as e:
                 print(f"Error processing employee {employee.get('Emp ID', 'Unknown')}: {e}")
                 continue
@@ -469,7 +853,7 @@ def perform_matching():
         project_matches.sort(key=lambda x: x['overall_score'], reverse=True)
         
         # Create intelligent team recommendations
-        intelligent_recommendations = create_intelligent_team(project_matches, project_domain, used_employees_global)
+        intelligent_recommendations = create_intelligent_team(project_matches, project_domain, used_employees)
         
         results.append({
             'project_id': project_id,
@@ -482,7 +866,6 @@ def perform_matching():
             'intelligent_team': intelligent_recommendations[:5]  # Full intelligent team
         })
     
-    matching_results = results
     return results
 
 def calculate_domain_bonus(emp_skills, project_domain):
@@ -490,19 +873,11 @@ def calculate_domain_bonus(emp_skills, project_domain):
     if not emp_skills or not project_domain or pd.isna(project_domain):
         return 0
     
-    domain_skill_mapping = {
-        'ai/ml': ['AI', 'Machine Learning', 'Python Developer', 'Data Science', 'ML'],
-        'web development': ['Backend Developer', 'Full Stack Developer', 'FSD', 'Web Development', 'Frontend'],
-        'mobile development': ['Mobile Development', 'UI/UX', 'React Native', 'Mobile App', 'iOS', 'Android'],
-        'data science': ['Data Science', 'Python Developer', 'Machine Learning', 'Analytics', 'Big Data'],
-        'cloud computing': ['DevOps', 'Cloud Computing', 'Infrastructure', 'AWS', 'Azure'],
-        'e-commerce': ['Backend Developer', 'Web Development', 'E-commerce', 'Full Stack Developer']
-    }
-    
+    taxonomy = taxonomy_loader.current
     project_domain_str = str(project_domain).lower()
     
-    if project_domain_str in domain_skill_mapping:
-        domain_skills = set(skill.lower() for skill in domain_skill_mapping[project_domain_str])
+    if project_domain_str in taxonomy.scoring_index:
+        domain_skills = taxonomy.scoring_sets[taxonomy.scoring_index[project_domain_str]]
         emp_skills_lower = set(str(skill).lower().strip() for skill in emp_skills if skill)
         domain_intersection = len(emp_skills_lower.intersection(domain_skills))
         return min(0.2, domain_intersection * 0.05)  # Max 20% bonus
@@ -529,48 +904,17 @@ def create_intelligent_team(project_matches, project_domain, global_used_employe
     recommendations = []
     used_employees = set(global_used_employees)  # Start with globally used employees
     
-    # Enhanced domain-specific skill mapping with more precise matching
-    domain_skill_mapping = {
-        'ai': ['AI', 'Machine Learning', 'ML', 'Data Science', 'Python Developer'],
-        'ai/ml': ['AI', 'Machine Learning', 'ML', 'Data Science', 'Python Developer'],
-        'web development': ['Backend Developer', 'Full Stack Developer', 'FSD', 'Web Development', 'Frontend'],
-        'mobile development': ['Mobile Development', 'UI/UX', 'React Native', 'Mobile App', 'iOS', 'Android'],
-        'data science': ['Data Science', 'Python Developer', 'Machine Learning', 'Analytics', 'Big Data'],
-        'cloud computing': ['DevOps', 'Cloud Computing', 'Infrastructure', 'AWS', 'Azure'],
-        'e-commerce': ['Backend Developer', 'Web Development', 'E-commerce', 'Full Stack Developer']
-    }
+    # Resolve the project's domain in the compiled taxonomy (exact, partial, then default)
+    taxonomy = taxonomy_loader.current
+    domain_bit = 1 << taxonomy.team_domain(project_domain)
     
-    # Get domain-specific skills with better matching
-    domain_skills = set()
-    project_domain_lower = project_domain.lower().strip()
-    
-    # Try exact match first, then partial match
-    if project_domain_lower in domain_skill_mapping:
-        domain_skills.update(domain_skill_mapping[project_domain_lower])
-    else:
-        # Try partial matching
-        for domain, skills in domain_skill_mapping.items():
-            if domain in project_domain_lower or project_domain_lower in domain:
-                domain_skills.update(skills)
-                break
-    
-    # If still no match, use a default set
-    if not domain_skills:
-        domain_skills = {'AI', 'Machine Learning', 'Data Science', 'Python Developer'}
-    
-    # Separate domain-specific and other matches with better logic
+    # Separate domain-specific and other matches with a bit test on the employee's domain mask
     domain_matches = []
     other_matches = []
     
     for match in project_matches:
-        # Check if employee has any domain-specific skills
-        has_domain_skill = False
-        for skill in match['skills']:
-            if any(domain_skill.lower() in skill.lower() for domain_skill in domain_skills):
-                has_domain_skill = True
-                break
-        
-        if has_domain_skill:
+        domain_mask, _ = taxonomy.skill_masks(match['skills'])
+        if domain_mask & domain_bit:
             domain_matches.append(match)
         else:
             other_matches.append(match)
@@ -603,7 +947,7 @@ def create_intelligent_team(project_matches, project_domain, global_used_employe
         used_employees.add(beginner_domain_match['employee_id'])
     
     # If we don't have 3 domain experts, fill with best available domain matches
-    while len([r for r in recommendations if any(domain_skill.lower() in skill.lower() for skill in r['skills'] for domain_skill in domain_skills)]) < 3 and len(recommendations) < 5:
+    while len([r for r in recommendations if taxonomy.skill_masks(r['skills'])[0] & domain_bit]) < 3 and len(recommendations) < 5:
         remaining_domain = [match for match in domain_matches if match['employee_id'] not in used_employees]
         if remaining_domain:
             best_domain = remaining_domain[0]
@@ -614,17 +958,7 @@ def create_intelligent_team(project_matches, project_domain, global_used_employe
             break
     
     # 4. Add 2 employees from other domains for complementary skills
-    complementary_roles = {
-        'ai': ['Backend Developer', 'UI/UX', 'Project Manager', 'DevOps'],
-        'ai/ml': ['Backend Developer', 'UI/UX', 'Project Manager', 'DevOps'],
-        'web development': ['UI/UX', 'DevOps', 'Project Manager', 'Backend Developer'],
-        'mobile development': ['Backend Developer', 'UI/UX', 'DevOps', 'Project Manager'],
-        'data science': ['Backend Developer', 'UI/UX', 'DevOps', 'Project Manager'],
-        'cloud computing': ['Backend Developer', 'Project Manager', 'UI/UX', 'DevOps'],
-        'e-commerce': ['UI/UX', 'DevOps', 'Project Manager', 'Backend Developer']
-    }
-    
-    complementary_skills = complementary_roles.get(project_domain_lower, ['Backend Developer', 'UI/UX', 'Project Manager', 'DevOps'])
+    complementary_skills = taxonomy.complementary_roles_for(project_domain)
     
     # Sort other matches by score
     other_matches.sort(key=lambda x: x['overall_score'], reverse=True)
@@ -635,8 +969,9 @@ def create_intelligent_team(project_matches, project_domain, global_used_employe
         if complementary_count >= 2 or len(recommendations) >= 5:
             break
             
+        role_bit = taxonomy.role_bit(skill)
         complementary_match = next((match for match in other_matches 
-                                   if any(s.lower() in skill.lower() or skill.lower() in s.lower() for s in match['skills']) and 
+                                   if taxonomy.skill_masks(match['skills'])[1] & role_bit and 
                                    match['employee_id'] not in used_employees and
                                    match['overall_score'] >= 40), None)
         
@@ -673,6 +1008,177 @@ def create_intelligent_team(project_matches, project_domain, global_used_employe
     
     return recommendations
 
+# Database record fields and the dataset columns they map to
+EMPLOYEE_FIELDS = {
+    'emp_id': 'Emp ID',
+    'name': 'Name',
+    'skills': 'Skills',
+    'role': 'Role',
+    'capacity_per_week': 'Capacity per week (hrs)',
+    'previous_project_description': 'Previous Project Description',
+    'proficiency': 'Proficiency',
+    'available_date': 'Available Date',
+    'location': 'Location',
+    'experience_years': 'Experience_years'
+}
+PROJECT_FIELDS = {
+    'project_id': 'ID',
+    'project_title': 'Project_Title',
+    'domain': 'Domain',
+    'eligibility': 'Eligibility',
+    'duration': 'Duration',
+    'proficiency': 'Proficiency',
+    'conflicts': 'Conflicts',
+    'hard_deadline': 'Hard_Deadline',
+    'experience_years': 'Experience_years',
+    'locations': 'Locations',
+    'team_size': 'Team_Size',
+    'demand_hours': 'Demand_Hours'
+}
+# Optional dataset columns; a snapshot leaves them out when no row has a value, like a file without them
+OPTIONAL_COLUMNS = ('Experience_years', 'Locations', 'Team_Size', 'Demand_Hours')
+
+def find_row(df, column, value):
+    """Position of the first row whose column matches value as a string, or None"""
+    if df is None or df.empty or column not in df.columns:
+        return None
+    positions = np.flatnonzero(df[column].astype(str).values == str(value))
+    return int(positions[0]) if len(positions) else None
+
+def merge_record(df, position, fields, data):
+    """Dataset row for a record: the existing row (if any) updated with the request fields"""
+    row = {column: None for column in fields.values()}
+    if position is not None:
+        existing = df.iloc[position]
+        row.update({column: existing[column] for column in fields.values() if column in df.columns})
+    for key, column in fields.items():
+        if key in data:
+            row[column] = data[key]
+    return row
+
+def database_record(row, fields):
+    """Database record for a dataset row"""
+    record = {}
+    for key, column in fields.items():
+        value = row.get(column)
+        if isinstance(value, (pd.Timestamp, datetime)) or key in ('available_date', 'hard_deadline'):
+            value = convert_to_date_string(value)
+        elif value is not None and pd.isna(value):
+            value = None
+        elif isinstance(value, np.generic):
+            value = value.item()
+        record[key] = value
+    return record
+
+def replace_rows(df, position, new_rows):
+    """Return df with the row at position replaced by new_rows (appended when position is None)"""
+    if df is None or df.empty:
+        return new_rows.reset_index(drop=True)
+    if position is None:
+        return pd.concat([df, new_rows], ignore_index=True)
+    return pd.concat([df.iloc[:position], new_rows, df.iloc[position + 1:]], ignore_index=True)
+
+def matching_session_current():
+    """Whether the cached matching session still matches the loaded data and taxonomy"""
+    return (matching_session is not None and matching_session.engine is matching_engine
+            and matching_engine.taxonomy is taxonomy_loader.get())
+
+@with_matching_lock
+def refresh_matching(apply_change):
+    """Apply a row change to the cached matching session, or re-run matching from scratch"""
+    global matching_engine, matching_session, matching_results, data_version
+    
+    # The datasets already hold this change, so its own version bump needs no reload (other writes still do)
+    if data_version is not None and get_db_manager().get_data_version() == data_version + 1:
+        data_version += 1
+    
+    if matching_session_current():
+        rematched = apply_change(matching_session)
+        matching_results = matching_session.results()
+        used_employees_global.clear()
+        used_employees_global.update(matching_results.team_ids())
+        return rematched
+    
+    matching_engine = None
+    matching_session = None
+    if matching_results is None:
+        return []
+    results = perform_matching(matching_mode)
+    if "error" in results:
+        matching_results = None
+        return []
+    return [result['project_id'] for result in results]
+
+@with_matching_lock
+def upsert_employee(emp_id, data):
+    """Add or update one employee in the database, the dataset and the matching results"""
+    global employees_df
+    
+    position = find_row(employees_df, 'Emp ID', emp_id)
+    row = merge_record(employees_df, position, EMPLOYEE_FIELDS, data)
+    if position is None:
+        row['Emp ID'] = emp_id
+    
+    get_db_manager().insert_employee(database_record(row, EMPLOYEE_FIELDS))
+    new_rows = preprocess_employees(pd.DataFrame([row]))
+    employees_df = replace_rows(employees_df, position, new_rows)
+    return refresh_matching(lambda session: session.upsert_employee(new_rows))
+
+@with_matching_lock
+def delete_employee(emp_id):
+    """Remove one employee from the database, the dataset and the matching results"""
+    global employees_df
+    
+    position = find_row(employees_df, 'Emp ID', emp_id)
+    if position is None:
+        return None
+    
+    get_db_manager().delete_employee(str(emp_id))
+    employees_df = employees_df.drop(employees_df.index[position]).reset_index(drop=True)
+    return refresh_matching(lambda session: session.delete_employee(emp_id))
+
+@with_matching_lock
+def upsert_project(project_id, data):
+    """Add or update one project in the database, the dataset and the matching results"""
+    global projects_df
+    
+    position = find_row(projects_df, 'ID', project_id)
+    row = merge_record(projects_df, position, PROJECT_FIELDS, data)
+    if position is None:
+        row['ID'] = project_id
+    
+    get_db_manager().insert_project(database_record(row, PROJECT_FIELDS))
+    new_rows = preprocess_projects(pd.DataFrame([row]))
+    projects_df = replace_rows(projects_df, position, new_rows)
+    return refresh_matching(lambda session: session.upsert_project(new_rows))
+
+@with_matching_lock
+def delete_project(project_id):
+    """Remove one project from the database, the dataset and the matching results"""
+    global projects_df
+    
+    position = find_row(projects_df, 'ID', project_id)
+    if position is None:
+        return None
+    
+    get_db_manager().delete_project(str(project_id))
+    project_key = projects_df['ID'].iloc[position]
+    projects_df = projects_df.drop(projects_df.index[position]).reset_index(drop=True)
+    return refresh_matching(lambda session: session.delete_project(project_key))
+
+@app.before_request
+def refresh_snapshot():
+    """Reload the datasets when the database changed since they were read"""
+    if data_version is None:
+        return
+    try:
+        if get_db_manager().get_data_version() != data_version:
+            with matching_lock:
+                if data_version is not None and get_db_manager().get_data_version() != data_version:
+                    load_data()
+    except Exception as e:
+        print(f"Error checking the data version: {e}")
+
 @app.route('/')
 def index():
     """Main page with title and get started button"""
@@ -826,24 +1332,67 @@ def upload_files():
         if not is_logged_in():
             return jsonify({"status": "error", "message": "Please log in to upload files"})
         
-        if 'employees' in request.files:
-            employees_file = request.files['employees']
-            if employees_file.filename != '':
-                employees_file.save(os.path.join(app.config['UPLOAD_FOLDER'], 'Employees.csv'))
+        # Uploads stream to disk under their own names, so one ingestion never reads another's file; the
+        # suffix picks the reader (CSV, .csv.gz, .csv.zst, .parquet, .feather; anything else is read as CSV)
+        staged = {}
+        for field in ('employees', 'projects'):
+            upload = request.files.get(field)
+            if upload is not None and upload.filename != '':
+                filename = os.path.basename(DATASET_STEMS[field]) + (dataset_format(upload.filename) or '.csv')
+                path = os.path.join(app.config['UPLOAD_FOLDER'], f".upload_{uuid.uuid4().hex}_{filename}")
+                upload.save(path)
+                staged[field] = path
         
-        if 'projects' in request.files:
-            projects_file = request.files['projects']
-            if projects_file.filename != '':
-                projects_file.save(os.path.join(app.config['UPLOAD_FOLDER'], 'Projects.csv'))
+        if not staged:
+            load_data()
+            return jsonify({"status": "success", "message": "Files uploaded successfully"})
         
-        # Reload data after upload
-        load_data()
+        if request.form.get('async') or request.args.get('async'):
+            # Large files are ingested in the background; the client polls /api/upload/jobs/<job_id>
+            job = ingest_jobs.submit(staged)
+            return jsonify({"status": "success", "message": "Files uploaded, ingesting", "data": job.describe()})
         
-        return jsonify({"status": "success", "message": "Files uploaded successfully"})
+        summary = ingest_uploads(staged)
+        if not summary:
+            return jsonify({"status": "error", "message": "Files uploaded, but syncing them into the database failed"})
+        return jsonify({"status": "success", "message": "Files uploaded and synced", "sync": summary})
     
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)})
 
+def ingest_uploads(files, progress=None):
+    """Stream staged upload files into the database, keep them as the dataset files and reload the snapshot"""
+    try:
+        summary = sync_csv_to_database(get_db_manager(), files, app.config['UPLOAD_CHUNK_ROWS'], progress)
+        if summary:
+            # The upload replaces the table's dataset file in whatever format it was kept before
+            for table, path in files.items():
+                stem = os.path.join(app.config['UPLOAD_FOLDER'], os.path.basename(DATASET_STEMS[table]))
+                for suffix in FORMATS:
+                    if os.path.exists(stem + suffix):
+                        os.remove(stem + suffix)
+                os.replace(path, stem + dataset_format(path))
+            # A full snapshot reload: the app holds the whole dataset in memory, however it was streamed in
+            load_data()
+        return summary
+    finally:
+        for path in files.values():
+            if os.path.exists(path):
+                os.remove(path)
+
+@app.route('/api/upload/jobs')
+def ingest_job_list():
+    """List the retained upload ingestions"""
+    return jsonify({"status": "success", "data": [job.describe() for job in ingest_jobs.list()]})
+
+@app.route('/api/upload/jobs/<job_id>')
+def ingest_job_status(job_id):
+    """Get the state, progress and (when finished) sync summary of an upload ingestion"""
+    job = ingest_jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": f"Job {job_id} not found"})
+    return jsonify({"status": "success", "data": job.describe()})
+
 @app.route('/api/match', methods=['POST'])
 def match_resources():
     """Perform resource matching"""
@@ -854,7 +1403,13 @@ def match_resources():
         if projects_df is None or projects_df.empty:
             return jsonify({"status": "error", "message": "No project data available. Please upload project data first."})
         
-        results = perform_matching()
+        data = request.get_json(silent=True) or {}
+        if data.get('async'):
+            # Long runs go to the job pool; the client polls /api/jobs/<job_id>
+            job = matching_jobs.submit(data.get('mode'))
+            return jsonify({"status": "success", "data": job.describe()})
+        
+        results = perform_matching(data.get('mode'))
         
         if "error" in results:
             return jsonify({"status": "error", "message": results["error"]})
@@ -865,6 +1420,79 @@ def match_resources():
         print(f"Error in match_resources: {e}")
         return jsonify({"status": "error", "message": f"Error performing matching: {str(e)}"})
 
+def stream_events(events):
+    """Stream (event, payload) pairs as NDJSON lines, or as Server-Sent Events when the client asks for them"""
+    sse = request.args.get('format') == 'sse' or request.accept_mimetypes.best == 'text/event-stream'
+    
+    def generate():
+        # Each payload is serialized on its own, so the full result set is never held as one string
+        try:
+            for event, payload in events:
+                if sse:
+                    yield f"event: {event}\ndata: {app.json.dumps(payload)}\n\n"
+                else:
+                    yield app.json.dumps({"event": event, "data": payload}) + "\n"
+        except Exception as e:
+            print(f"Error while streaming results: {e}")
+            message = {"message": f"Error streaming results: {str(e)}"}
+            yield (f"event: error\ndata: {app.json.dumps(message)}\n\n" if sse
+                   else app.json.dumps({"event": "error", "data": message}) + "\n")
+    
+    return Response(generate(), mimetype='text/event-stream' if sse else 'application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def result_events(results, mode, stats=None):
+    """A 'project' event per result, then a 'done' event with the count and the run's stats (the current ones by default)"""
+    count = 0
+    for result in results:
+        count += 1
+        yield 'project', result
+    yield 'done', {'projects': count, 'mode': mode, 'stats': matching_stats if stats is None else stats}
+
+@app.route('/api/match/stream', methods=['GET', 'POST'])
+def match_resources_stream():
+    """Perform resource matching, streaming each project's result as soon as its team is built"""
+    data = request.get_json(silent=True) or {}
+    mode = data.get('mode') or request.args.get('mode') or app.config['ASSIGNMENT_MODE']
+    error = matching_error(mode)
+    if error:
+        return jsonify({"status": "error", "message": error})
+    
+    # Results are produced under the matching lock on a worker thread; the response only reads them
+    stats = {}
+    return stream_events(result_events(stream_matching(mode, stats), mode, stats))
+
+@app.route('/api/results/stream')
+def get_results_stream():
+    """Stream the current matching results one project at a time"""
+    if matching_results is None:
+        return jsonify({"status": "error", "message": "No matching results available"})
+    
+    return stream_events(result_events(matching_results, matching_mode))
+
+@app.route('/api/jobs', methods=['GET', 'POST'])
+def matching_job_list():
+    """Start a background matching job, or list the retained jobs"""
+    if request.method == 'GET':
+        return jsonify({"status": "success", "data": [job.describe(include_results=False) for job in matching_jobs.list()]})
+    
+    if employees_df is None or employees_df.empty or projects_df is None or projects_df.empty:
+        return jsonify({"status": "error", "message": "No data available for matching. Please upload data first."})
+    
+    data = request.get_json(silent=True) or {}
+    job = matching_jobs.submit(data.get('mode'))
+    return jsonify({"status": "success", "data": job.describe()})
+
+@app.route('/api/jobs/<job_id>')
+def matching_job_status(job_id):
+    """Get the state, progress and (when finished) results of a matching job"""
+    job = matching_jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": f"Job {job_id} not found"})
+    
+    include_results = request.args.get('results', '1') != '0'
+    return jsonify({"status": "success", "data": job.describe(include_results)})
+
 @app.route('/api/data')
 def get_data():
     """Get current data status"""
@@ -875,13 +1503,189 @@ def get_data():
         "projects_count": len(projects_df) if projects_df is not None else 0
     })
 
+def get_result_index():
+    """Index of the current matching results, built once per result set"""
+    global result_index
+    
+    results = matching_results
+    if result_index is None or result_index.results is not results:
+        result_index = ResultIndex(results)
+    return result_index
+
 @app.route('/api/results')
 def get_results():
-    """Get matching results"""
+    """Get matching results, or one filtered and sorted page of them when paging parameters are given"""
     if matching_results is None:
         return jsonify({"status": "error", "message": "No matching results available"})
     
-    return jsonify({"status": "success", "data": matching_results})
+    paging = ('page', 'limit', 'cursor', 'sort', 'order', 'domain', 'min_score', 'employee_id')
+    if not any(param in request.args for param in paging):
+        return jsonify({"status": "success", "data": list(matching_results)})
+    
+    try:
+        index = get_result_index()
+        page = index.page(
+            sort=request.args.get('sort', 'project'),
+            descending=request.args.get('order', 'asc') == 'desc',
+            limit=request.args.get('limit', DEFAULT_LIMIT, type=int),
+            page=request.args.get('page', type=int),
+            cursor=request.args.get('cursor'),
+            domain=request.args.get('domain'),
+            employee_id=request.args.get('employee_id'),
+            min_score=request.args.get('min_score', type=float)
+        )
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)})
+    
+    results = page.pop('results')
+    return jsonify({"status": "success", "data": results, "pagination": page, "summary": index.summary()})
+
+@app.route('/api/match/stats')
+def get_match_stats():
+    """Get how much scoring work the candidate index saved in the last matching run"""
+    if matching_stats is None:
+        return jsonify({"status": "error", "message": "No matching results available"})
+    
+    return jsonify({"status": "success", "data": matching_stats})
+
+@app.route('/api/match/cache')
+def get_match_cache():
+    """Get hit/miss counters of the matching result cache"""
+    return jsonify({"status": "success", "data": result_cache.stats()})
+
+@app.route('/api/match/history')
+def get_match_history():
+    """Get persisted matching scores, of one run when run_id is given, or the recent runs with runs=1"""
+    try:
+        db_manager = get_db_manager()
+        if request.args.get('runs'):
+            runs = db_manager.get_matching_runs(request.args.get('limit', 20, type=int))
+            return jsonify({"status": "success", "data": runs.to_dict('records'), "writer": history_writer.stats()})
+        
+        history = db_manager.get_matching_history(request.args.get('limit', 100, type=int),
+                                                  run_id=request.args.get('run_id'))
+        history = history.loc[:, ~history.columns.duplicated(keep='last')]
+        return jsonify({"status": "success", "data": history.to_dict('records'), "writer": history_writer.stats()})
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
+
+@app.route('/api/match/recall')
+def get_match_recall():
+    """Measure how many exact top matches the ANN candidate index finds with the given knobs"""
+    try:
+        if employees_df is None or projects_df is None or employees_df.empty or projects_df.empty:
+            return jsonify({"status": "error", "message": "No data available for matching"})
+        
+        ann = ann_settings(request.args.get('candidates', type=int) or app.config['ANN_CANDIDATES'] or 500,
+                           request.args.get('probes', type=int), request.args.get('clusters', type=int))
+        k = request.args.get('k', 10, type=int)
+        engine = get_matching_engine()
+        
+        started = datetime.now()
+        exact = IncrementalMatcher(engine, None)
+        exact.score(prune=True)
+        exact_seconds = (datetime.now() - started).total_seconds()
+        
+        engine.ann_index(ann['clusters'])  # trained outside the timed search
+        started = datetime.now()
+        approximate = IncrementalMatcher(engine, None)
+        approximate.score(ann=ann)
+        approximate_seconds = (datetime.now() - started).total_seconds()
+        
+        rows = np.flatnonzero(engine.proj_active)
+        return jsonify({"status": "success", "data": dict(ann, **{
+            'k': k,
+            'recall': recall_at_k(exact.overall, approximate.dense_overall(), k, rows),
+            'exact_seconds': exact_seconds,
+            'approximate_seconds': approximate_seconds,
+            'scored': approximate.stats['scored'],
+            'pairs': approximate.stats['pairs']
+        })})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": f"Recall measurement failed: {str(e)}"})
+
+@app.route('/api/employees', methods=['POST'])
+def add_employee():
+    """Add an employee (or replace one with the same ID) and update matching results"""
+    try:
+        if not is_logged_in():
+            return jsonify({"status": "error", "message": "Please log in to edit employees"})
+        
+        data = request.get_json() or {}
+        if not data.get('emp_id'):
+            return jsonify({"status": "error", "message": "emp_id is required"})
+        
+        rematched = upsert_employee(str(data['emp_id']), data)
+        return jsonify({"status": "success", "message": "Employee saved", "data": {"rematched_projects": rematched}})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
+
+@app.route('/api/employees/<emp_id>', methods=['PUT', 'DELETE'])
+def edit_employee(emp_id):
+    """Update or delete an employee and update matching results"""
+    try:
+        if not is_logged_in():
+            return jsonify({"status": "error", "message": "Please log in to edit employees"})
+        
+        if request.method == 'DELETE':
+            rematched = delete_employee(emp_id)
+            if rematched is None:
+                return jsonify({"status": "error", "message": f"Employee {emp_id} not found"})
+            return jsonify({"status": "success", "message": "Employee deleted", "data": {"rematched_projects": rematched}})
+        
+        if find_row(employees_df, 'Emp ID', emp_id) is None:
+            return jsonify({"status": "error", "message": f"Employee {emp_id} not found"})
+        
+        data = request.get_json() or {}
+        data.pop('emp_id', None)
+        rematched = upsert_employee(emp_id, data)
+        return jsonify({"status": "success", "message": "Employee updated", "data": {"rematched_projects": rematched}})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
+
+@app.route('/api/projects', methods=['POST'])
+def add_project():
+    """Add a project (or replace one with the same ID) and update matching results"""
+    try:
+        if not is_logged_in():
+            return jsonify({"status": "error", "message": "Please log in to edit projects"})
+        
+        data = request.get_json() or {}
+        if not data.get('project_id'):
+            return jsonify({"status": "error", "message": "project_id is required"})
+        
+        rematched = upsert_project(str(data['project_id']), data)
+        return jsonify({"status": "success", "message": "Project saved", "data": {"rematched_projects": rematched}})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
+
+@app.route('/api/projects/<project_id>', methods=['PUT', 'DELETE'])
+def edit_project(project_id):
+    """Update or delete a project and update matching results"""
+    try:
+        if not is_logged_in():
+            return jsonify({"status": "error", "message": "Please log in to edit projects"})
+        
+        if request.method == 'DELETE':
+            rematched = delete_project(project_id)
+            if rematched is None:
+                return jsonify({"status": "error", "message": f"Project {project_id} not found"})
+            return jsonify({"status": "success", "message": "Project deleted", "data": {"rematched_projects": rematched}})
+        
+        if find_row(projects_df, 'ID', project_id) is None:
+            return jsonify({"status": "error", "message": f"Project {project_id} not found"})
+        
+        data = request.get_json() or {}
+        data.pop('project_id', None)
+        rematched = upsert_project(project_id, data)
+        return jsonify({"status": "success", "message": "Project updated", "data": {"rematched_projects": rematched}})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
 
 @app.route('/api/download-pdf')
 def download_pdf():
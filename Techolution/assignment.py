@@ -0,0 +1,208 @@
+"""
+Global assignment for AI-Driven Talent Management System
+Staffs every project at once with a sparse min-cost matching instead of greedy project order
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+from matching_engine import MatchingEngine, PROFICIENCY_SLOTS, ROUNDING_MARGIN, DEFAULT_TOP_K
+
+logger = logging.getLogger(__name__)
+
+# Candidate edges kept per project and slot type
+DEFAULT_CANDIDATES_PER_SLOT = 50
+
+# Rounds that add candidate edges where the current solution could improve
+DEFAULT_PRICING_ROUNDS = 8
+
+# Relative cost improvement below which the rounds stop
+MIN_IMPROVEMENT = 0.001
+
+# Open (any proficiency) slots take the same bar as the greedy builder's final fill
+OPEN_SLOT_MIN_SCORE = 50
+
+# Cost of leaving a slot empty; any real candidate (cost 1-101) is preferred
+UNFILLED_COST = 1000.0
+
+
+def team_slots(team_size: int) -> List[Optional[str]]:
+    """Proficiency slots of a team: Senior, Intermediate, Beginner, then open slots"""
+    team_size = max(0, int(team_size))
+    return PROFICIENCY_SLOTS[:team_size] + [None] * max(0, team_size - len(PROFICIENCY_SLOTS))
+
+
+class GlobalAssigner:
+    """One-employee-one-project assignment over the full score matrix"""
+
+    def __init__(self, engine: MatchingEngine, candidates_per_slot: int = DEFAULT_CANDIDATES_PER_SLOT,
+                 max_rounds: int = DEFAULT_PRICING_ROUNDS):
+        self.engine = engine
+        self.candidates_per_slot = candidates_per_slot
+        self.max_rounds = max_rounds
+
+    def _slot_columns(self, slot: Optional[str], available: np.ndarray) -> np.ndarray:
+        """Employees whose proficiency fits a slot type"""
+        if slot is None:
+            return np.flatnonzero(available)
+        return np.flatnonzero(available & (self.engine.emp_slot == PROFICIENCY_SLOTS.index(slot)))
+
+    def _candidate_edges(self, approx: np.ndarray, rows: np.ndarray, projects: np.ndarray,
+                         slot: Optional[str], available: np.ndarray, depth: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(row, employee, cost) edges to the best available employees for slot rows of one type"""
+        columns = self._slot_columns(slot, available)
+        if len(columns) == 0 or len(rows) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+
+        # Best candidates per project, shared by every slot of this type in the project
+        unique_projects, row_project = np.unique(projects, return_inverse=True)
+        values = approx[np.ix_(unique_projects, columns)]
+        if slot is None:
+            # Open slots only take scores the greedy fill would accept
+            values = np.where(values >= OPEN_SLOT_MIN_SCORE, values, -np.inf)
+        k = min(depth, len(columns))
+        top = np.argpartition(-values, k - 1, axis=1)[:, :k]
+        top_values = np.take_along_axis(values, top, axis=1)
+
+        row_top = top[row_project]
+        costs = 101.0 - top_values[row_project]
+        keep = np.isfinite(costs)
+        row_ids = np.broadcast_to(rows[:, None], row_top.shape)
+        return row_ids[keep], columns[row_top[keep]], costs[keep]
+
+    def _match(self, rows: np.ndarray, cols: np.ndarray, costs: np.ndarray, num_slots: int) -> Tuple[np.ndarray, float]:
+        """Assigned employee per slot row (-1 when the slot stays empty) and the total cost"""
+        num_employees = self.engine.num_employees
+
+        # A private placeholder column per slot keeps a full matching feasible
+        placeholder = np.arange(num_slots)
+        graph = sparse.csr_matrix(
+            (np.concatenate([costs, np.full(num_slots, UNFILLED_COST)]),
+             (np.concatenate([rows, placeholder]), np.concatenate([cols, num_employees + placeholder]))),
+            shape=(num_slots, num_employees + num_slots)
+        )
+
+        row_ind, col_ind = min_weight_full_bipartite_matching(graph)
+        assigned = np.full(num_slots, -1, dtype=np.int64)
+        real = col_ind < num_employees
+        assigned[row_ind[real]] = col_ind[real]
+        return assigned, float(graph[row_ind, col_ind].sum())
+
+    def solve(self, overall: np.ndarray) -> List[List[Tuple[int, Optional[str]]]]:
+        """(employee index, slot) pairs for every project, each employee used at most once"""
+        engine = self.engine
+        slot_projects, slot_types = [], []  # project index and slot per matrix row
+        for p in range(engine.num_projects):
+            if engine.proj_active[p]:
+                for slot in team_slots(engine.proj_team_size[p]):
+                    slot_projects.append(p)
+                    slot_types.append(slot)
+        num_slots = len(slot_projects)
+        if num_slots == 0:
+            return [[] for _ in range(engine.num_projects)]
+
+        slot_projects = np.array(slot_projects, dtype=np.int64)
+        kinds = [None] + PROFICIENCY_SLOTS
+        slot_kind = np.array([kinds.index(slot) for slot in slot_types], dtype=np.int64)
+
+        # Costs stay strictly positive; zero entries would drop the edge
+        approx = np.round(overall * 100, 2)
+        edges = []
+        for kind, slot in enumerate(kinds):
+            rows = np.flatnonzero(slot_kind == kind)
+            edges.append(self._candidate_edges(approx, rows, slot_projects[rows], slot, engine.emp_active,
+                                               self.candidates_per_slot))
+        rows, cols, costs = (np.concatenate(part) for part in zip(*edges))
+        assigned, total = self._match(rows, cols, costs, num_slots)
+
+        # Popular employees exhaust the short candidate lists: empty slots get deeper lists and
+        # filled slots get the best unassigned employees, which lets the solver shift people around
+        depth = self.candidates_per_slot
+        for _ in range(self.max_rounds):
+            depth *= 2
+            available = engine.emp_active.copy()
+            available[assigned[assigned >= 0]] = False
+            filled = assigned >= 0
+
+            new_edges = []
+            for kind, slot in enumerate(kinds):
+                empty_rows = np.flatnonzero((slot_kind == kind) & ~filled)
+                new_edges.append(self._candidate_edges(approx, empty_rows, slot_projects[empty_rows], slot,
+                                                       engine.emp_active, depth))
+                kind_filled = slot_kind[filled] == kind
+                filled_rows = np.flatnonzero(filled)[kind_filled]
+                new_edges.append(self._candidate_edges(approx, filled_rows, slot_projects[filled_rows], slot,
+                                                       available, self.candidates_per_slot))
+            new_rows, new_cols, new_costs = (np.concatenate(part) for part in zip(*new_edges))
+
+            # Only edges the graph doesn't have yet
+            width = engine.num_employees
+            fresh = ~np.isin(new_rows * width + new_cols, rows * width + cols)
+            if not fresh.any():
+                break
+            rows = np.concatenate([rows, new_rows[fresh]])
+            cols = np.concatenate([cols, new_cols[fresh]])
+            costs = np.concatenate([costs, new_costs[fresh]])
+            assigned, new_total = self._match(rows, cols, costs, num_slots)
+            if total - new_total < total * MIN_IMPROVEMENT:
+                break
+            total = new_total
+
+        teams = [[] for _ in range(engine.num_projects)]
+        for row, e in enumerate(assigned.tolist()):
+            if e >= 0:
+                teams[slot_projects[row]].append((e, slot_types[row]))
+
+        logger.info(f"Global assignment filled {int((assigned >= 0).sum())} of {num_slots} slots "
+                    f"from {len(rows)} candidate edges")
+        return teams
+
+    def results(self, overall: np.ndarray, teams: List[List[Tuple[int, Optional[str]]]],
+                top_k: int = DEFAULT_TOP_K, progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """Result dicts in the same shape as the greedy matching run"""
+        return list(self.iter_results(overall, teams, top_k, progress))
+
+    def iter_results(self, overall: np.ndarray, teams: List[List[Tuple[int, Optional[str]]]],
+                     top_k: int = DEFAULT_TOP_K, progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Dict]:
+        """Yield the result dicts one project at a time"""
+        def describe(match: Dict, slot: Optional[str]):
+            role = f"{slot} slot" if slot else "open slot"
+            match['selection_reason'] = f"Global assignment for the {role} with {', '.join(match['skills'][:3])} skills"
+
+        return iter_project_results(self.engine, overall, teams, describe, top_k, progress)
+
+
+def iter_project_results(engine: MatchingEngine, overall: np.ndarray, teams: List[List[Tuple[int, object]]],
+                         describe: Callable[[Dict, object], None], top_k: int = DEFAULT_TOP_K,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Dict]:
+    """Result dicts for solver teams given as (employee index, detail) pairs per project, yielded as each is built"""
+    done = 0
+    total = int(engine.proj_active.sum())
+    for p in range(engine.num_projects):
+        if not engine.proj_active[p]:
+            continue
+
+        approx = np.round(overall[p] * 100, 2)
+        top = engine._top(overall[p], approx, engine.pool_mask('top', None, p, engine.emp_active), top_k)
+        members = [e for e, _ in teams[p]]
+        columns = np.unique(np.concatenate([top, np.array(members, dtype=np.int64)]))
+        scores = engine.score_block(p, p + 1, columns=columns)
+
+        info = engine.proj_info[p]
+        project_id, project_title = str(info['project_id']), str(info['project_title'])
+        matches = engine.build_matches(scores, 0, top, project_id, project_title)
+        team = engine.build_matches(scores, 0, members, project_id, project_title)
+        for match, (_, detail) in zip(team, teams[p]):
+            describe(match, detail)
+
+        done += 1
+        if progress is not None:
+            progress(done, total)
+        yield dict(info, **{
+            'matches': matches,
+            'top_3': team[:3],
+            'intelligent_team': team
+        })
@@ -0,0 +1,141 @@
+"""
+Candidate index for AI-Driven Talent Management System
+Inverted skill and domain index that limits full scoring to employees who can earn skill points
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+from matching_engine import NS_PER_DAY, NAT_NS, INELIGIBLE_SCORE
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateIndex:
+    """Employees per skill and per taxonomy domain for one state of a matching engine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+        # Rows of the transposed incidence matrix already list the employees holding each skill
+        self.skill_employees = engine.emp_skill_matrix_t
+
+        # Employees earning a skill bonus or domain bonus from each scoring domain
+        self.domain_employees = [
+            np.flatnonzero(((engine.emp_scoring_mask & np.uint64(1 << col)) != 0) |
+                           (engine.emp_domain_counts[:, col] > 0))
+            for col in range(len(engine.domain_names))
+        ]
+        logger.info(f"Candidate index ready: {self.skill_employees.shape[0]} skills, "
+                    f"{len(self.domain_employees)} domains")
+
+    def candidates(self, project_index: int) -> np.ndarray:
+        """Employees that can have a non-zero skill match or domain bonus on a project"""
+        engine = self.engine
+        mask = np.zeros(engine.num_employees, dtype=bool)
+        indptr = engine.proj_skill_matrix.indptr
+        skills = engine.proj_skill_matrix.indices[indptr[project_index]:indptr[project_index + 1]]
+        skill_indptr, skill_indices = self.skill_employees.indptr, self.skill_employees.indices
+        for skill in skills.tolist():
+            mask[skill_indices[skill_indptr[skill]:skill_indptr[skill + 1]]] = True
+
+        for col in np.flatnonzero(engine.proj_domain_hits[project_index]).tolist():
+            mask[self.domain_employees[col]] = True
+        domain_key = int(engine.proj_domain_key[project_index])
+        if domain_key >= 0:
+            mask[self.domain_employees[domain_key]] = True
+        return np.flatnonzero(mask)
+
+    def text_candidates(self, project_index: int) -> np.ndarray:
+        """Employees sharing a TF-IDF term with a project, the only ones with semantic relevance"""
+        engine = self.engine
+        indptr = engine.proj_text_matrix.indptr
+        terms = engine.proj_text_matrix.indices[indptr[project_index]:indptr[project_index + 1]]
+        term_indptr, term_indices = engine.emp_text_matrix_t.indptr, engine.emp_text_matrix_t.indices
+        return np.unique(np.concatenate(
+            [term_indices[term_indptr[term]:term_indptr[term + 1]] for term in terms.tolist()] +
+            [np.empty(0, dtype=term_indices.dtype)]
+        )).astype(np.int64)
+
+    def groups(self, search: Optional[Callable[[int], np.ndarray]] = None,
+               projects: Optional[np.ndarray] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """(project rows, eligible candidate employees) for every set of projects with the same requirements
+
+        search replaces the exact candidate lookup, e.g. with an approximate top-N search, whose result
+        also depends on the project's proficiency level and deadline; projects limits the grouping to
+        those rows (all projects by default).
+        """
+        engine = self.engine
+        stage = engine.constraint_stage()
+        rows_by_key: Dict[Tuple, List[int]] = {}
+        for p in (range(engine.num_projects) if projects is None else np.asarray(projects).tolist()):
+            key = (tuple(sorted(engine.proj_tokens[p])), engine.proj_domain_hits[p].tobytes(),
+                   int(engine.proj_domain_key[p]), stage.requirement(p))
+            if search is not None:
+                key += (int(engine.proj_levels[p]), int(engine.proj_deadline_ns[p]))
+            rows_by_key.setdefault(key, []).append(p)
+
+        groups = []
+        for rows in rows_by_key.values():
+            candidates = (search or self.candidates)(rows[0])
+            eligible = engine.eligible(rows[0])
+            if eligible is not None:
+                candidates = candidates[eligible[candidates]]
+            groups.append((np.array(rows, dtype=np.int64), candidates))
+        return groups
+
+    def score_group(self, rows: np.ndarray, columns: np.ndarray, out: np.ndarray) -> Tuple[int, int]:
+        """Write the overall rows of projects sharing their candidates into out; returns (pairs scored, pairs ruled out)
+
+        Candidates are fully scored; everyone else has no skill terms, and their best case is exactly their score.
+        """
+        engine = self.engine
+        eligible = engine.eligible(rows[0])
+        ineligible = np.flatnonzero(~eligible) if eligible is not None else np.empty(0, dtype=np.int64)
+        scored = 0
+        step = engine.block_size()
+        for start in range(0, len(rows), step):
+            block = rows[start:start + step]
+            out[block] = self.skill_free_scores(block)
+            out[np.ix_(block, ineligible)] = INELIGIBLE_SCORE
+            if len(columns):
+                out[np.ix_(block, columns)] = engine.score_rows(block, columns)['overall']
+                scored += len(block) * len(columns)
+
+            # Conflict penalties, and weighted semantic relevance, apply with or without shared skills
+            for p in block.tolist():
+                extra = np.array(engine.conflicting_employees(p), dtype=np.int64)
+                if engine.semantic_weight:
+                    extra = np.concatenate([extra, self.text_candidates(p)])
+                extra = np.setdiff1d(extra, columns)
+                if eligible is not None:
+                    extra = extra[eligible[extra]]
+                if len(extra):
+                    out[p, extra] = engine.score_block(p, p + 1, columns=extra)['overall'][0]
+                    scored += len(extra)
+        return scored, len(rows) * len(ineligible)
+
+    def skill_free_scores(self, rows: np.ndarray, columns: Optional[np.ndarray] = None) -> np.ndarray:
+        """Overall scores of the projects for employees without skill match, domain bonus, conflict or text relevance"""
+        engine = self.engine
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = slice(None) if columns is None else np.asarray(columns, dtype=np.int64)
+
+        # With the skill terms at zero a score only depends on the project's proficiency level
+        # and deadline, so each distinct value is computed once; the operations match the
+        # engine's, so the values are bit-for-bit what full scoring gives these employees
+        levels, level_rows = np.unique(engine.proj_levels[rows], return_inverse=True)
+        emp_levels = engine.emp_levels[cols][None, :]
+        proficiency = np.where(
+            emp_levels >= levels[:, None],
+            1.0 + (emp_levels - levels[:, None]) * 0.1,
+            np.maximum(0.1, emp_levels / levels[:, None])
+        )
+
+        deadlines, deadline_rows = np.unique(engine.proj_deadline_ns[rows], return_inverse=True)
+        with np.errstate(over='ignore'):
+            delta = engine.emp_available_ns[cols][None, :] - deadlines[:, None]
+        availability = np.where(delta <= 0, 1.0, np.maximum(0.1, 1.0 - ((delta // NS_PER_DAY) / 30)))
+        availability[(deadlines == NAT_NS)[:, None] | engine.emp_available_nat[cols][None, :]] = 0.5
+
+        return (proficiency * 0.3)[level_rows] + (availability * 0.2)[deadline_rows] + engine.capacity_scores[cols] * 0.1
@@ -0,0 +1,234 @@
+"""
+Compact results for AI-Driven Talent Management System
+Matching results packed into NumPy score columns over a shared employee table; dicts are built when read
+"""
+
+import numpy as np
+from collections.abc import Sequence
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+# Key order of the match dicts built by MatchingEngine.build_matches
+MATCH_KEYS = ('employee_id', 'employee_name', 'project_id', 'project_title', 'skill_match', 'proficiency_match',
+              'availability_match', 'capacity_match', 'semantic_match', 'overall_score', 'skills', 'role',
+              'proficiency', 'capacity', 'location', 'domain_bonus', 'conflict_penalty')
+# Without the semantic component (SEMANTIC_WEIGHT=0) matches have no semantic_match
+PLAIN_MATCH_KEYS = tuple(key for key in MATCH_KEYS if key != 'semantic_match')
+EMPLOYEE_KEYS = ('employee_id', 'employee_name', 'skills', 'role', 'proficiency', 'capacity', 'location')
+SCORE_KEYS = ('skill_match', 'proficiency_match', 'availability_match', 'capacity_match', 'semantic_match',
+              'overall_score', 'domain_bonus', 'conflict_penalty')
+
+# Result keys holding lists of match dicts
+MEMBER_GROUPS = ('matches', 'top_3', 'intelligent_team')
+
+
+class PackedProject:
+    """One project's result: its plain fields, and one row per distinct listed match in the score columns"""
+
+    __slots__ = ('keys', 'values', 'project', 'sizes', 'index', 'scores', 'extras', 'raw', 'semantic')
+
+    def __init__(self):
+        self.keys: Tuple[str, ...] = ()  # result keys in order, shared by projects with the same layout
+        self.values: Tuple = ()  # values of the keys that are not MEMBER_GROUPS
+        self.project: Tuple = ()
+        self.sizes: Tuple[int, ...] = ()
+        # Per group entry its distinct match, then per distinct match its employee table row and a
+        # bit mask of the SCORE_KEYS that were ints; teams reuse the dicts of matches
+        self.index: Optional[np.ndarray] = None
+        self.scores: Optional[np.ndarray] = None  # SCORE_KEYS in hundredths, or as floats when not exact
+        self.extras: Optional[Tuple] = None  # (keys, values) the team builder added, per distinct match
+        self.raw: Optional[Dict] = None  # results in a shape the columns can't hold are kept as they are
+        self.semantic = True  # whether the matches had semantic_match (stored as 0 when not)
+
+
+class EmployeeTable:
+    """Employee attribute columns shared by every packed match; packs and unpacks project results"""
+
+    def __init__(self):
+        self.columns: Tuple[List, ...] = tuple([] for _ in EMPLOYEE_KEYS)
+        self.rows_by_id: Dict[str, int] = {}  # latest row of every employee id
+        self.shared: Dict = {}  # one copy of repeated key tuples and texts
+
+    def _row(self, match: Dict) -> int:
+        """Table row of a match's employee attributes, added when they changed or were not seen before"""
+        row = self.rows_by_id.get(match['employee_id'])
+        if row is not None and all(column[row] is match[key] or column[row] == match[key]
+                                   for key, column in zip(EMPLOYEE_KEYS, self.columns)):
+            return row
+        for key, column in zip(EMPLOYEE_KEYS, self.columns):
+            column.append(match[key])
+        row = len(self.columns[0]) - 1
+        self.rows_by_id[match['employee_id']] = row
+        return row
+
+    def employee(self, row: int) -> Tuple:
+        """Attributes of a table row in EMPLOYEE_KEYS order"""
+        return tuple(column[row] for column in self.columns)
+
+    def _share(self, value):
+        """The stored copy of an equal text or key tuple (other values are kept as they are)"""
+        if type(value) is str or (type(value) is tuple and all(type(item) is str for item in value)):
+            return self.shared.setdefault(value, value)
+        return value
+
+    @staticmethod
+    def _packable(match, layout: Tuple[str, ...]) -> bool:
+        return (isinstance(match, dict) and tuple(islice(match, len(layout))) == layout
+                and all(isinstance(match.get(key, 0), (int, float)) for key in SCORE_KEYS))
+
+    def pack(self, result: Dict) -> PackedProject:
+        """Packed form of one project result dict"""
+        packed = PackedProject()
+        groups = [result.get(group) for group in MEMBER_GROUPS]
+        if not all(isinstance(group, list) for group in groups):
+            packed.raw = result
+            return packed
+
+        # The same dict often sits in matches, top_3 and the team; it is stored once
+        distinct, positions = [], {}
+        for group in groups:
+            for match in group:
+                if id(match) not in positions:
+                    positions[id(match)] = len(distinct)
+                    distinct.append(match)
+        project = (distinct[0].get('project_id'), distinct[0].get('project_title')) if distinct else (None, None)
+        packed.semantic = not (distinct and isinstance(distinct[0], dict) and 'semantic_match' not in distinct[0])
+        layout = MATCH_KEYS if packed.semantic else PLAIN_MATCH_KEYS
+        if not all(self._packable(match, layout) and (match['project_id'], match['project_title']) == project
+                   for match in distinct):
+            packed.raw = result
+            return packed
+
+        packed.keys = self._share(tuple(result))
+        packed.values = tuple(value for key, value in result.items() if key not in MEMBER_GROUPS)
+        packed.project = project
+        packed.sizes = tuple(len(group) for group in groups)
+        packed.index = np.array(
+            [positions[id(match)] for group in groups for match in group]
+            + [self._row(match) for match in distinct]
+            + [sum(1 << i for i, key in enumerate(SCORE_KEYS) if type(match.get(key, 0)) is int) for match in distinct],
+            dtype=np.int32
+        )
+
+        scores = np.array([[match.get(key, 0) for key in SCORE_KEYS] for match in distinct],
+                          dtype=np.float64).reshape(len(distinct), len(SCORE_KEYS))
+        hundredths = np.round(scores * 100)
+        exact = np.abs(hundredths).max(initial=0) < 2 ** 31 and np.array_equal(hundredths / 100, scores)
+        packed.scores = hundredths.astype(np.int32) if exact else scores
+
+        extras = [(self._share(tuple(islice(match, len(layout), None))),
+                   tuple(self._share(value) for value in islice(match.values(), len(layout), None)))
+                  if len(match) > len(layout) else None for match in distinct]
+        packed.extras = tuple(extras) if any(extras) else None
+        return packed
+
+    def unpack(self, packed: PackedProject) -> Dict:
+        """Result dict of a packed project, equal to the one it was packed from"""
+        if packed.raw is not None:
+            return packed.raw
+
+        project_id, project_title = packed.project
+        scores = (packed.scores / 100 if packed.scores.dtype == np.int32 else packed.scores).tolist()
+        num_entries = sum(packed.sizes)
+        index = packed.index.tolist()
+        rows = index[num_entries:num_entries + len(scores)]
+        int_masks = index[num_entries + len(scores):]
+        distinct = []
+        for i, (row, values, ints) in enumerate(zip(rows, scores, int_masks)):
+            if ints:
+                values = [int(value) if ints >> k & 1 else value for k, value in enumerate(values)]
+            emp_id, name, skills, role, proficiency, capacity, location = self.employee(row)
+            skill, prof, availability, cap, semantic, overall, domain_bonus, penalty = values
+            match = {
+                'employee_id': emp_id,
+                'employee_name': name,
+                'project_id': project_id,
+                'project_title': project_title,
+                'skill_match': skill,
+                'proficiency_match': prof,
+                'availability_match': availability,
+                'capacity_match': cap,
+                'semantic_match': semantic,
+                'overall_score': overall,
+                'skills': skills,
+                'role': role,
+                'proficiency': proficiency,
+                'capacity': capacity,
+                'location': location,
+                'domain_bonus': domain_bonus,
+                'conflict_penalty': penalty
+            }
+            if not packed.semantic:
+                del match['semantic_match']
+            if packed.extras is not None and packed.extras[i] is not None:
+                match.update(zip(*packed.extras[i]))
+            distinct.append(match)
+
+        members = [distinct[i] for i in index[:num_entries]]
+        groups, start = {}, 0
+        for group, size in zip(MEMBER_GROUPS, packed.sizes):
+            groups[group] = members[start:start + size]
+            start += size
+        values = iter(packed.values)
+        return {key: groups[key] if key in groups else next(values) for key in packed.keys}
+
+
+class CompactResults(Sequence):
+    """Read-only list of matching results stored packed; indexing or iterating builds the dicts"""
+
+    def __init__(self, projects: List[PackedProject], table: EmployeeTable):
+        self.projects = projects
+        self.table = table
+
+    @classmethod
+    def from_dicts(cls, results, table: Optional[EmployeeTable] = None) -> 'CompactResults':
+        """Pack result dicts, e.g. as they stream out of a solver"""
+        table = table or EmployeeTable()
+        return cls([table.pack(result) for result in results], table)
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.unpack(packed) for packed in self.projects[index]]
+        return self.table.unpack(self.projects[index])
+
+    def __iter__(self) -> Iterator[Dict]:
+        for packed in self.projects:
+            yield self.table.unpack(packed)
+
+    def team_ids(self) -> Iterator[str]:
+        """Employee ids of every intelligent team member, without building the dicts"""
+        start = MEMBER_GROUPS.index('intelligent_team')
+        for packed in self.projects:
+            if packed.raw is not None:
+                yield from (match['employee_id'] for match in packed.raw.get('intelligent_team', []))
+                continue
+            offset, num_entries = sum(packed.sizes[:start]), sum(packed.sizes)
+            for i in packed.index[offset:offset + packed.sizes[start]].tolist():
+                yield self.table.columns[0][packed.index[num_entries + i]]
+
+    def pairs(self) -> Iterator[Tuple]:
+        """(employee id, project id, *SCORE_KEYS, in team) of every listed match, without building the dicts"""
+        start = MEMBER_GROUPS.index('intelligent_team')
+        for packed in self.projects:
+            if packed.raw is not None:
+                result = packed.raw
+                team = {id(match) for match in result.get('intelligent_team', [])}
+                seen = set()
+                for group in MEMBER_GROUPS:
+                    for match in result.get(group, []):
+                        if id(match) not in seen:
+                            seen.add(id(match))
+                            yield (str(match.get('employee_id')), str(match.get('project_id')),
+                                   *(float(match.get(key) or 0) for key in SCORE_KEYS), int(id(match) in team))
+                continue
+
+            project_id = str(packed.project[0])
+            scores = (packed.scores / 100 if packed.scores.dtype == np.int32 else packed.scores).tolist()
+            num_entries = sum(packed.sizes)
+            offset = sum(packed.sizes[:start])
+            index = packed.index.tolist()
+            team = set(index[offset:offset + packed.sizes[start]])
+            for i, (row, values) in enumerate(zip(index[num_entries:num_entries + len(scores)], scores)):
+                yield (str(self.table.columns[0][row]), project_id, *values, int(i in team))
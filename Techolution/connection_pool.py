@@ -0,0 +1,88 @@
+"""
+Connection pool for AI-Driven Talent Management System
+Reuses tuned SQLite connections across calls and threads instead of opening one per query
+"""
+
+from contextlib import contextmanager
+from typing import Dict, List
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept per database file
+DEFAULT_POOL_SIZE = 8
+
+# Statements each connection keeps compiled
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every new connection: readers don't wait for writers in WAL mode, NORMAL sync is
+# durable across application crashes in WAL mode, and the page cache and mmap keep reads in memory
+PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -16000),  # KiB
+    ('mmap_size', 256 * 1024 * 1024),
+    ('temp_store', 'MEMORY'),
+    ('busy_timeout', 5000)  # ms a writer waits for another writer instead of failing
+)
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections to one file, handed to one thread at a time"""
+
+    def __init__(self, path: str, size: int = DEFAULT_POOL_SIZE):
+        self.path = path
+        self.size = max(1, size)
+        self.idle: List[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+        self.counters = {'opened': 0, 'reused': 0, 'closed': 0}
+
+    def _open(self) -> sqlite3.Connection:
+        # Connections move between request threads, but the pool never shares one at a time
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        for name, value in PRAGMAS:
+            conn.execute(f'PRAGMA {name} = {value}')
+        with self.lock:
+            self.counters['opened'] += 1
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        with self.lock:
+            if self.idle:
+                self.counters['reused'] += 1
+                return self.idle.pop()
+        return self._open()
+
+    def release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            conn.rollback()  # a caller left without committing
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(conn)
+                return
+            self.counters['closed'] += 1
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        """A pooled connection that commits on success and rolls back on error, like sqlite3's own"""
+        conn = self.acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close the idle connections"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+            self.counters['closed'] += len(idle)
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return dict(self.counters, idle=len(self.idle), size=self.size, path=self.path)
@@ -0,0 +1,151 @@
+"""
+Hard constraints for AI-Driven Talent Management System
+Boolean indexes over categorical employee columns, intersected per project before any scoring
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+import logging
+from matching_engine import split_tokens, _is_missing
+
+logger = logging.getLogger(__name__)
+
+# Eligibility values that admit everyone
+UNRESTRICTED = {'all', 'any', 'none'}
+
+
+class CategoryIndex:
+    """Boolean employee mask per distinct value of a categorical column"""
+
+    def __init__(self, values: Sequence):
+        self.size = len(values)
+        self.masks: Dict[str, np.ndarray] = {}
+        keys = np.array([str(value).strip().lower() for value in values], dtype=object)
+        for key in set(keys.tolist()):
+            self.masks[key] = keys == key
+
+    def any_of(self, values: Iterable[str]) -> np.ndarray:
+        """Employees whose value is one of the given values"""
+        mask = np.zeros(self.size, dtype=bool)
+        for value in values:
+            if value in self.masks:
+                mask |= self.masks[value]
+        return mask
+
+
+class HardConstraint(ABC):
+    """A per-project employee mask built from the engine's rows; None means the project sets no limit"""
+
+    def __init__(self, engine):
+        """Index the engine's current employee and project rows"""
+
+    @abstractmethod
+    def requirement(self, project_index: int) -> Hashable:
+        """What the project asks for; projects with equal requirements share a mask"""
+
+    @abstractmethod
+    def mask(self, project_index: int) -> Optional[np.ndarray]:
+        """Employees the project accepts"""
+
+
+class EligibilityConstraint(HardConstraint):
+    """Projects.csv Eligibility lists the roles or proficiency levels allowed on the project"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.roles = CategoryIndex(engine.emp_roles)
+        self.proficiencies = CategoryIndex(engine.emp_proficiency)
+        self.known = set(self.roles.masks) | set(self.proficiencies.masks)
+        self.allowed = [self._allowed(value) for value in engine.proj_eligibility]
+
+    def _allowed(self, eligibility) -> Optional[frozenset]:
+        if _is_missing(eligibility):
+            return None
+        tokens = set(token.lower() for token in split_tokens(eligibility))
+        # Lists that name no role or proficiency on the roster (e.g. required skills) don't restrict anyone
+        if tokens & UNRESTRICTED or not tokens & self.known:
+            return None
+        return frozenset(tokens & self.known)
+
+    def requirement(self, project_index: int) -> Hashable:
+        return self.allowed[project_index]
+
+    def mask(self, project_index: int) -> Optional[np.ndarray]:
+        allowed = self.allowed[project_index]
+        if allowed is None:
+            return None
+        return self.roles.any_of(allowed) | self.proficiencies.any_of(allowed)
+
+
+class ExperienceConstraint(HardConstraint):
+    """Projects.csv Experience_years is a minimum for employees that record their experience"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.experience = engine.emp_experience.copy()
+        self.known = ~np.isnan(self.experience)
+        self.minimum = engine.proj_experience.copy()
+
+    def requirement(self, project_index: int) -> Hashable:
+        minimum = float(self.minimum[project_index])
+        return minimum if minimum > 0 and self.known.any() else None
+
+    def mask(self, project_index: int) -> Optional[np.ndarray]:
+        minimum = self.requirement(project_index)
+        if minimum is None:
+            return None
+        # Employees without a recorded experience are not ruled out
+        with np.errstate(invalid='ignore'):
+            return ~self.known | (self.experience >= minimum)
+
+
+class LocationConstraint(HardConstraint):
+    """An optional Projects.csv Locations column is an allow-list of employee locations"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.locations = CategoryIndex(engine.emp_locations)
+        self.allowed = [self._allowed(value) for value in engine.proj_locations]
+
+    @staticmethod
+    def _allowed(locations) -> Optional[frozenset]:
+        if _is_missing(locations):
+            return None
+        tokens = frozenset(token.lower() for token in split_tokens(locations))
+        return None if not tokens or tokens & UNRESTRICTED else tokens
+
+    def requirement(self, project_index: int) -> Hashable:
+        return self.allowed[project_index]
+
+    def mask(self, project_index: int) -> Optional[np.ndarray]:
+        allowed = self.allowed[project_index]
+        return None if allowed is None else self.locations.any_of(allowed)
+
+
+# Constraints every engine applies; append a HardConstraint subclass to add one
+HARD_CONSTRAINTS: List[type] = [EligibilityConstraint, ExperienceConstraint, LocationConstraint]
+
+
+class ConstraintStage:
+    """All hard constraints of an engine, intersected per project"""
+
+    def __init__(self, engine, constraints: Optional[Sequence[type]] = None):
+        self.constraints = [constraint(engine) for constraint in (constraints or HARD_CONSTRAINTS)]
+        self._masks: Dict[Hashable, Optional[np.ndarray]] = {}
+
+    def requirement(self, project_index: int) -> Hashable:
+        """Combined requirements of a project, equal for projects that accept the same employees"""
+        return tuple(constraint.requirement(project_index) for constraint in self.constraints)
+
+    def eligible(self, project_index: int) -> Optional[np.ndarray]:
+        """Employees passing every constraint of a project, or None when nothing restricts it"""
+        key = self.requirement(project_index)
+        if key not in self._masks:
+            mask = None
+            for constraint in self.constraints:
+                limit = constraint.mask(project_index)
+                if limit is not None:
+                    mask = limit if mask is None else mask & limit
+            self._masks[key] = mask
+        return self._masks[key]
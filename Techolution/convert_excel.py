@@ -1,21 +1,23 @@
 import pandas as pd
 import os
+import sys
+from dataset_formats import FORMATS, write_frame
 
-def convert_excel_to_csv():
-    """Convert Excel files to CSV format"""
+def convert_excel_to_csv(suffix='.csv'):
+    """Convert Excel files to CSV format, or straight to another dataset format (e.g. .parquet)"""
     try:
-        # Convert Employees.xlsx to CSV
+        # Convert Employees.xlsx
         employees_df = pd.read_excel('datasets/Employees.csv.xlsx')
-        employees_df.to_csv('datasets/Employees.csv', index=False)
-        print("Converted Employees.xlsx to CSV")
+        write_frame(employees_df, f'datasets/Employees{suffix}')
+        print(f"Converted Employees.xlsx to {suffix}")
         print("Employees columns:", employees_df.columns.tolist())
         print("Sample data:")
         print(employees_df.head())
         
-        # Convert Projects.xlsx to CSV
+        # Convert Projects.xlsx
         projects_df = pd.read_excel('datasets/Projects.csv.xlsx')
-        projects_df.to_csv('datasets/Projects.csv', index=False)
-        print("\nConverted Projects.xlsx to CSV")
+        write_frame(projects_df, f'datasets/Projects{suffix}')
+        print(f"\nConverted Projects.xlsx to {suffix}")
         print("Projects columns:", projects_df.columns.tolist())
         print("Sample data:")
         print(projects_df.head())
@@ -24,4 +26,9 @@ def convert_excel_to_csv():
         print(f"Error converting files: {e}")
 
 if __name__ == "__main__":
-    convert_excel_to_csv()
+    # Optional target format, e.g. `python convert_excel.py parquet` or `python convert_excel.py csv.gz`
+    suffix = '.' + sys.argv[1].lstrip('.') if len(sys.argv) > 1 else '.csv'
+    if suffix not in FORMATS:
+        print(f"Unknown format {suffix} (use one of {', '.join(FORMATS)})")
+        sys.exit(1)
+    convert_excel_to_csv(suffix)
@@ -5,10 +5,13 @@ Handles database operations for employees and projects data
 
 import sqlite3
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 import logging
+import threading
+from connection_pool import ConnectionPool, DEFAULT_POOL_SIZE
 
 def convert_to_date_string(date_value):
     """Convert various date formats to string"""
@@ -29,22 +32,181 @@ def convert_to_date_string(date_value):
     except Exception:
         return None
 
+def split_items(text) -> List[str]:
+    """Comma-separated skills or requirements, stripped, without empty entries"""
+    return [item.strip() for item in str(text).split(',') if item.strip()]
+
+def text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """A column as text, the way str() converts each value; '' when the column is missing"""
+    if column not in df:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].astype(str)
+
+def number_column(df: pd.DataFrame, column: str, kind) -> pd.Series:
+    """A column as float or int (0 when missing); values the type can't hold raise like float()/int()"""
+    if column not in df:
+        return pd.Series(0, index=df.index).astype(kind)
+    return df[column].astype(kind)
+
+def optional_text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """An optional column as text, None where empty or when the column is missing"""
+    if column not in df:
+        return pd.Series(None, index=df.index, dtype=object)
+    values = df[column].astype(str)
+    return values.where(df[column].notna() & (values.str.strip() != ''), None)
+
+def optional_number_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """An optional column as float, NaN (stored as NULL) where empty, unparseable or missing"""
+    if column not in df:
+        return pd.Series(np.nan, index=df.index)
+    return pd.to_numeric(df[column], errors='coerce').astype(float)
+
+def date_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """A column as date strings, None where empty, like convert_to_date_string per value"""
+    if column not in df:
+        return pd.Series(None, index=df.index, dtype=object)
+    values = df[column]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime('%Y-%m-%d').astype(object).where(values.notna(), None)
+    # Dates repeat a lot, so each distinct value is converted once (code -1 marks missing values)
+    codes, uniques = pd.factorize(values)
+    converted = np.array([convert_to_date_string(value) for value in uniques] + [None], dtype=object)
+    return pd.Series(converted[codes], index=df.index)
+
+def row_hashes(records: pd.DataFrame) -> pd.Series:
+    """Hex content hash of each converted row, the same for the same values on every import"""
+    return pd.util.hash_pandas_object(records, index=False).map('{:016x}'.format)
+
+def employee_records(employees_df: pd.DataFrame) -> pd.DataFrame:
+    """Employees CSV columns converted to employees table values, with each row's hash"""
+    records = pd.DataFrame({
+        'emp_id': text_column(employees_df, 'Emp ID'),
+        'name': text_column(employees_df, 'Name'),
+        'skills': text_column(employees_df, 'Skills'),
+        'role': text_column(employees_df, 'Role'),
+        'capacity_per_week': number_column(employees_df, 'Capacity per week (hrs)', float),
+        'previous_project_description': text_column(employees_df, 'Previous Project Description'),
+        'proficiency': text_column(employees_df, 'Proficiency'),
+        'available_date': date_column(employees_df, 'Available Date'),
+        'location': text_column(employees_df, 'Location'),
+        'experience_years': optional_number_column(employees_df, 'Experience_years')
+    }, index=employees_df.index)
+    records['row_hash'] = row_hashes(records).to_numpy()
+    return records
+
+def project_records(projects_df: pd.DataFrame) -> pd.DataFrame:
+    """Projects CSV columns converted to projects table values, with each row's hash"""
+    records = pd.DataFrame({
+        'project_id': text_column(projects_df, 'ID'),
+        'project_title': text_column(projects_df, 'Project_Title'),
+        'domain': text_column(projects_df, 'Domain'),
+        'eligibility': text_column(projects_df, 'Eligibility'),
+        'duration': text_column(projects_df, 'Duration'),
+        'proficiency': text_column(projects_df, 'Proficiency'),
+        'conflicts': text_column(projects_df, 'Conflicts'),
+        'hard_deadline': date_column(projects_df, 'Hard_Deadline'),
+        'experience_years': number_column(projects_df, 'Experience_years', int),
+        'locations': optional_text_column(projects_df, 'Locations'),
+        'team_size': optional_number_column(projects_df, 'Team_Size'),
+        'demand_hours': optional_number_column(projects_df, 'Demand_Hours')
+    }, index=projects_df.index)
+    records['row_hash'] = row_hashes(records).to_numpy()
+    return records
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scores of every matching run; text ids keep rows of employees and projects that only live in CSV files
+MATCHING_RESULTS_TABLE = '''
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT,
+        employee_id INTEGER,
+        project_id INTEGER,
+        emp_code TEXT,
+        project_code TEXT,
+        skill_match REAL NOT NULL,
+        proficiency_match REAL NOT NULL,
+        availability_match REAL NOT NULL,
+        capacity_match REAL NOT NULL,
+        semantic_match REAL DEFAULT 0,
+        overall_score REAL NOT NULL,
+        domain_bonus REAL DEFAULT 0,
+        conflict_penalty REAL DEFAULT 0,
+        in_team INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
+        FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+    )
+'''
+
+# Unique text key and columns of the upserted tables, in insert order
+UPSERT_COLUMNS = {
+    'employees': ('emp_id', ('emp_id', 'name', 'skills', 'role', 'capacity_per_week',
+                             'previous_project_description', 'proficiency', 'available_date', 'location',
+                             'experience_years', 'row_hash')),
+    'projects': ('project_id', ('project_id', 'project_title', 'domain', 'eligibility', 'duration',
+                                'proficiency', 'conflicts', 'hard_deadline', 'experience_years',
+                                'locations', 'team_size', 'demand_hours', 'row_hash'))
+}
+
+# Columns added to the upserted tables after their first release; older databases gain them in place
+ADDED_COLUMNS = {
+    'employees': (('experience_years', 'REAL'), ('row_hash', 'TEXT')),
+    'projects': (('locations', 'TEXT'), ('team_size', 'INTEGER'), ('demand_hours', 'REAL'), ('row_hash', 'TEXT'))
+}
+
+# Normalized item table and the column it is split from, per upserted table
+ITEMS_OF = {'employees': ('employee_skills', 'skills'), 'projects': ('project_requirements', 'eligibility')}
+
+# Indexes duplicating a UNIQUE constraint's index, dropped from existing databases
+REDUNDANT_INDEXES = ('idx_employees_emp_id', 'idx_projects_project_id', 'idx_employee_skills_employee_id',
+                     'idx_project_requirements_project_id')
+
+# Keys per IN (...) lookup, below SQLite's variable limit
+LOOKUP_BATCH = 500
+
+# Parent table and key, and the link and value columns, of the normalized item tables
+ITEM_TABLES = {
+    'employee_skills': ('employees', 'emp_id', 'employee_id', 'skill'),
+    'project_requirements': ('projects', 'project_id', 'project_id', 'requirement')
+}
+
 class DatabaseManager:
     """Database manager for handling all database operations"""
     
-    def __init__(self, db_path: str = "talent_management.db"):
-        """Initialize database manager"""
+    def __init__(self, db_path: str = "talent_management.db", pool_size: int = DEFAULT_POOL_SIZE):
+        """Initialize database manager; pool_size 0 opens a plain connection per call"""
         self.db_path = db_path
+        self.pool_size = pool_size
+        self.pool: Optional[ConnectionPool] = None
+        self.pool_lock = threading.Lock()
         self.init_database()
     
+    def connect(self):
+        """Connection context for one call, taken from the pool of the current db_path"""
+        if self.pool_size <= 0:
+            return sqlite3.connect(self.db_path)
+        
+        pool = self.pool
+        if pool is None or pool.path != self.db_path:
+            with self.pool_lock:
+                if self.pool is None or self.pool.path != self.db_path:
+                    if self.pool is not None:
+                        self.pool.close()
+                    self.pool = ConnectionPool(self.db_path, self.pool_size)
+                pool = self.pool
+        return pool.connection()
+    
+    def pool_stats(self) -> Dict:
+        """Connections opened, reused and idle in the pool"""
+        return self.pool.stats() if self.pool is not None else {'size': self.pool_size}
+    
     def init_database(self):
         """Initialize database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 
                 # Create employees table
@@ -60,6 +222,8 @@ class DatabaseManager:
                         proficiency TEXT NOT NULL,
                         available_date DATE,
                         location TEXT NOT NULL,
+                        experience_years REAL,
+                        row_hash TEXT,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
@@ -78,11 +242,37 @@ class DatabaseManager:
                         conflicts TEXT,
                         hard_deadline DATE NOT NULL,
                         experience_years INTEGER NOT NULL,
+                        locations TEXT,
+                        team_size INTEGER,
+                        demand_hours REAL,
+                        row_hash TEXT,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
                 
+                # Optional dataset columns and the content hash of each imported row (compared by
+                # sync_employees / sync_projects); the next sync rewrites rows whose hash lacks the new columns
+                for table, added in ADDED_COLUMNS.items():
+                    existing = [row[1] for row in cursor.execute(f'PRAGMA table_info({table})')]
+                    for column, kind in added:
+                        if column not in existing:
+                            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {kind}')
+                
+                # Counter of employee and project changes; readers reload their copy when it moves
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS data_version (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        version INTEGER NOT NULL,
+                        origin TEXT
+                    )
+                ''')
+                # A random origin per database file tells versions of different files apart
+                if 'origin' not in [row[1] for row in cursor.execute('PRAGMA table_info(data_version)')]:
+                    cursor.execute('ALTER TABLE data_version ADD COLUMN origin TEXT')
+                cursor.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)')
+                cursor.execute('UPDATE data_version SET origin = lower(hex(randomblob(16))) WHERE origin IS NULL')
+                
                 # Create employee_skills table for normalized skill storage
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS employee_skills (
@@ -106,44 +296,33 @@ class DatabaseManager:
                 ''')
                 
                 # Create matching_results table to store matching history
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS matching_results (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        employee_id INTEGER NOT NULL,
-                        project_id INTEGER NOT NULL,
-                        skill_match REAL NOT NULL,
-                        proficiency_match REAL NOT NULL,
-                        availability_match REAL NOT NULL,
-                        capacity_match REAL NOT NULL,
-                        overall_score REAL NOT NULL,
-                        domain_bonus REAL DEFAULT 0,
-                        conflict_penalty REAL DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
-                        FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
-                    )
-                ''')
+                cursor.execute(MATCHING_RESULTS_TABLE.format(name='matching_results'))
+                self._migrate_matching_results(cursor)
+                
+                # Items left behind by upserts that replaced their employee or project row
+                for table, (parent, _, link, _) in ITEM_TABLES.items():
+                    cursor.execute(f'DELETE FROM {table} WHERE {link} NOT IN (SELECT id FROM {parent})')
                 
-                # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_employees_emp_id ON employees(emp_id)')
+                # Create indexes for better performance (lookups by emp_id, project_id and parent id use the
+                # indexes of the UNIQUE constraints; the copies of those only slowed down writes)
+                for index in REDUNDANT_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS {index}')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_employees_skills ON employees(skills)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_employees_proficiency ON employees(proficiency)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_employees_available_date ON employees(available_date)')
                 
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_project_id ON projects(project_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_domain ON projects(domain)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_proficiency ON projects(proficiency)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_deadline ON projects(hard_deadline)')
                 
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_employee_skills_employee_id ON employee_skills(employee_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_employee_skills_skill ON employee_skills(skill)')
                 
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_project_requirements_project_id ON project_requirements(project_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_project_requirements_requirement ON project_requirements(requirement)')
                 
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_matching_results_employee_id ON matching_results(employee_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_matching_results_project_id ON matching_results(project_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_matching_results_overall_score ON matching_results(overall_score)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_matching_results_run_id ON matching_results(run_id)')
                 
                 conn.commit()
                 logger.info("Database initialized successfully")
@@ -152,19 +331,110 @@ class DatabaseManager:
             logger.error(f"Error initializing database: {e}")
             raise
     
+    def _migrate_matching_results(self, cursor):
+        """Rebuild a matching_results table from before run ids, keeping its rows"""
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(matching_results)')]
+        if 'run_id' in columns:
+            return
+        
+        cursor.execute(MATCHING_RESULTS_TABLE.format(name='matching_results_migrated'))
+        cursor.execute('''
+            INSERT INTO matching_results_migrated
+            (id, employee_id, project_id, emp_code, project_code, skill_match, proficiency_match,
+             availability_match, capacity_match, overall_score, domain_bonus, conflict_penalty, created_at)
+            SELECT mr.id, mr.employee_id, mr.project_id, e.emp_id, p.project_id, mr.skill_match, mr.proficiency_match,
+                   mr.availability_match, mr.capacity_match, mr.overall_score, mr.domain_bonus, mr.conflict_penalty,
+                   mr.created_at
+            FROM matching_results mr
+            LEFT JOIN employees e ON mr.employee_id = e.id
+            LEFT JOIN projects p ON mr.project_id = p.id
+        ''')
+        cursor.execute('DROP TABLE matching_results')
+        cursor.execute('ALTER TABLE matching_results_migrated RENAME TO matching_results')
+        logger.info("Migrated matching_results to the run-tagged schema")
+    
+    def _bump_version(self, cursor):
+        cursor.execute('UPDATE data_version SET version = version + 1 WHERE id = 1')
+    
+    def get_data_version(self) -> int:
+        """Counter that moves on every employee or project change, from this or any other process"""
+        with self.connect() as conn:
+            return conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()[0]
+    
+    def get_data_origin(self) -> str:
+        """Random id of this database file, so equal versions of different files are not confused"""
+        with self.connect() as conn:
+            return conn.execute('SELECT origin FROM data_version WHERE id = 1').fetchone()[0]
+    
+    def get_snapshot(self) -> Tuple[int, pd.DataFrame, pd.DataFrame]:
+        """Data version, employees and projects read in one transaction, rows in insertion order"""
+        with self.connect() as conn:
+            conn.execute('BEGIN')  # the three reads see the same state while writers go on
+            version = conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()[0]
+            employees = pd.read_sql_query('''
+                SELECT emp_id, name, skills, role, capacity_per_week, 
+                       previous_project_description, proficiency, available_date, location, experience_years
+                FROM employees
+                ORDER BY id
+            ''', conn)
+            projects = pd.read_sql_query('''
+                SELECT project_id, project_title, domain, eligibility, duration, 
+                       proficiency, conflicts, hard_deadline, experience_years,
+                       locations, team_size, demand_hours
+                FROM projects
+                ORDER BY id
+            ''', conn)
+            conn.commit()
+        return version, employees, projects
+    
+    def _upsert(self, cursor, table: str, rows, keys: List[str]) -> Tuple[List[int], int]:
+        """Insert or update rows of employees or projects in place, keeping their ids (and the links to them)
+        
+        Returns the row id of every key, and the highest id from before, so ids above it are new rows.
+        """
+        key, columns = UPSERT_COLUMNS[table]
+        previous = cursor.execute(f'SELECT COALESCE(MAX(id), 0) FROM {table}').fetchone()[0]
+        cursor.executemany(f'''
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+            ON CONFLICT({key}) DO UPDATE SET
+                {', '.join(f'{column} = excluded.{column}' for column in columns[1:])},
+                updated_at = CURRENT_TIMESTAMP
+        ''', rows)
+        return self._row_ids(cursor, table, keys), previous
+    
+    def _lookup(self, cursor, query: str, keys: List) -> Dict:
+        """Pairs a two-column query returns for keys filled into its IN ({}), a batch of keys per query"""
+        found = {}
+        for start in range(0, len(keys), LOOKUP_BATCH):
+            batch = keys[start:start + LOOKUP_BATCH]
+            found.update(cursor.execute(query.format(", ".join("?" * len(batch))), batch))
+        return found
+    
+    def _row_ids(self, cursor, table: str, keys: List[str]) -> List[int]:
+        """Row ids of emp_id or project_id keys, looked up a batch of keys per query"""
+        key, _ = UPSERT_COLUMNS[table]
+        ids = self._lookup(cursor, f'SELECT {key}, id FROM {table} WHERE {key} IN ({{}})', keys)
+        return [ids[k] for k in keys]
+    
+    def _replace_items(self, cursor, table: str, cleared: List[int], items):
+        """Replace the normalized skills or requirements of employees or projects
+        
+        The items of the cleared row ids are deleted (rows new to the table have none), then the
+        (row id, text) items are inserted.
+        """
+        _, _, link, column = ITEM_TABLES[table]
+        cursor.executemany(f'DELETE FROM {table} WHERE {link} = ?', ((row_id,) for row_id in cleared))
+        cursor.executemany(f'INSERT OR IGNORE INTO {table} ({link}, {column}) VALUES (?, ?)', items)
+    
     def insert_employee(self, emp_data: Dict) -> int:
-        """Insert a single employee record"""
+        """Insert or update a single employee record"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 
                 # Insert employee
-                cursor.execute('''
-                    INSERT OR REPLACE INTO employees 
-                    (emp_id, name, skills, role, capacity_per_week, previous_project_description, 
-                     proficiency, available_date, location)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                (employee_id,), previous = self._upsert(cursor, 'employees', [(
                     emp_data['emp_id'],
                     emp_data['name'],
                     emp_data['skills'],
@@ -173,19 +443,16 @@ class DatabaseManager:
                     emp_data.get('previous_project_description', ''),
                     emp_data['proficiency'],
                     emp_data.get('available_date'),
-                    emp_data['location']
-                ))
-                
-                employee_id = cursor.lastrowid
+                    emp_data['location'],
+                    emp_data.get('experience_years'),
+                    None  # rows edited one at a time are rewritten by the next sync
+                )], [emp_data['emp_id']])
                 
-                # Insert normalized skills
-                if 'skills' in emp_data and emp_data['skills']:
-                    skills = [skill.strip() for skill in str(emp_data['skills']).split(',') if skill.strip()]
-                    for skill in skills:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO employee_skills (employee_id, skill)
-                            VALUES (?, ?)
-                        ''', (employee_id, skill))
+                # Replace normalized skills
+                skills = split_items(emp_data['skills']) if emp_data['skills'] else []
+                self._replace_items(cursor, 'employee_skills', [employee_id] if employee_id <= previous else [],
+                                    [(employee_id, skill) for skill in skills])
+                self._bump_version(cursor)
                 
                 conn.commit()
                 return employee_id
@@ -195,18 +462,13 @@ class DatabaseManager:
             raise
     
     def insert_project(self, project_data: Dict) -> int:
-        """Insert a single project record"""
+        """Insert or update a single project record"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 
                 # Insert project
-                cursor.execute('''
-                    INSERT OR REPLACE INTO projects 
-                    (project_id, project_title, domain, eligibility, duration, proficiency, 
-                     conflicts, hard_deadline, experience_years)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                (project_id,), previous = self._upsert(cursor, 'projects', [(
                     project_data['project_id'],
                     project_data['project_title'],
                     project_data['domain'],
@@ -215,19 +477,18 @@ class DatabaseManager:
                     project_data['proficiency'],
                     project_data.get('conflicts', ''),
                     project_data['hard_deadline'],
-                    project_data['experience_years']
-                ))
-                
-                project_id = cursor.lastrowid
-                
-                # Insert normalized requirements
-                if 'eligibility' in project_data and project_data['eligibility']:
-                    requirements = [req.strip() for req in str(project_data['eligibility']).split(',') if req.strip()]
-                    for requirement in requirements:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO project_requirements (project_id, requirement)
-                            VALUES (?, ?)
-                        ''', (project_id, requirement))
+                    project_data['experience_years'],
+                    project_data.get('locations'),
+                    project_data.get('team_size'),
+                    project_data.get('demand_hours'),
+                    None
+                )], [project_data['project_id']])
+                
+                # Replace normalized requirements
+                requirements = split_items(project_data['eligibility']) if project_data['eligibility'] else []
+                self._replace_items(cursor, 'project_requirements', [project_id] if project_id <= previous else [],
+                                    [(project_id, requirement) for requirement in requirements])
+                self._bump_version(cursor)
                 
                 conn.commit()
                 return project_id
@@ -236,131 +497,146 @@ class DatabaseManager:
             logger.error(f"Error inserting project: {e}")
             raise
     
+    def _write_records(self, cursor, table: str, records: pd.DataFrame):
+        """Upsert converted records with one executemany, then replace their items with another"""
+        key, columns = UPSERT_COLUMNS[table]
+        items_table, items_column = ITEMS_OF[table]
+        records = records.reset_index(drop=True)  # frames joined with concat can repeat index labels
+        latest = records.drop_duplicates(key, keep='last')
+        ids, previous = self._upsert(cursor, table, zip(*(records[column].tolist() for column in columns)),
+                                     latest[key].tolist())
+        
+        # A key listed twice keeps the items of its last row, like the row itself; repeated
+        # texts (most skill lists) are split once
+        ids = pd.Series(ids, index=latest.index)
+        codes, texts = pd.factorize(latest[items_column])
+        parsed = pd.Series([split_items(text) for text in texts] + [[]])
+        items = parsed.iloc[codes].set_axis(latest.index).explode().dropna()
+        self._replace_items(cursor, items_table, ids[ids <= previous].tolist(),
+                            zip(ids.loc[items.index].tolist(), items.tolist()))
+    
+    def _delete_rows(self, cursor, table: str, keys: List[str]):
+        """Delete employees or projects by key with their items and matching results"""
+        items_table, _ = ITEMS_OF[table]
+        link = ITEM_TABLES[items_table][2]
+        ids = [(row_id,) for row_id in self._row_ids(cursor, table, keys)]
+        cursor.executemany(f'DELETE FROM matching_results WHERE {link} = ?', ids)
+        cursor.executemany(f'DELETE FROM {items_table} WHERE {link} = ?', ids)
+        cursor.executemany(f'DELETE FROM {table} WHERE id = ?', ids)
+    
+    def _bulk_insert(self, table: str, records: pd.DataFrame) -> int:
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            self._write_records(cursor, table, records)
+            self._bump_version(cursor)
+            conn.commit()
+        return len(records)
+    
+    def _sync(self, table: str, chunks: Iterable[pd.DataFrame], delete_missing: bool) -> Dict:
+        """Write only the new and changed records, by row hash, and delete keys none of the chunks had
+
+        Chunks of converted records are written as they arrive, in one transaction; a key repeated in a
+        later chunk keeps its first row, like a key repeated within one chunk.
+        """
+        started = datetime.now()
+        key, _ = UPSERT_COLUMNS[table]
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            # Keys synced so far live in SQLite, so memory stays bounded by the chunk size
+            cursor.execute('CREATE TEMP TABLE IF NOT EXISTS synced_keys (key TEXT PRIMARY KEY)')
+            cursor.execute('DELETE FROM synced_keys')
+            
+            for records in chunks:
+                records = records.drop_duplicates(key, keep='first')
+                seen = self._lookup(cursor, 'SELECT key, 1 FROM synced_keys WHERE key IN ({})', records[key].tolist())
+                records = records[~records[key].isin(seen.keys())]
+                keys = records[key].tolist()
+                stored = self._lookup(cursor, f'SELECT {key}, row_hash FROM {table} WHERE {key} IN ({{}})', keys)
+                
+                known = records[key].isin(stored.keys())
+                changed = known & (records[key].map(stored) != records['row_hash'])
+                if (~known | changed).any():
+                    self._write_records(cursor, table, records[~known | changed])
+                cursor.executemany('INSERT INTO synced_keys (key) VALUES (?)', ((k,) for k in keys))
+                counts['inserted'] += int((~known).sum())
+                counts['updated'] += int(changed.sum())
+                counts['unchanged'] += int(known.sum() - changed.sum())
+            
+            deleted = []
+            if delete_missing:
+                deleted = [row[0] for row in cursor.execute(
+                    f'SELECT {key} FROM {table} WHERE {key} NOT IN (SELECT key FROM synced_keys) ORDER BY {key}')]
+            if deleted:
+                self._delete_rows(cursor, table, deleted)
+            cursor.execute('DELETE FROM synced_keys')
+            if counts['inserted'] or counts['updated'] or deleted:
+                self._bump_version(cursor)
+            conn.commit()
+        
+        summary = {
+            'inserted': counts['inserted'],
+            'updated': counts['updated'],
+            'deleted': len(deleted),
+            'unchanged': counts['unchanged'],
+            'seconds': round((datetime.now() - started).total_seconds(), 3)
+        }
+        logger.info(f"Synced {table}: {summary}")
+        return summary
+    
     def bulk_insert_employees(self, employees_df: pd.DataFrame) -> int:
-        """Bulk insert employees from DataFrame"""
+        """Bulk insert or update employees from DataFrame"""
         try:
-            count = 0
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                for _, row in employees_df.iterrows():
-                    emp_data = {
-                        'emp_id': str(row.get('Emp ID', '')),
-                        'name': str(row.get('Name', '')),
-                        'skills': str(row.get('Skills', '')),
-                        'role': str(row.get('Role', '')),
-                        'capacity_per_week': float(row.get('Capacity per week (hrs)', 0)),
-                        'previous_project_description': str(row.get('Previous Project Description', '')),
-                        'proficiency': str(row.get('Proficiency', '')),
-                        'available_date': convert_to_date_string(row.get('Available Date', '')),
-                        'location': str(row.get('Location', ''))
-                    }
-                    
-                    # Insert employee
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO employees 
-                        (emp_id, name, skills, role, capacity_per_week, previous_project_description, 
-                         proficiency, available_date, location)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        emp_data['emp_id'],
-                        emp_data['name'],
-                        emp_data['skills'],
-                        emp_data['role'],
-                        emp_data['capacity_per_week'],
-                        emp_data['previous_project_description'],
-                        emp_data['proficiency'],
-                        emp_data['available_date'],
-                        emp_data['location']
-                    ))
-                    
-                    employee_id = cursor.lastrowid
-                    
-                    # Insert normalized skills
-                    if emp_data['skills']:
-                        skills = [skill.strip() for skill in str(emp_data['skills']).split(',') if skill.strip()]
-                        for skill in skills:
-                            cursor.execute('''
-                                INSERT OR IGNORE INTO employee_skills (employee_id, skill)
-                                VALUES (?, ?)
-                            ''', (employee_id, skill))
-                    
-                    count += 1
-                
-                conn.commit()
-                logger.info(f"Bulk inserted {count} employees")
-                return count
+            count = self._bulk_insert('employees', employee_records(employees_df))
+            logger.info(f"Bulk inserted {count} employees")
+            return count
                 
         except Exception as e:
             logger.error(f"Error bulk inserting employees: {e}")
             raise
     
     def bulk_insert_projects(self, projects_df: pd.DataFrame) -> int:
-        """Bulk insert projects from DataFrame"""
+        """Bulk insert or update projects from DataFrame"""
         try:
-            count = 0
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                for _, row in projects_df.iterrows():
-                    project_data = {
-                        'project_id': str(row.get('ID', '')),
-                        'project_title': str(row.get('Project_Title', '')),
-                        'domain': str(row.get('Domain', '')),
-                        'eligibility': str(row.get('Eligibility', '')),
-                        'duration': str(row.get('Duration', '')),
-                        'proficiency': str(row.get('Proficiency', '')),
-                        'conflicts': str(row.get('Conflicts', '')),
-                        'hard_deadline': convert_to_date_string(row.get('Hard_Deadline', '')),
-                        'experience_years': int(row.get('Experience_years', 0))
-                    }
-                    
-                    # Insert project
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO projects 
-                        (project_id, project_title, domain, eligibility, duration, proficiency, 
-                         conflicts, hard_deadline, experience_years)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        project_data['project_id'],
-                        project_data['project_title'],
-                        project_data['domain'],
-                        project_data['eligibility'],
-                        project_data['duration'],
-                        project_data['proficiency'],
-                        project_data['conflicts'],
-                        project_data['hard_deadline'],
-                        project_data['experience_years']
-                    ))
-                    
-                    project_id = cursor.lastrowid
-                    
-                    # Insert normalized requirements
-                    if project_data['eligibility']:
-                        requirements = [req.strip() for req in str(project_data['eligibility']).split(',') if req.strip()]
-                        for requirement in requirements:
-                            cursor.execute('''
-                                INSERT OR IGNORE INTO project_requirements (project_id, requirement)
-                                VALUES (?, ?)
-                            ''', (project_id, requirement))
-                    
-                    count += 1
-                
-                conn.commit()
-                logger.info(f"Bulk inserted {count} projects")
-                return count
+            count = self._bulk_insert('projects', project_records(projects_df))
+            logger.info(f"Bulk inserted {count} projects")
+            return count
                 
         except Exception as e:
             logger.error(f"Error bulk inserting projects: {e}")
             raise
     
+    def sync_employees(self, employees_df: pd.DataFrame, delete_missing: bool = True) -> Dict:
+        """Bring the employees table in line with a DataFrame, touching only changed rows"""
+        return self.sync_employee_chunks([employees_df], delete_missing)
+    
+    def sync_projects(self, projects_df: pd.DataFrame, delete_missing: bool = True) -> Dict:
+        """Bring the projects table in line with a DataFrame, touching only changed rows"""
+        return self.sync_project_chunks([projects_df], delete_missing)
+    
+    def sync_employee_chunks(self, chunks: Iterable[pd.DataFrame], delete_missing: bool = True) -> Dict:
+        """Bring the employees table in line with DataFrame chunks, e.g. of a file read in parts"""
+        try:
+            return self._sync('employees', (employee_records(chunk) for chunk in chunks), delete_missing)
+        except Exception as e:
+            logger.error(f"Error syncing employees: {e}")
+            raise
+    
+    def sync_project_chunks(self, chunks: Iterable[pd.DataFrame], delete_missing: bool = True) -> Dict:
+        """Bring the projects table in line with DataFrame chunks, e.g. of a file read in parts"""
+        try:
+            return self._sync('projects', (project_records(chunk) for chunk in chunks), delete_missing)
+        except Exception as e:
+            logger.error(f"Error syncing projects: {e}")
+            raise
+    
     def get_all_employees(self) -> pd.DataFrame:
         """Get all employees as DataFrame"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 query = '''
                     SELECT emp_id, name, skills, role, capacity_per_week, 
-                           previous_project_description, proficiency, available_date, location
+                           previous_project_description, proficiency, available_date, location, experience_years
                     FROM employees
                     ORDER BY emp_id
                 '''
@@ -372,10 +648,11 @@ class DatabaseManager:
     def get_all_projects(self) -> pd.DataFrame:
         """Get all projects as DataFrame"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 query = '''
                     SELECT project_id, project_title, domain, eligibility, duration, 
-                           proficiency, conflicts, hard_deadline, experience_years
+                           proficiency, conflicts, hard_deadline, experience_years,
+                           locations, team_size, demand_hours
                     FROM projects
                     ORDER BY project_id
                 '''
@@ -387,7 +664,7 @@ class DatabaseManager:
     def get_employee_by_id(self, emp_id: str) -> Optional[Dict]:
         """Get employee by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT * FROM employees WHERE emp_id = ?
@@ -405,7 +682,7 @@ class DatabaseManager:
     def get_project_by_id(self, project_id: str) -> Optional[Dict]:
         """Get project by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT * FROM projects WHERE project_id = ?
@@ -420,10 +697,50 @@ class DatabaseManager:
             logger.error(f"Error getting project by ID: {e}")
             return None
     
+    def delete_employee(self, emp_id: str) -> bool:
+        """Delete an employee with its skills and matching results"""
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT id FROM employees WHERE emp_id = ?', (emp_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return False
+                
+                cursor.execute('DELETE FROM matching_results WHERE employee_id = ?', (row[0],))
+                cursor.execute('DELETE FROM employee_skills WHERE employee_id = ?', (row[0],))
+                cursor.execute('DELETE FROM employees WHERE id = ?', (row[0],))
+                self._bump_version(cursor)
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting employee: {e}")
+            raise
+    
+    def delete_project(self, project_id: str) -> bool:
+        """Delete a project with its requirements and matching results"""
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT id FROM projects WHERE project_id = ?', (project_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return False
+                
+                cursor.execute('DELETE FROM matching_results WHERE project_id = ?', (row[0],))
+                cursor.execute('DELETE FROM project_requirements WHERE project_id = ?', (row[0],))
+                cursor.execute('DELETE FROM projects WHERE id = ?', (row[0],))
+                self._bump_version(cursor)
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting project: {e}")
+            raise
+    
     def get_employee_skills(self, emp_id: str) -> List[str]:
         """Get employee skills"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT es.skill FROM employee_skills es
@@ -438,7 +755,7 @@ class DatabaseManager:
     def get_project_requirements(self, project_id: str) -> List[str]:
         """Get project requirements"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT pr.requirement FROM project_requirements pr
@@ -453,7 +770,7 @@ class DatabaseManager:
     def save_matching_result(self, employee_id: int, project_id: int, scores: Dict) -> int:
         """Save matching result"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO matching_results 
@@ -476,34 +793,80 @@ class DatabaseManager:
             logger.error(f"Error saving matching result: {e}")
             raise
     
-    def get_matching_history(self, limit: int = 100) -> pd.DataFrame:
-        """Get matching history"""
+    def save_matching_run(self, run_id: str, rows) -> int:
+        """Save the scored pairs of one matching run in a single transaction
+        
+        rows are (emp_id, project_id, skill_match, proficiency_match, availability_match, capacity_match,
+        semantic_match, overall_score, domain_bonus, conflict_penalty, in_team) tuples with text ids;
+        employees and projects stored in the database are linked by row id as well.
+        """
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO matching_results
+                    (run_id, employee_id, project_id, emp_code, project_code, skill_match, proficiency_match,
+                     availability_match, capacity_match, semantic_match, overall_score, domain_bonus,
+                     conflict_penalty, in_team)
+                    VALUES (?1, (SELECT id FROM employees WHERE emp_id = ?2), (SELECT id FROM projects WHERE project_id = ?3),
+                            ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12)
+                ''', ((run_id, *row) for row in rows))
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Error saving matching run: {e}")
+            raise
+    
+    def get_matching_history(self, limit: int = 100, run_id: Optional[str] = None) -> pd.DataFrame:
+        """Get matching history, optionally of one run"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 query = '''
-                    SELECT mr.*, e.emp_id, e.name as employee_name, 
-                           p.project_id, p.project_title
+                    SELECT mr.*, COALESCE(e.emp_id, mr.emp_code) as emp_id, e.name as employee_name, 
+                           COALESCE(p.project_id, mr.project_code) as project_id, p.project_title
                     FROM matching_results mr
-                    JOIN employees e ON mr.employee_id = e.id
-                    JOIN projects p ON mr.project_id = p.id
-                    ORDER BY mr.created_at DESC
+                    LEFT JOIN employees e ON mr.employee_id = e.id
+                    LEFT JOIN projects p ON mr.project_id = p.id
+                    {where}
+                    ORDER BY mr.created_at DESC, mr.id DESC
                     LIMIT ?
                 '''
-                return pd.read_sql_query(query, conn, params=(limit,))
+                if run_id is not None:
+                    return pd.read_sql_query(query.format(where='WHERE mr.run_id = ?'), conn, params=(run_id, limit))
+                return pd.read_sql_query(query.format(where=''), conn, params=(limit,))
         except Exception as e:
             logger.error(f"Error getting matching history: {e}")
             return pd.DataFrame()
     
+    def get_matching_runs(self, limit: int = 20) -> pd.DataFrame:
+        """Get the most recent matching runs with their pair counts"""
+        try:
+            with self.connect() as conn:
+                query = '''
+                    SELECT run_id, COUNT(*) as pairs, SUM(in_team) as team_members,
+                           MIN(created_at) as created_at
+                    FROM matching_results
+                    WHERE run_id IS NOT NULL
+                    GROUP BY run_id
+                    ORDER BY MAX(id) DESC
+                    LIMIT ?
+                '''
+                return pd.read_sql_query(query, conn, params=(limit,))
+        except Exception as e:
+            logger.error(f"Error getting matching runs: {e}")
+            return pd.DataFrame()
+    
     def clear_all_data(self):
         """Clear all data from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM matching_results')
                 cursor.execute('DELETE FROM project_requirements')
                 cursor.execute('DELETE FROM employee_skills')
                 cursor.execute('DELETE FROM projects')
                 cursor.execute('DELETE FROM employees')
+                self._bump_version(cursor)
                 conn.commit()
                 logger.info("All data cleared from database")
         except Exception as e:
@@ -513,7 +876,7 @@ class DatabaseManager:
     def get_database_stats(self) -> Dict:
         """Get database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 
                 stats = {}
@@ -543,9 +906,15 @@ class DatabaseManager:
             logger.error(f"Error getting database stats: {e}")
             return {}
 
-# Global database instance
-db_manager = DatabaseManager()
+# Global database instance, opened on first use so importing the module never touches the file
+db_manager: Optional[DatabaseManager] = None
+db_manager_lock = threading.Lock()
 
 def get_db_manager() -> DatabaseManager:
     """Get database manager instance"""
+    global db_manager
+    if db_manager is None:
+        with db_manager_lock:
+            if db_manager is None:
+                db_manager = DatabaseManager(pool_size=int(os.environ.get('DB_POOL_SIZE', DEFAULT_POOL_SIZE)))
     return db_manager
@@ -0,0 +1,190 @@
+"""
+Dataset cache for AI-Driven Talent Management System
+Preprocessed employee and project frames stored as .npy column bundles per source version, memory-mapped on load
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import os
+import shutil
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the stored layout changes; part of every key so old entries are never read
+CACHE_FORMAT = 1
+
+# Cached dataset versions kept in the cache directory, newest first
+MAX_CACHED_DATASETS = 4
+
+FRAMES = ('employees', 'projects')
+
+
+def file_hash(paths: Sequence[str], block_size: int = 1 << 20) -> str:
+    """Content hash of source files, read in blocks"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(block_size), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _save_texts(path: str, texts: List[str]):
+    """Strings as one UTF-8 blob plus character offsets"""
+    np.save(f"{path}.text.npy", np.frombuffer(''.join(texts).encode('utf-8'), dtype=np.uint8))
+    np.save(f"{path}.bounds.npy", np.cumsum([0] + [len(text) for text in texts], dtype=np.int64))
+
+
+def _load_texts(path: str) -> List[str]:
+    text = np.load(f"{path}.text.npy").tobytes().decode('utf-8')
+    bounds = np.load(f"{path}.bounds.npy").tolist()
+    return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _column_kind(series: pd.Series) -> Optional[str]:
+    """How a column is stored: 'array', 'text', 'list', or None when it can't be"""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufM':
+        return 'array'
+    if series.dtype != object:
+        return None
+    values = series.dropna().tolist()
+    if all(type(value) is str for value in values):
+        return 'text'
+    if all(type(value) is list and all(type(item) is str for item in value) for value in values) \
+            and len(values) == len(series):
+        return 'list'
+    return None
+
+
+def save_frame(df: pd.DataFrame, directory: str):
+    """Write a frame as one bundle of .npy files per column; ValueError for columns or indexes it can't hold"""
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        raise ValueError("only frames with a default index are cached")
+    os.makedirs(directory, exist_ok=True)
+    columns = []
+    for position, name in enumerate(df.columns):
+        series = df.iloc[:, position]
+        kind = _column_kind(series)
+        if kind is None:
+            raise ValueError(f"column {name!r} of dtype {series.dtype} is not cached")
+        path = os.path.join(directory, str(position))
+        if kind == 'array':
+            values = series.to_numpy()
+            np.save(f"{path}.npy", values.view(np.int64) if values.dtype.kind == 'M' else values)
+        elif kind == 'text':
+            codes, uniques = pd.factorize(series)
+            np.save(f"{path}.codes.npy", codes.astype(np.int32))
+            _save_texts(path, uniques.tolist())
+        else:
+            # Items of every row laid end to end, as codes into one vocabulary
+            lengths = series.map(len).to_numpy()
+            items = [item for value in series.tolist() for item in value]
+            codes, uniques = pd.factorize(pd.Series(items, dtype=object))
+            np.save(f"{path}.codes.npy", codes.astype(np.int32))
+            np.save(f"{path}.offsets.npy", np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64))
+            _save_texts(path, uniques.tolist())
+        columns.append({'name': name, 'kind': kind, 'dtype': str(series.dtype)})
+    with open(os.path.join(directory, 'columns.json'), 'w') as handle:
+        json.dump({'rows': len(df), 'columns': columns}, handle)
+
+
+def load_frame(directory: str) -> pd.DataFrame:
+    """Read a frame written by save_frame; numeric and date columns stay memory-mapped (copy on write)"""
+    with open(os.path.join(directory, 'columns.json')) as handle:
+        layout = json.load(handle)
+    data = {}
+    for position, column in enumerate(layout['columns']):
+        path = os.path.join(directory, str(position))
+        if column['kind'] == 'array':
+            values = np.load(f"{path}.npy", mmap_mode='c')
+            data[position] = values.view(column['dtype']) if column['dtype'].startswith('datetime64') else values
+        elif column['kind'] == 'text':
+            # Code -1 (missing) picks the NaN appended after the vocabulary
+            uniques = np.array(_load_texts(path) + [np.nan], dtype=object)
+            data[position] = uniques[np.load(f"{path}.codes.npy", mmap_mode='c')]
+        else:
+            items = np.array(_load_texts(path), dtype=object)[np.load(f"{path}.codes.npy", mmap_mode='c')].tolist()
+            offsets = np.load(f"{path}.offsets.npy", mmap_mode='c').tolist()
+            values = np.empty(layout['rows'], dtype=object)
+            values[:] = [items[start:end] for start, end in zip(offsets, offsets[1:])]
+            data[position] = values
+    df = pd.DataFrame(data, index=pd.RangeIndex(layout['rows']), copy=False)
+    df.columns = [column['name'] for column in layout['columns']]
+    return df
+
+
+class DatasetCache:
+    """Preprocessed employee and project frames on disk, keyed by the version of the data they came from"""
+
+    def __init__(self, directory: Optional[str], max_entries: int = MAX_CACHED_DATASETS):
+        self.directory = directory or None
+        self.max_entries = max_entries
+        self.counters = {'hits': 0, 'misses': 0, 'stores': 0, 'skipped': 0}
+        self.lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"datasets_{key}")
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Entry key of a source version (file hashes, database origin and version)"""
+        return hashlib.sha256(json.dumps([CACHE_FORMAT, *parts], default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Cached (employees, projects) of a key, or None"""
+        if not self.directory:
+            return None
+        path = self._path(key)
+        frames = None
+        if os.path.isdir(path):
+            try:
+                frames = tuple(load_frame(os.path.join(path, name)) for name in FRAMES)
+                os.utime(path)  # recently used entries survive pruning
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable dataset cache {path}: {e}")
+        with self.lock:
+            self.counters['hits' if frames else 'misses'] += 1
+        return frames
+
+    def put(self, key: str, employees_df: pd.DataFrame, projects_df: pd.DataFrame) -> bool:
+        """Store both frames under a key; False when they can't be cached"""
+        if not self.directory:
+            return False
+        path = self._path(key)
+        # Written under a temporary name so a crash never leaves a partial entry
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            for name, df in zip(FRAMES, (employees_df, projects_df)):
+                save_frame(df, os.path.join(temporary, name))
+            if os.path.isdir(path):
+                shutil.rmtree(temporary)
+            else:
+                os.replace(temporary, path)
+            self.prune()
+        except (OSError, ValueError) as e:
+            shutil.rmtree(temporary, ignore_errors=True)
+            with self.lock:
+                self.counters['skipped'] += 1
+            logger.warning(f"Could not cache datasets in {self.directory}: {e}")
+            return False
+        with self.lock:
+            self.counters['stores'] += 1
+        return True
+
+    def prune(self):
+        """Delete all but the most recently used entries"""
+        entries = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                   if name.startswith('datasets_') and not name.endswith('.tmp')]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for path in entries[self.max_entries:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return dict(self.counters, directory=self.directory)
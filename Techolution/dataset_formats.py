@@ -0,0 +1,117 @@
+"""
+Dataset formats for AI-Driven Talent Management System
+Reads and writes employee and project files as CSV, gzip or zstd compressed CSV, Parquet or Feather
+"""
+
+import pandas as pd
+from typing import Dict, Iterator, Optional, Tuple
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Accepted file suffixes; compressed CSV is decompressed as it is read, Parquet and Feather are read column-wise
+FORMATS = ('.csv', '.csv.gz', '.csv.zst', '.parquet', '.feather')
+CSV_COMPRESSION = {'.csv': None, '.csv.gz': 'gzip', '.csv.zst': 'zstd'}
+
+# Package each format needs beyond pandas
+REQUIRED_PACKAGES = {'.csv.zst': 'zstandard', '.parquet': 'pyarrow', '.feather': 'pyarrow'}
+
+
+def dataset_format(filename: str) -> Optional[str]:
+    """Format suffix of a file name, or None when it is not an accepted format"""
+    name = filename.lower()
+    for suffix in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+def find_dataset(stem: str) -> Optional[str]:
+    """Existing file of a dataset stem (e.g. datasets/Employees) in the first accepted format, or None"""
+    for suffix in FORMATS:
+        if os.path.exists(stem + suffix):
+            return stem + suffix
+    return None
+
+
+def _format_of(path: str) -> str:
+    """Format suffix of a dataset file; ValueError for other files, or when the format's package is missing"""
+    suffix = dataset_format(path)
+    if suffix is None:
+        raise ValueError(f"Unsupported file format: {os.path.basename(path)} (use one of {', '.join(FORMATS)})")
+    _require(suffix)
+    return suffix
+
+
+def _require(suffix: str):
+    """Import the package a format needs; ValueError naming it when it is missing"""
+    package = REQUIRED_PACKAGES.get(suffix)
+    if package:
+        try:
+            __import__(package)
+        except ImportError:
+            raise ValueError(f"Reading or writing {suffix} files requires the {package} package")
+
+
+def _text(chunk: pd.DataFrame, dtype: Optional[Dict]) -> pd.DataFrame:
+    """Typed columns converted to text where a CSV read would have been told to keep text"""
+    for column in (dtype or {}):
+        if column in chunk.columns and chunk[column].dtype != object:
+            chunk[column] = chunk[column].astype(str).where(chunk[column].notna())
+    return chunk
+
+
+def read_chunks(path: str, chunk_rows: int, dtype: Optional[Dict] = None) -> Iterator[Tuple[pd.DataFrame, int, int]]:
+    """(chunk, bytes read, file size) of a dataset file, chunk_rows rows at a time, without loading all of it
+
+    CSV is parsed from a decompressing stream of the raw file; Parquet row groups and Feather record batches
+    are converted batch by batch. Bytes for the columnar formats are estimated from the rows converted.
+    """
+    suffix = _format_of(path)
+    size = os.path.getsize(path)
+    chunk_rows = max(1, chunk_rows)
+
+    if suffix in CSV_COMPRESSION:
+        with open(path, 'rb') as handle:
+            for chunk in pd.read_csv(handle, chunksize=chunk_rows, dtype=dtype, compression=CSV_COMPRESSION[suffix]):
+                yield chunk, handle.tell(), size
+        return
+
+    import pyarrow as pa
+    if suffix == '.parquet':
+        import pyarrow.parquet as pq
+        source = pq.ParquetFile(path)
+        total = source.metadata.num_rows
+        batches = source.iter_batches(batch_size=chunk_rows)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(path))
+        total = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    rows = 0
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunk_rows):
+            chunk = _text(batch.slice(start, chunk_rows).to_pandas(), dtype)
+            rows += len(chunk)
+            yield chunk, size * rows // total if total else size, size
+
+
+def read_frame(path: str, dtype: Optional[Dict] = None) -> pd.DataFrame:
+    """A whole dataset file as one DataFrame"""
+    suffix = _format_of(path)
+    if suffix in CSV_COMPRESSION:
+        return pd.read_csv(path, dtype=dtype, compression=CSV_COMPRESSION[suffix])
+    if suffix == '.parquet':
+        return _text(pd.read_parquet(path), dtype)
+    return _text(pd.read_feather(path), dtype)
+
+
+def write_frame(df: pd.DataFrame, path: str):
+    """Write a DataFrame in the format of the path's suffix"""
+    suffix = _format_of(path)
+    if suffix in CSV_COMPRESSION:
+        df.to_csv(path, index=False, compression=CSV_COMPRESSION[suffix])
+    elif suffix == '.parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path)
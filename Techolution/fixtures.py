@@ -0,0 +1,76 @@
+"""
+Test fixtures for AI-Driven Talent Management System
+Random employee and project datasets shared by the test scripts
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import numpy as np
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+import database
+from database import DatabaseManager
+
+# Matching runs in the tests are only persisted where a test points the database
+app.app.config['MATCHING_HISTORY'] = False
+
+
+def scratch_database(name='talent_management.db'):
+    """An empty database in a new temporary directory"""
+    return DatabaseManager(os.path.join(tempfile.mkdtemp(), name))
+
+
+# The tests never write to the bundled talent_management.db; tests that load data swap in one of their own
+database.db_manager = scratch_database()
+
+
+def make_datasets(num_employees=120, num_projects=12, seed=7):
+    """Create random datasets covering the edge cases of the scoring functions"""
+    rng = random.Random(seed)
+    skills = ['Backend Developer', 'Python Developer', 'Project Manager', 'AI', 'UI/UX', 'FSD',
+              'Data Science', 'Machine Learning', 'DevOps', 'Cloud Computing', 'React Native', 'ml']
+    employees = []
+    for i in range(num_employees):
+        emp_skills = ', '.join(rng.sample(skills, rng.randint(1, 3))) if rng.random() > 0.05 else ''
+        employees.append({
+            'Emp ID': f"E{i + 1:03d}",
+            'Name': f"Employee {i + 1}",
+            'Skills': emp_skills,
+            'Role': rng.choice(['Intern', 'Full Time', 'Senior']),
+            'Capacity per week (hrs)': rng.choice([10, 20, 35, 40, 45, np.nan]),
+            'Previous Project Description': rng.choice(['Chatbot', 'E-commerce backend', 'Dashboard']),
+            'Proficiency': rng.choice(['Beginner', 'Intermediate', 'Senior', 'Expert']),
+            'Available Date': rng.choice(['2025-09-01', '2025-10-20', '2025-11-15', '2026-01-05', None]),
+            'Location': rng.choice(['India', 'USA'])
+        })
+    domains = ['AI', 'AI/ML', 'FSD', 'Web Development', 'Backend Developer', 'UI/UX', 'Data Science',
+               'Cloud Computing, DevOps', 'E-commerce', '']
+    projects = []
+    for i in range(num_projects):
+        projects.append({
+            'ID': f"PROJ_{i + 1:03d}",
+            'Project_Title': f"Project {i + 1}",
+            'Domain': domains[i % len(domains)],
+            'Eligibility': 'All',
+            'Duration': '3 months',
+            'Proficiency': rng.choice(['Beginner', 'Intermediate', 'Senior', 'High']),
+            'Conflicts': rng.choice(['None', 'E001, E012', 'Overlaps with E1', np.nan]),
+            'Hard_Deadline': rng.choice(['2025-10-01', '2025-11-30', None]),
+            'Experience_years': rng.randint(0, 3)
+        })
+    return pd.DataFrame(employees), pd.DataFrame(projects)
+
+
+def run_both(employees_df, projects_df):
+    """Run the engine and the reference loop on the same datasets"""
+    app.employees_df = employees_df.copy()
+    app.projects_df = projects_df.copy()
+    app.preprocess_data()
+    reference = app.perform_matching_reference()
+    engine = app.perform_matching()
+    return json.dumps(reference, default=str), json.dumps(engine, default=str)
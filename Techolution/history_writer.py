@@ -0,0 +1,82 @@
+"""
+History writer for AI-Driven Talent Management System
+Persists the scored pairs of matching runs from a background thread, so requests never wait on SQLite
+"""
+
+from queue import Full, Queue
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Runs waiting to be written; further runs are dropped (and counted) while the queue is full
+DEFAULT_QUEUE_SIZE = 8
+
+
+class HistoryWriter:
+    """Queue of (run id, pairs) written by one daemon thread through DatabaseManager.save_matching_run"""
+
+    def __init__(self, get_db: Callable, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.get_db = get_db
+        self.queue: Queue = Queue(maxsize=max(1, queue_size))
+        self.counters = {'runs': 0, 'rows': 0, 'dropped': 0, 'failed': 0, 'seconds': 0.0}
+        self.last_run: Optional[str] = None
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def submit(self, run_id: str, pairs: Iterable[Tuple]) -> bool:
+        """Queue a run's pairs without blocking; False when the queue is full"""
+        self._start()
+        try:
+            self.queue.put_nowait((run_id, pairs))
+            return True
+        except Full:
+            with self.lock:
+                self.counters['dropped'] += 1
+            logger.warning(f"Matching history queue is full, run {run_id} is not persisted")
+            return False
+
+    def _start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._work, name='history-writer', daemon=True)
+                self.thread.start()
+
+    def _work(self):
+        while True:
+            run_id, pairs = self.queue.get()
+            try:
+                started = time.time()
+                rows = self.get_db().save_matching_run(run_id, pairs)
+                elapsed = time.time() - started
+                with self.lock:
+                    self.counters['runs'] += 1
+                    self.counters['rows'] += rows
+                    self.counters['seconds'] += elapsed
+                    self.last_run = run_id
+                logger.info(f"Persisted {rows} scored pairs of matching run {run_id} in {elapsed:.2f}s")
+            except Exception:
+                with self.lock:
+                    self.counters['failed'] += 1
+                logger.exception(f"Could not persist matching run {run_id}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued run is written; False when the timeout passes first"""
+        deadline = None if timeout is None else time.time() + timeout
+        while self.queue.unfinished_tasks:
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self) -> Dict:
+        """Write counters and throughput"""
+        with self.lock:
+            seconds = self.counters['seconds']
+            return dict(self.counters, seconds=round(seconds, 3), pending=self.queue.qsize(),
+                        last_run=self.last_run,
+                        rows_per_second=round(self.counters['rows'] / seconds) if seconds else 0)
@@ -0,0 +1,377 @@
+"""
+Incremental matching for AI-Driven Talent Management System
+Keeps the score matrix and teams of a matching run and updates them as rows change
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import logging
+from matching_engine import MatchingEngine, INELIGIBLE_SCORE
+from ann_index import DEFAULT_CANDIDATES
+from compact_results import CompactResults, EmployeeTable, PackedProject
+from parallel_matching import score_parallel, DEFAULT_SHORTLIST_LENGTH
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalMatcher:
+    """Matching run whose results are patched when employees or projects change"""
+
+    def __init__(self, engine: MatchingEngine, team_builder: Callable):
+        """Wrap an engine; team_builder has the signature of create_intelligent_team"""
+        self.engine = engine
+        self.team_builder = team_builder
+        self.overall: Optional[np.ndarray] = None
+        self.overall_buffer: Optional[np.ndarray] = None  # Spare rows and columns overall grows into
+        # Approximate runs keep (candidates, overall scores) per project instead of the overall matrix
+        self.sparse: Optional[List[Optional[Tuple[np.ndarray, np.ndarray]]]] = None
+        self.list_length = DEFAULT_CANDIDATES
+        self.stats = {'pairs': 0, 'scored': 0, 'pruned': 0, 'ineligible': 0}  # Work saved by the indexes
+        self.candidates: List[Set[int]] = []
+        self.pools: List[List] = []
+        self.teams: List[List[str]] = []
+        self.project_results: List[Optional[PackedProject]] = []  # Packed per project; dicts are built when read
+        self.employee_table = EmployeeTable()
+        self.scored_rows: Optional[int] = None  # Rows of overall filled so far while scoring lazily, None when all are
+        self.search: Optional[Callable] = None
+        self.pruning = False
+
+    def score(self, workers: int = 1, shortlist_length: int = DEFAULT_SHORTLIST_LENGTH,
+              prune: bool = False, ann: Optional[Dict] = None) -> Optional[List]:
+        """Compute and cache the overall score matrix (and pool leaders when run in parallel)
+
+        ann holds approximate search knobs (clusters, probes, candidates); when set, only the top
+        candidates of a clustered index are scored and kept (sparse), and teams are built from them
+        alone. Such runs stay in this process: their work follows the candidates, not the roster.
+        """
+        engine = self.engine
+        if workers > 1 and engine.num_projects > 1 and ann is None:
+            # Workers score project shards and list each pool's leaders; teams are still
+            # assembled here in project order so exclusivity matches the serial run. The
+            # candidates of a pruned run are picked here and scored there
+            self._start_scoring(prune, ann)
+            groups = engine.candidate_index().groups(self.search) if self.pruning else None
+            self.overall, prepared, counts = score_parallel(engine, workers, length=shortlist_length, groups=groups)
+            self.overall_buffer = self.overall
+            self.scored_rows = None
+            self.stats.update(scored=counts['scored'], pruned=self.stats['pairs'] - counts['scored'],
+                              ineligible=counts['ineligible'])
+            if self.pruning:
+                logger.info(f"Candidate index pruned {self.stats['pruned']} of {self.stats['pairs']} project-employee pairs")
+            return prepared
+
+        self._start_scoring(prune, ann)
+        if self.pruning and self.sparse is None:
+            # Projects with the same requirements across the whole portfolio are scored together
+            self._score_candidates()
+            self.scored_rows = None
+        else:
+            self._score_until(engine.num_projects)
+        return None
+
+    def _start_scoring(self, prune: bool, ann: Optional[Dict]):
+        """Reset the overall matrix (or candidate lists) and stats; rows are filled by _score_candidates or _score_until"""
+        engine = self.engine
+        pairs = engine.num_projects * engine.num_employees
+        self.pruning = prune or ann is not None
+        self.stats = {'pairs': pairs, 'scored': 0 if self.pruning else pairs, 'pruned': 0, 'ineligible': 0}
+        self.scored_rows = 0
+        self.search = None
+        if ann is None:
+            self.sparse = None
+            self.overall = np.empty((engine.num_projects, engine.num_employees))
+            self.overall_buffer = self.overall
+        else:
+            self.sparse = [None] * engine.num_projects
+            self.overall = self.overall_buffer = None
+            ann = dict(ann)
+            self.list_length = ann.get('candidates', DEFAULT_CANDIDATES)
+            clustered = engine.ann_index(ann.pop('clusters', 0))
+
+            def search(p):
+                return clustered.search(p, **ann)
+            self.search = search
+
+    def _score_until(self, stop: int):
+        """Score project rows up to stop (exclusive) a block at a time, so team assembly can start early"""
+        engine = self.engine
+        step = engine.block_size() if self.sparse is None else max(1, engine.block_cells // max(1, self.list_length))
+        while self.scored_rows is not None and self.scored_rows < stop:
+            start = self.scored_rows
+            end = min(engine.num_projects, start + step)
+            if self.sparse is not None:
+                self.stats['scored'] += self._score_lists(np.arange(start, end))
+                self.stats['pruned'] = self.stats['pairs'] - self.stats['scored']
+            elif self.pruning:
+                self._score_candidates(np.arange(start, end))
+            else:
+                self.overall[start:end] = engine.score_block(start, end)['overall']
+            self.scored_rows = end if end < engine.num_projects else None
+
+    def _score_candidates(self, projects: Optional[np.ndarray] = None):
+        """Fully score only the employees the candidate index (or the ANN index) lists for each project"""
+        engine = self.engine
+        index = engine.candidate_index()
+        scored = 0
+
+        # Projects with the same requirements share their candidates, so they are scored together
+        for rows, columns in index.groups(self.search, projects):
+            group_scored, ruled_out = index.score_group(rows, columns, self.overall)
+            scored += group_scored
+            self.stats['ineligible'] += ruled_out
+
+        self.stats['scored'] += scored
+        self.stats['pruned'] = self.stats['pairs'] - self.stats['scored']
+        if projects is None or projects[-1] == engine.num_projects - 1:
+            logger.info(f"Candidate index pruned {self.stats['pruned']} of {self.stats['pairs']} project-employee pairs")
+
+    def _score_lists(self, projects: np.ndarray) -> int:
+        """Score only the approximate candidates of these projects, kept as their sparse rows; returns the pairs scored"""
+        engine = self.engine
+        scored = 0
+        for rows, columns in engine.candidate_index().groups(self.search, projects):
+            step = max(1, engine.block_cells // max(1, len(columns)))
+            for start in range(0, len(rows), step):
+                block = rows[start:start + step]
+                overall = engine.score_rows(block, columns)['overall'] if len(columns) else np.empty((len(block), 0))
+                for offset, p in enumerate(block.tolist()):
+                    self.sparse[p] = (columns, overall[offset])
+            scored += len(rows) * len(columns)
+        return scored
+
+    def dense_overall(self) -> np.ndarray:
+        """Overall score matrix; for approximate runs built from the candidate lists, with everyone else ineligible"""
+        if self.sparse is None:
+            return self.overall
+        overall = np.full((self.engine.num_projects, self.engine.num_employees), INELIGIBLE_SCORE)
+        for p, (columns, row) in enumerate(self.sparse):
+            overall[p, columns] = row
+        return overall
+
+    def run(self, workers: int = 1, shortlist_length: int = DEFAULT_SHORTLIST_LENGTH,
+            prune: bool = False, ann: Optional[Dict] = None,
+            progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """Full matching run, caching the overall score matrix; progress(done, total) follows the projects"""
+        prepared = self.score(workers, shortlist_length, prune, ann)
+        self._reset_teams()
+        self._walk(set(range(self.engine.num_projects)), set(), prepared, progress)
+        return list(self.results())
+
+    def stream(self, workers: int = 1, shortlist_length: int = DEFAULT_SHORTLIST_LENGTH,
+               prune: bool = False, ann: Optional[Dict] = None,
+               progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Dict]:
+        """Full matching run that yields each project's result as soon as its team is built
+
+        Serial runs score one block of projects ahead of team assembly, so the first result does not
+        wait for the rest of the portfolio; parallel runs score everything first, as run() does.
+        """
+        engine = self.engine
+        prepared = None
+        if workers > 1 and engine.num_projects > 1 and ann is None:
+            prepared = self.score(workers, shortlist_length, prune, ann)
+        else:
+            self._start_scoring(prune, ann)
+        self._reset_teams()
+        for p, _ in self._iter_walk(set(range(engine.num_projects)), set(), prepared, progress):
+            yield self.employee_table.unpack(self.project_results[p])
+        self._score_until(engine.num_projects)  # inactive trailing rows, so later updates find a full matrix
+
+    def _reset_teams(self):
+        engine = self.engine
+        self.candidates = [set() for _ in range(engine.num_projects)]
+        self.pools = [[] for _ in range(engine.num_projects)]
+        self.teams = [[] for _ in range(engine.num_projects)]
+        self.project_results = [None] * engine.num_projects
+
+    def results(self) -> CompactResults:
+        """Results of all active projects, in project order"""
+        return CompactResults([result for result in self.project_results if result is not None], self.employee_table)
+
+    def _match_project(self, p: int, used_mask: np.ndarray, used_ids: Set[str], prepared: Optional[Tuple] = None):
+        """Select candidates, score them and build the team for one project"""
+        engine = self.engine
+        shortlists, scores = prepared if prepared is not None else (None, None)
+        pools = []
+        if self.sparse is None:
+            candidates = engine.select_candidates(self.overall[p], p, used_mask, pools_out=pools, shortlists=shortlists)
+        else:
+            columns, overall = self.sparse[p]
+            candidates = engine.select_candidates(overall, p, used_mask, pools_out=pools, columns=columns)
+
+        # Component scores are only needed for the candidates
+        if scores is None or not np.isin(candidates, scores['columns']).all():
+            scores = engine.score_block(p, p + 1, columns=candidates)
+        info = engine.proj_info[p]
+        project_matches = engine.build_matches(scores, 0, candidates,
+                                               str(info['project_id']), str(info['project_title']))
+
+        intelligent_recommendations = self.team_builder(project_matches, info['project_domain'], used_ids)
+
+        self.candidates[p] = set(candidates.tolist())
+        self.pools[p] = pools
+        self.teams[p] = [rec['employee_id'] for rec in intelligent_recommendations]
+        self.project_results[p] = self.employee_table.pack(dict(info, **{
+            'matches': project_matches[:10],  # Top 10 matches
+            'top_3': intelligent_recommendations[:3],  # Intelligent top 3 recommendations
+            'intelligent_team': intelligent_recommendations[:5]  # Full intelligent team
+        }))
+
+    def _affected(self, p: int, changed: Set[int], used_mask: np.ndarray) -> bool:
+        """Whether a change to these employees can alter the project's candidate pools"""
+        engine = self.engine
+        if not self.candidates[p].isdisjoint(changed):
+            return True
+
+        for e in changed:
+            if not engine.emp_active[e]:
+                continue
+            if self.sparse is None:
+                score = self.overall[p, e]
+            else:
+                # Only listed employees can enter an approximate run's pools
+                columns, overall = self.sparse[p]
+                position = int(np.searchsorted(columns, e))
+                if position == len(columns) or columns[position] != e:
+                    continue
+                score = overall[position]
+            key = round(float(score) * 100, 2)
+            for kind, arg, threshold in self.pools[p]:
+                if kind != 'top' and used_mask[e]:
+                    continue
+                if (threshold is None or key >= threshold) and engine.pool_accepts(kind, arg, p, e):
+                    return True
+        return False
+
+    def _walk(self, dirty_projects: Set[int], changed: Set[int], prepared: Optional[List] = None,
+              progress: Optional[Callable[[int, int], None]] = None) -> List:
+        """Re-run team assembly in project order wherever the change can reach; returns re-matched project ids"""
+        return [self.engine.proj_info[p]['project_id']
+                for p, rematched in self._iter_walk(dirty_projects, changed, prepared, progress) if rematched]
+
+    def _iter_walk(self, dirty_projects: Set[int], changed: Set[int], prepared: Optional[List] = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Tuple[int, bool]]:
+        """Walk the active projects in order, yielding (project, re-matched) once each one is settled"""
+        engine = self.engine
+        total = int(engine.proj_active.sum())
+        done = 0
+        used_mask = np.zeros(engine.num_employees, dtype=bool)
+        used_ids: Set[str] = set()
+        changed = set(changed)
+
+        for p in range(engine.num_projects):
+            if not engine.proj_active[p]:
+                continue
+
+            rematched = p in dirty_projects or bool(changed and self._affected(p, changed, used_mask))
+            if rematched:
+                previous = set(self.teams[p])
+                self._score_until(p + 1)
+                self._match_project(p, used_mask, used_ids, prepared[p] if prepared is not None else None)
+
+                # Employees joining or leaving this team change availability downstream
+                for emp_id in previous.symmetric_difference(self.teams[p]):
+                    changed.update(engine.emp_index_by_id.get(emp_id, []))
+            else:
+                used_ids.update(self.teams[p])
+
+            engine.mark_used(used_mask, self.teams[p])
+            done += 1
+            if progress is not None:
+                progress(done, total)
+            yield p, rematched
+
+    def _free_team(self, p: int) -> Set[int]:
+        """Employee rows of a project's team, which become available again"""
+        freed = set()
+        for emp_id in self.teams[p]:
+            freed.update(self.engine.emp_index_by_id.get(emp_id, []))
+        return freed
+
+    def _resize_overall(self):
+        """Fit overall to the engine's rows, doubling its buffer when full so appends copy it amortized O(1) times"""
+        engine = self.engine
+        shape = (engine.num_projects, engine.num_employees)
+        capacity = self.overall_buffer.shape
+        if shape[0] > capacity[0] or shape[1] > capacity[1]:
+            buffer = np.zeros(tuple(size if size <= spare else max(size, 2 * spare)
+                                    for size, spare in zip(shape, capacity)))
+            buffer[:self.overall.shape[0], :self.overall.shape[1]] = self.overall
+            self.overall_buffer = buffer
+        self.overall = self.overall_buffer[:shape[0], :shape[1]]
+
+    def upsert_employee(self, employee_df: pd.DataFrame) -> List:
+        """Add or replace one employee (a single-row DataFrame) and return re-matched project ids"""
+        engine = self.engine
+        emp_id = str(employee_df['Emp ID'].iloc[0])
+        index = engine.employee_index(emp_id)
+        if index is None:
+            index = engine.append_employees(employee_df)[0]
+            if self.sparse is None:
+                self._resize_overall()
+        else:
+            engine.update_employee(index, employee_df)
+
+        scores = engine.score_block(0, engine.num_projects, columns=[index])['overall'][:, 0]
+        if self.sparse is None:
+            self.overall[:, index] = scores
+        else:
+            self._relist_employee(index, scores)
+        return self._walk(set(), {index})
+
+    def _relist_employee(self, index: int, scores: np.ndarray):
+        """Place an employee in the candidate lists their new scores reach (the list's lowest, or a free place)"""
+        for p, (columns, overall) in enumerate(self.sparse):
+            position = int(np.searchsorted(columns, index))
+            if position < len(columns) and columns[position] == index:
+                columns, overall = np.delete(columns, position), np.delete(overall, position)
+            elif not np.isfinite(scores[p]):
+                continue
+            if np.isfinite(scores[p]) and (len(columns) < self.list_length or scores[p] >= overall.min()):
+                columns, overall = np.insert(columns, position, index), np.insert(overall, position, scores[p])
+            self.sparse[p] = (columns, overall)
+
+    def delete_employee(self, emp_id: str) -> List:
+        """Remove one employee and return re-matched project ids"""
+        engine = self.engine
+        index = engine.employee_index(emp_id)
+        if index is None:
+            raise KeyError(emp_id)
+        engine.remove_employee(index)
+        return self._walk(set(), {index})
+
+    def upsert_project(self, project_df: pd.DataFrame) -> List:
+        """Add or replace one project (a single-row DataFrame) and return re-matched project ids"""
+        engine = self.engine
+        project_id = project_df['ID'].iloc[0]
+        index = engine.project_index(project_id)
+        if index is None:
+            index = engine.append_projects(project_df)[0]
+            if self.sparse is None:
+                self._resize_overall()
+            else:
+                self.sparse.append(None)
+            self.candidates.append(set())
+            self.pools.append([])
+            self.teams.append([])
+            self.project_results.append(None)
+        else:
+            engine.update_project(index, project_df)
+
+        if self.sparse is None:
+            self.overall[index] = engine.score_block(index, index + 1)['overall'][0]
+        else:
+            self._score_lists(np.array([index]))
+        return self._walk({index}, set())
+
+    def delete_project(self, project_id) -> List:
+        """Remove one project, freeing its team, and return re-matched project ids"""
+        engine = self.engine
+        index = engine.project_index(project_id)
+        if index is None:
+            raise KeyError(project_id)
+        engine.remove_project(index)
+        freed = self._free_team(index)
+        self.teams[index] = []
+        self.project_results[index] = None
+        return self._walk(set(), freed)
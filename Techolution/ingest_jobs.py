@@ -0,0 +1,117 @@
+"""
+Ingest jobs for AI-Driven Talent Management System
+Streams uploaded files into the database in the background and keeps recent ingestions for progress polling
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import logging
+import threading
+import uuid
+
+from matching_jobs import QUEUED, RUNNING, DONE, FAILED, DEFAULT_RETAINED_JOBS
+
+logger = logging.getLogger(__name__)
+
+
+class IngestJob:
+    """State, per-file progress and sync summary of one upload ingestion"""
+
+    def __init__(self, files: Dict[str, str]):
+        self.id = uuid.uuid4().hex
+        self.files = files  # table -> uploaded file
+        self.state = QUEUED
+        self.rows = {table: 0 for table in files}
+        self.bytes = {table: [0, 0] for table in files}  # read, size
+        self.summary: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.created = datetime.now()
+        self.started: Optional[datetime] = None
+        self.finished: Optional[datetime] = None
+
+    def progress(self, table: str, rows: int, done: int, size: int):
+        """Record the rows and bytes of a file streamed so far; the first report marks the job as running"""
+        if self.state == QUEUED:
+            self.state = RUNNING
+            self.started = datetime.now()
+        self.rows[table] = rows
+        self.bytes[table] = [done, size]
+
+    @property
+    def percent(self) -> float:
+        if self.state == DONE:
+            return 100.0
+        size = sum(size for _, size in self.bytes.values())
+        return round(100.0 * sum(done for done, _ in self.bytes.values()) / size, 1) if size else 0.0
+
+    def describe(self) -> Dict:
+        """JSON-ready view of the job"""
+        info = {
+            'job_id': self.id,
+            'tables': list(self.files),
+            'state': self.state,
+            'percent': self.percent,
+            'rows': dict(self.rows),
+            'created': self.created.isoformat(),
+            'started': self.started.isoformat() if self.started else None,
+            'finished': self.finished.isoformat() if self.finished else None
+        }
+        if self.state == FAILED:
+            info['error'] = self.error
+        if self.state == DONE:
+            info['sync'] = self.summary
+        return info
+
+
+class IngestManager:
+    """Runs ingestions one at a time on a worker thread and retains a bounded number of finished jobs"""
+
+    def __init__(self, run: Callable, retained: int = DEFAULT_RETAINED_JOBS):
+        """run has the signature run(files, progress) and returns the sync summary ({} when it failed)"""
+        self.run = run
+        self.retained = max(1, retained)
+        # One writer at a time: concurrent syncs would only wait on each other's transactions
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ingest-job')
+        self.jobs: 'OrderedDict[str, IngestJob]' = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, files: Dict[str, str]) -> IngestJob:
+        """Queue the ingestion of uploaded files and return its job right away"""
+        job = IngestJob(files)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._evict()
+        self.executor.submit(self._execute, job)
+        return job
+
+    def _execute(self, job: IngestJob):
+        try:
+            summary = self.run(job.files, job.progress)
+            if summary:
+                job.summary, state = summary, DONE
+            else:
+                job.error, state = "Syncing the uploaded files into the database failed", FAILED
+        except Exception as e:
+            logger.exception(f"Ingest job {job.id} failed")
+            job.error, state = str(e), FAILED
+        job.finished = datetime.now()
+        job.state = state  # set last, so pollers never see a finished job without its outcome
+        with self.lock:
+            self._evict()
+
+    def _evict(self):
+        """Forget the oldest finished jobs beyond the retention limit (queued and running jobs stay)"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.state in (DONE, FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.retained)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[IngestJob]:
+        """All retained jobs, oldest first"""
+        with self.lock:
+            return list(self.jobs.values())
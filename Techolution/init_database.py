@@ -9,6 +9,7 @@ import pandas as pd
 from datetime import datetime
 import logging
 from database import DatabaseManager
+from dataset_formats import find_dataset, read_frame
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,21 +24,21 @@ def initialize_database():
         db_manager = DatabaseManager()
         logger.info("✅ Database manager initialized")
         
-        # Check if CSV files exist
-        employees_csv_path = 'datasets/Employees.csv'
-        projects_csv_path = 'datasets/Projects.csv'
+        # Check if dataset files exist (CSV, .csv.gz, .csv.zst, .parquet or .feather)
+        employees_csv_path = find_dataset('datasets/Employees')
+        projects_csv_path = find_dataset('datasets/Projects')
         
-        employees_exists = os.path.exists(employees_csv_path)
-        projects_exists = os.path.exists(projects_csv_path)
+        employees_exists = employees_csv_path is not None
+        projects_exists = projects_csv_path is not None
         
-        logger.info(f"📁 Employees CSV exists: {employees_exists}")
-        logger.info(f"📁 Projects CSV exists: {projects_exists}")
+        logger.info(f"📁 Employees file: {employees_csv_path or 'not found'}")
+        logger.info(f"📁 Projects file: {projects_csv_path or 'not found'}")
         
         # Migrate employees data
         if employees_exists:
             logger.info("📊 Migrating employees data...")
             try:
-                employees_df = pd.read_csv(employees_csv_path)
+                employees_df = read_frame(employees_csv_path)
                 logger.info(f"📋 Loaded {len(employees_df)} employee records")
                 
                 # Clean and validate data
@@ -51,13 +52,13 @@ def initialize_database():
                 logger.error(f"❌ Error migrating employees: {e}")
                 return False
         else:
-            logger.warning("⚠️ No employees CSV found, skipping employees migration")
+            logger.warning("⚠️ No employees file found, skipping employees migration")
         
         # Migrate projects data
         if projects_exists:
             logger.info("📊 Migrating projects data...")
             try:
-                projects_df = pd.read_csv(projects_csv_path)
+                projects_df = read_frame(projects_csv_path)
                 logger.info(f"📋 Loaded {len(projects_df)} project records")
                 
                 # Clean and validate data
@@ -71,7 +72,7 @@ def initialize_database():
                 logger.error(f"❌ Error migrating projects: {e}")
                 return False
         else:
-            logger.warning("⚠️ No projects CSV found, skipping projects migration")
+            logger.warning("⚠️ No projects file found, skipping projects migration")
         
         # Get database statistics
         stats = db_manager.get_database_stats()
@@ -223,9 +224,13 @@ def main():
             success = reset_database()
         elif command == 'sample':
             success = create_sample_data()
+        elif command == 'sync':
+            # Only rows changed since the last import are written
+            from migrate_data import sync_csv_to_database
+            success = bool(sync_csv_to_database())
         else:
             print(f"❌ Unknown command: {command}")
-            print("Available commands: reset, sample")
+            print("Available commands: reset, sample, sync")
             success = False
     else:
         # Default: initialize database
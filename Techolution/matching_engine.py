@@ -0,0 +1,848 @@
+"""
+Matching engine for AI-Driven Talent Management System
+Computes project x employee component scores as NumPy matrices
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+from taxonomy import DomainTaxonomy
+from semantic import TextModel, employee_text, project_text
+
+logger = logging.getLogger(__name__)
+
+PROFICIENCY_LEVELS = {'Beginner': 1, 'Intermediate': 2, 'Senior': 3}
+
+REQUIRED_CAPACITY = 40
+NS_PER_DAY = 86_400_000_000_000
+
+# Target number of cells per scored block (projects x employees)
+DEFAULT_BLOCK_CELLS = 2_000_000
+
+# Matches returned per project, and candidates kept per team-builder pool
+DEFAULT_TOP_K = 10
+TEAM_POOL_SIZE = 10
+
+# Team-builder proficiency slots, in pick order
+PROFICIENCY_SLOTS = ['Senior', 'Intermediate', 'Beginner']
+
+# Team size used when a project has no Team_Size column
+DEFAULT_TEAM_SIZE = 5
+
+# np.round can differ from Python's round() by one step of 0.01
+ROUNDING_MARGIN = 0.025
+
+NAT_NS = np.iinfo(np.int64).min
+
+# Overall score of pairs a hard constraint rules out; never picked and never a solver edge
+INELIGIBLE_SCORE = -np.inf
+
+# Per-row engine attributes, kept aligned so rows can be appended or replaced
+EMPLOYEE_LIST_FIELDS = (
+    'emp_ids', 'emp_names', 'emp_roles', 'emp_locations', 'emp_proficiency_raw',
+    'emp_proficiency', 'emp_skills', 'emp_capacity', 'emp_texts'
+)
+EMPLOYEE_ARRAY_FIELDS = (
+    'emp_slot', 'emp_empty', 'capacity_scores', 'emp_hours', 'emp_levels', 'emp_available_ns', 'emp_available_nat',
+    'emp_experience', 'emp_domain_mask', 'emp_role_mask', 'emp_scoring_mask', 'emp_domain_counts', 'emp_active'
+)
+PROJECT_LIST_FIELDS = (
+    'proj_info', 'proj_domains', 'proj_tokens', 'proj_conflicts', 'proj_eligibility', 'proj_locations', 'proj_texts'
+)
+PROJECT_ARRAY_FIELDS = (
+    'proj_empty', 'proj_domain_hits', 'proj_domain_key', 'proj_team_domain', 'proj_levels',
+    'proj_deadline_ns', 'proj_deadline_nat', 'proj_team_size', 'proj_demand_hours', 'proj_experience', 'proj_active'
+)
+
+
+def employee_skills_list(employee) -> List[str]:
+    """Extract the cleaned skills list from an employee row"""
+    emp_skills_raw = employee.get('Skills_List', [])
+    if not isinstance(emp_skills_raw, list) or not emp_skills_raw:
+        emp_skills_raw = employee.get('Skills', '')
+        if emp_skills_raw and not pd.isna(emp_skills_raw):
+            return [skill.strip() for skill in str(emp_skills_raw).split(',') if skill.strip()]
+        return []
+    return [str(skill).strip() for skill in emp_skills_raw if skill and str(skill).strip()]
+
+
+def _column(df: pd.DataFrame, name: str, default) -> list:
+    """Get a column as a list of Python values, falling back to a default"""
+    if name in df.columns:
+        return df[name].tolist()
+    return [default] * len(df)
+
+
+def _is_missing(value) -> bool:
+    """Return True for empty or NaN-like scalar values"""
+    try:
+        return not value or bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _to_nanoseconds(values) -> np.ndarray:
+    """Convert date-like values to int64 nanoseconds (NaT stays as NaT)"""
+    return pd.to_datetime(pd.Series(values, dtype=object), errors='coerce').values.astype('datetime64[ns]').astype(np.int64)
+
+
+def _date_nanoseconds(df: pd.DataFrame, name: str, default) -> np.ndarray:
+    """A date column as int64 nanoseconds, read straight from columns that are already parsed"""
+    if name in df.columns and df[name].dtype == 'datetime64[ns]':
+        return df[name].to_numpy().view(np.int64).copy()
+    return _to_nanoseconds(_column(df, name, default))
+
+
+def _round_score(value: float, is_int: bool = False):
+    """Round a 0-1 score to a percentage the same way the per-pair path does"""
+    if is_int:
+        return round(int(value) * 100, 2)
+    return round(value * 100, 2)
+
+
+def split_tokens(value) -> set:
+    """Split a comma-separated requirement string into a set of stripped tokens"""
+    return set(token.strip() for token in str(value).split(',') if token.strip())
+
+
+class SkillVocabulary:
+    """Mapping of distinct skill names to sparse matrix columns"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, skills: Iterable[str]):
+        """Register skills that are not in the vocabulary yet"""
+        for skill in skills:
+            if skill not in self.index:
+                self.index[skill] = len(self.index)
+
+    def incidence_matrix(self, skill_sets: List[Iterable[str]]) -> sparse.csr_matrix:
+        """Build a binary CSR matrix with one row per skill set"""
+        indptr = [0]
+        indices = []
+        for skills in skill_sets:
+            indices.extend(sorted(self.index[skill] for skill in set(skills)))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return sparse.csr_matrix(
+            (data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(skill_sets), len(self.index))
+        )
+
+
+class MatchingEngine:
+    """Batched scoring of every project against every employee"""
+
+    def __init__(self, employees_df: pd.DataFrame, projects_df: pd.DataFrame,
+                 taxonomy: Optional[DomainTaxonomy] = None, block_cells: int = DEFAULT_BLOCK_CELLS,
+                 constraints: Optional[List[type]] = None, semantic_weight: float = 0.0,
+                 text_cache_dir: Optional[str] = None):
+        """Precompute employee and project arrays for one dataset load"""
+        self.taxonomy = taxonomy if taxonomy is not None else DomainTaxonomy.load()
+        self.block_cells = block_cells
+        self.constraints = constraints  # HardConstraint classes, None for the defaults
+        self.semantic_weight = float(semantic_weight)  # weight of the TF-IDF cosine in the overall score
+        self.domain_names = self.taxonomy.scoring_names
+
+        for name, values in self._employee_columns(employees_df).items():
+            setattr(self, name, values)
+        for name, values in self._project_columns(projects_df).items():
+            setattr(self, name, values)
+
+        # Employee indices keyed by id string for conflict lookups
+        self.emp_index_by_id: Dict[str, List[int]] = {}
+        self.emp_id_lengths: List[int] = []
+        self._index_employee_ids(range(self.num_employees))
+
+        self._prepare_skill_matrices()
+        self._prepare_text_matrices(text_cache_dir)
+        self._rows_changed()
+        logger.info(f"Matching engine ready: {self.num_projects} projects x {self.num_employees} employees")
+
+    @property
+    def num_employees(self) -> int:
+        return len(self.emp_ids)
+
+    @property
+    def num_projects(self) -> int:
+        return len(self.proj_domains)
+
+    def _employee_columns(self, df: pd.DataFrame) -> Dict:
+        """Build per-employee attribute columns for the rows of a DataFrame"""
+        columns = {}
+        if 'Emp ID' in df.columns:
+            raw_ids = df['Emp ID'].tolist()
+        else:
+            raw_ids = [f"Emp_{label}" for label in df.index]
+
+        columns['emp_ids'] = [str(emp_id) for emp_id in raw_ids]
+        columns['emp_names'] = [str(name) for name in _column(df, 'Name', 'Unknown')]
+        columns['emp_roles'] = [str(role) for role in _column(df, 'Role', '')]
+        columns['emp_locations'] = [str(location) for location in _column(df, 'Location', '')]
+        proficiency_raw = _column(df, 'Proficiency', 'Intermediate')
+        columns['emp_proficiency_raw'] = proficiency_raw
+        columns['emp_proficiency'] = [str(proficiency) for proficiency in proficiency_raw]
+        columns['emp_slot'] = np.array(
+            [PROFICIENCY_SLOTS.index(proficiency) if proficiency in PROFICIENCY_SLOTS else len(PROFICIENCY_SLOTS)
+             for proficiency in columns['emp_proficiency']],
+            dtype=np.int64
+        )
+
+        # Skills as cleaned lists, one per employee
+        skills_lists = _column(df, 'Skills_List', [])
+        skills_raw = _column(df, 'Skills', '')
+        skills = [
+            employee_skills_list({'Skills_List': skills_list, 'Skills': raw})
+            for skills_list, raw in zip(skills_lists, skills_raw)
+        ]
+        columns['emp_skills'] = skills
+        columns['emp_empty'] = np.array([not emp_skills for emp_skills in skills], dtype=bool)
+
+        # Capacity keeps the original value type for the JSON payload
+        capacities = []
+        for capacity in _column(df, 'Capacity per week (hrs)', 40):
+            try:
+                capacities.append(float(capacity) if not pd.isna(capacity) else 40)
+            except (ValueError, TypeError):
+                capacities.append(40)
+        columns['emp_capacity'] = capacities
+        columns['emp_hours'] = np.array(capacities, dtype=np.float64)
+        columns['capacity_scores'] = np.minimum(1.0, columns['emp_hours'] / REQUIRED_CAPACITY)
+
+        columns['emp_levels'] = np.array(
+            [PROFICIENCY_LEVELS.get(proficiency, 1) if isinstance(proficiency, str) else 1
+             for proficiency in proficiency_raw],
+            dtype=np.int64
+        )
+
+        available_ns = _date_nanoseconds(df, 'Available Date', datetime.now())
+        columns['emp_available_ns'] = available_ns
+        columns['emp_available_nat'] = available_ns == NAT_NS
+
+        # Years of experience, when the roster records them (NaN otherwise)
+        columns['emp_experience'] = pd.to_numeric(
+            pd.Series(_column(df, 'Experience_years', np.nan), dtype=object), errors='coerce'
+        ).to_numpy(dtype=np.float64)
+
+        # Taxonomy bitmasks and per-domain skill counts for every employee
+        profiles = [self.taxonomy.profile(emp_skills) for emp_skills in skills]
+        columns['emp_domain_mask'] = np.array([profile[0] for profile in profiles], dtype=np.uint64)
+        columns['emp_role_mask'] = np.array([profile[1] for profile in profiles], dtype=np.uint64)
+        columns['emp_scoring_mask'] = np.array([profile[2] for profile in profiles], dtype=np.uint64)
+        columns['emp_domain_counts'] = np.array(
+            [profile[3] for profile in profiles], dtype=np.int64
+        ).reshape(len(skills), len(self.domain_names))
+
+        columns['emp_texts'] = [employee_text(description) for description in _column(df, 'Previous Project Description', '')]
+        columns['emp_active'] = np.ones(len(skills), dtype=bool)
+        return columns
+
+    def _project_columns(self, df: pd.DataFrame) -> Dict:
+        """Build per-project attribute columns for the rows of a DataFrame"""
+        columns = {}
+        domains = _column(df, 'Domain', '')
+        num_projects = len(domains)
+        deadlines = _column(df, 'Hard_Deadline', datetime.now() + timedelta(days=30))
+
+        # Project fields reported with each result
+        if 'ID' in df.columns:
+            project_ids = df['ID'].tolist()
+        else:
+            project_ids = [f"Project_{label}" for label in df.index]
+        columns['proj_info'] = [
+            {
+                'project_id': project_id,
+                'project_title': project_title,
+                'project_domain': domain,
+                'project_duration': duration,
+                'project_deadline': str(deadline)
+            }
+            for project_id, project_title, domain, duration, deadline in zip(
+                project_ids, _column(df, 'Project_Title', 'Unknown Project'), domains,
+                _column(df, 'Duration', 12), deadlines
+            )
+        ]
+
+        columns['proj_domains'] = domains
+        empty = np.array([_is_missing(domain) for domain in domains], dtype=bool)
+        columns['proj_empty'] = empty
+        columns['proj_tokens'] = [
+            split_tokens(domain) if not is_empty else set()
+            for domain, is_empty in zip(domains, empty)
+        ]
+
+        # Which scoring domains each project mentions (skill bonus) and its exact key (domain bonus)
+        hits = np.zeros((num_projects, len(self.domain_names)), dtype=bool)
+        domain_key = np.full(num_projects, -1, dtype=np.int64)
+        for row, domain in enumerate(domains):
+            domain_str = str(domain).lower()
+            for col, domain_skills in enumerate(self.taxonomy.scoring_sets):
+                hits[row, col] = any(skill in domain_str for skill in domain_skills)
+            domain_key[row] = self.taxonomy.scoring_index.get(domain_str, -1)
+        columns['proj_domain_hits'] = hits
+        columns['proj_domain_key'] = domain_key
+
+        # Team-building domain of each project
+        columns['proj_team_domain'] = np.array(
+            [self.taxonomy.team_domain(domain) for domain in domains], dtype=np.int64
+        )
+
+        columns['proj_levels'] = np.array(
+            [PROFICIENCY_LEVELS.get(proficiency, 1) if isinstance(proficiency, str) else 1
+             for proficiency in _column(df, 'Proficiency', 'Intermediate')],
+            dtype=np.int64
+        )
+
+        deadline_ns = _to_nanoseconds(deadlines)
+        columns['proj_deadline_ns'] = deadline_ns
+        columns['proj_deadline_nat'] = deadline_ns == NAT_NS
+        columns['proj_conflicts'] = _column(df, 'Conflicts', 'None')
+
+        # Hard constraints: allowed roles or levels, minimum experience, optional location allow-list
+        columns['proj_eligibility'] = _column(df, 'Eligibility', 'All')
+        columns['proj_locations'] = _column(df, 'Locations', None)
+        columns['proj_experience'] = pd.to_numeric(
+            pd.Series(_column(df, 'Experience_years', 0), dtype=object), errors='coerce'
+        ).fillna(0).to_numpy(dtype=np.float64)
+        columns['proj_team_size'] = np.array(
+            [DEFAULT_TEAM_SIZE if _is_missing(size) else int(size)
+             for size in _column(df, 'Team_Size', DEFAULT_TEAM_SIZE)],
+            dtype=np.int64
+        )
+
+        # Weekly hours a project needs, by default a full-time week per team member
+        columns['proj_demand_hours'] = np.array(
+            [team_size * REQUIRED_CAPACITY if _is_missing(hours) else float(hours)
+             for hours, team_size in zip(_column(df, 'Demand_Hours', None), columns['proj_team_size'])],
+            dtype=np.float64
+        )
+        columns['proj_texts'] = [
+            project_text(title, domain) for title, domain in zip(_column(df, 'Project_Title', ''), domains)
+        ]
+        columns['proj_active'] = np.ones(num_projects, dtype=bool)
+        return columns
+
+    def _prepare_skill_matrices(self):
+        """Build sparse employee x skill and project x skill incidence matrices"""
+        self.skill_vocabulary = SkillVocabulary()
+        for skills in self.emp_skills:
+            self.skill_vocabulary.add(skills)
+        for tokens in self.proj_tokens:
+            self.skill_vocabulary.add(tokens)
+
+        self.emp_skill_matrix = self.skill_vocabulary.incidence_matrix(self.emp_skills)
+        self.proj_skill_matrix = self.skill_vocabulary.incidence_matrix(self.proj_tokens)
+        self._refresh_skill_counts()
+
+    def _refresh_skill_counts(self):
+        """Recompute the transposed employee matrix and the row skill counts"""
+        # Transposed copy so block products are CSR x CSR
+        self.emp_skill_matrix_t = self.emp_skill_matrix.T.tocsr()
+        self.emp_skill_counts = np.diff(self.emp_skill_matrix.indptr).astype(np.float64)
+        self.proj_token_counts = np.diff(self.proj_skill_matrix.indptr).astype(np.float64)
+
+    def _prepare_text_matrices(self, cache_dir: Optional[str] = None):
+        """Fit (or load from the cache) the TF-IDF model of the employee and project texts"""
+        self.text_model = TextModel.load_or_fit(self.emp_texts, self.proj_texts, cache_dir)
+        self.emp_text_matrix = self.text_model.emp_matrix
+        self.proj_text_matrix = self.text_model.proj_matrix
+        self._refresh_text_matrix()
+
+    def _refresh_text_matrix(self):
+        """Recompute the transposed employee TF-IDF matrix"""
+        self.emp_text_matrix_t = self.emp_text_matrix.T.tocsr()
+
+    def _skill_rows(self, skill_sets: List[Iterable[str]]) -> sparse.csr_matrix:
+        """Incidence rows for new skill sets, widening both matrices for unseen skills"""
+        for skills in skill_sets:
+            self.skill_vocabulary.add(skills)
+        width = len(self.skill_vocabulary)
+        if self.emp_skill_matrix.shape[1] != width:
+            self.emp_skill_matrix.resize((self.emp_skill_matrix.shape[0], width))
+            self.proj_skill_matrix.resize((self.proj_skill_matrix.shape[0], width))
+        return self.skill_vocabulary.incidence_matrix(skill_sets)
+
+    @staticmethod
+    def _replace_row(matrix: sparse.csr_matrix, index: int, row: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Return a copy of a CSR matrix with one row replaced"""
+        return sparse.vstack([matrix[:index], row, matrix[index + 1:]], format='csr')
+
+    def _rows_changed(self):
+        """Forget cached per-project employee masks, the candidate indexes and constraint indexes after rows change"""
+        self._in_domain_key = None
+        self._in_domain_mask = None
+        self._candidate_index = None
+        self._constraint_stage = None
+        self._ann_index = None
+
+    def candidate_index(self):
+        """Inverted skill and domain index of the current rows, built on first use"""
+        from candidate_index import CandidateIndex  # the index module reads this module's constants
+        if self._candidate_index is None:
+            self._candidate_index = CandidateIndex(self)
+        return self._candidate_index
+
+    def ann_index(self, clusters: int = 0):
+        """Clustered approximate candidate index of the current rows, trained on first use"""
+        from ann_index import ClusteredIndex  # the ANN module reads this module's constants
+        if self._ann_index is None or self._ann_index[0] != clusters:
+            self._ann_index = (clusters, ClusteredIndex(self, clusters))
+        return self._ann_index[1]
+
+    def constraint_stage(self):
+        """Hard-constraint indexes of the current rows, built on first use"""
+        from constraints import ConstraintStage  # the constraints module reads this module's helpers
+        if self._constraint_stage is None:
+            self._constraint_stage = ConstraintStage(self, self.constraints)
+        return self._constraint_stage
+
+    def eligible(self, project_index: int) -> Optional[np.ndarray]:
+        """Employees passing the project's hard constraints, or None when it has none"""
+        return self.constraint_stage().eligible(project_index)
+
+    def _index_employee_ids(self, indices: Iterable[int]):
+        """Register employee rows in the id lookup used for conflicts and exclusivity"""
+        lengths = set(self.emp_id_lengths)
+        for row in indices:
+            emp_id = self.emp_ids[row]
+            self.emp_index_by_id.setdefault(emp_id, []).append(row)
+            lengths.add(len(emp_id))
+        self.emp_id_lengths = sorted(lengths)
+
+    def _unindex_employee_id(self, row: int):
+        """Remove one employee row from the id lookup"""
+        rows = self.emp_index_by_id.get(self.emp_ids[row], [])
+        if row in rows:
+            rows.remove(row)
+        if not rows:
+            self.emp_index_by_id.pop(self.emp_ids[row], None)
+
+    @staticmethod
+    def _append_fields(target, columns: Dict, list_fields, array_fields):
+        """Append new rows to aligned list and array attributes"""
+        for name in list_fields:
+            getattr(target, name).extend(columns[name])
+        for name in array_fields:
+            setattr(target, name, np.concatenate([getattr(target, name), columns[name]]))
+
+    @staticmethod
+    def _set_fields(target, index: int, columns: Dict, list_fields, array_fields):
+        """Overwrite one row of aligned list and array attributes"""
+        for name in list_fields:
+            getattr(target, name)[index] = columns[name][0]
+        for name in array_fields:
+            getattr(target, name)[index] = columns[name][0]
+
+    def append_employees(self, df: pd.DataFrame) -> List[int]:
+        """Add employee rows at the end of the roster and return their indices"""
+        self._rows_changed()
+        start = self.num_employees
+        columns = self._employee_columns(df)
+        self._append_fields(self, columns, EMPLOYEE_LIST_FIELDS, EMPLOYEE_ARRAY_FIELDS)
+        rows = self._skill_rows(columns['emp_skills'])
+        self.emp_skill_matrix = sparse.vstack([self.emp_skill_matrix, rows], format='csr')
+        self._refresh_skill_counts()
+        # New texts use the vocabulary of the dataset load; the model is refitted on the next load
+        self.emp_text_matrix = sparse.vstack(
+            [self.emp_text_matrix, self.text_model.transform(columns['emp_texts'])], format='csr')
+        self._refresh_text_matrix()
+        indices = list(range(start, self.num_employees))
+        self._index_employee_ids(indices)
+        return indices
+
+    def update_employee(self, index: int, df: pd.DataFrame):
+        """Replace one employee row in place with the single row of a DataFrame"""
+        self._rows_changed()
+        columns = self._employee_columns(df)
+        self._unindex_employee_id(index)
+        self._set_fields(self, index, columns, EMPLOYEE_LIST_FIELDS, EMPLOYEE_ARRAY_FIELDS)
+        rows = self._skill_rows(columns['emp_skills'])
+        self.emp_skill_matrix = self._replace_row(self.emp_skill_matrix, index, rows)
+        self._refresh_skill_counts()
+        self.emp_text_matrix = self._replace_row(self.emp_text_matrix, index,
+                                                 self.text_model.transform(columns['emp_texts']))
+        self._refresh_text_matrix()
+        self._index_employee_ids([index])
+
+    def remove_employee(self, index: int):
+        """Drop an employee from matching while keeping row indices stable"""
+        self.emp_active[index] = False
+        self._unindex_employee_id(index)
+
+    def append_projects(self, df: pd.DataFrame) -> List[int]:
+        """Add project rows at the end of the portfolio and return their indices"""
+        self._rows_changed()
+        start = self.num_projects
+        columns = self._project_columns(df)
+        self._append_fields(self, columns, PROJECT_LIST_FIELDS, PROJECT_ARRAY_FIELDS)
+        rows = self._skill_rows(columns['proj_tokens'])
+        self.proj_skill_matrix = sparse.vstack([self.proj_skill_matrix, rows], format='csr')
+        self._refresh_skill_counts()
+        self.proj_text_matrix = sparse.vstack(
+            [self.proj_text_matrix, self.text_model.transform(columns['proj_texts'])], format='csr')
+        return list(range(start, self.num_projects))
+
+    def update_project(self, index: int, df: pd.DataFrame):
+        """Replace one project row in place with the single row of a DataFrame"""
+        self._rows_changed()
+        columns = self._project_columns(df)
+        self._set_fields(self, index, columns, PROJECT_LIST_FIELDS, PROJECT_ARRAY_FIELDS)
+        rows = self._skill_rows(columns['proj_tokens'])
+        self.proj_skill_matrix = self._replace_row(self.proj_skill_matrix, index, rows)
+        self._refresh_skill_counts()
+        self.proj_text_matrix = self._replace_row(self.proj_text_matrix, index,
+                                                  self.text_model.transform(columns['proj_texts']))
+
+    def remove_project(self, index: int):
+        """Drop a project from matching while keeping row indices stable"""
+        self.proj_active[index] = False
+
+    def employee_index(self, emp_id: str) -> Optional[int]:
+        """Index of the active employee row with this id"""
+        for row in self.emp_index_by_id.get(str(emp_id), []):
+            if self.emp_active[row]:
+                return row
+        return None
+
+    def project_index(self, project_id: str) -> Optional[int]:
+        """Index of the active project row with this id"""
+        for row, info in enumerate(self.proj_info):
+            if self.proj_active[row] and str(info['project_id']) == str(project_id):
+                return row
+        return None
+
+    def conflicting_employees(self, project_index: int) -> List[int]:
+        """Employee indices whose id appears in the project's conflicts text"""
+        conflicts = self.proj_conflicts[project_index]
+        if conflicts == 'None' or _is_missing(conflicts):
+            return []
+        conflicts_str = str(conflicts)
+        found = []
+        for length in self.emp_id_lengths:
+            seen = set()
+            for start in range(len(conflicts_str) - length + 1):
+                fragment = conflicts_str[start:start + length]
+                if fragment not in seen:
+                    seen.add(fragment)
+                    found.extend(self.emp_index_by_id.get(fragment, []))
+        return found
+
+    def mark_used(self, used_mask: np.ndarray, employee_ids: Iterable[str]):
+        """Flag every employee row carrying one of the given ids as used"""
+        for emp_id in employee_ids:
+            used_mask[self.emp_index_by_id.get(emp_id, [])] = True
+
+    @staticmethod
+    def _exact_keys(overall: np.ndarray) -> np.ndarray:
+        """Rounded overall_score values exactly as round() produces them"""
+        unique_values, inverse = np.unique(overall, return_inverse=True)
+        keys = np.array([round(float(value) * 100, 2) for value in unique_values], dtype=np.float64)
+        return keys[inverse]
+
+    def _ordered(self, overall: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """Order employee indices by rounded score, ties kept in roster order"""
+        if len(indices) == 0:
+            return indices
+        keys = self._exact_keys(overall[indices])
+        return indices[np.lexsort((indices, -keys))]
+
+    def _top(self, overall: np.ndarray, approx: np.ndarray, mask: np.ndarray, k: int) -> np.ndarray:
+        """The k best employees under a mask, without sorting the whole roster"""
+        indices = np.flatnonzero(mask)
+        if len(indices) > k:
+            values = approx[indices]
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            indices = indices[values >= kth - ROUNDING_MARGIN]
+        return self._ordered(overall, indices)[:k]
+
+    def pool_specs(self, project_index: int, top_k: int = DEFAULT_TOP_K,
+                   pool_size: int = TEAM_POOL_SIZE) -> List[Tuple[str, object, int]]:
+        """(kind, argument, size) of every candidate pool for a project"""
+        # Top matches overall, then domain specialists per proficiency slot (and unslotted ones)
+        specs = [('top', None, top_k)]
+        for slot in range(len(PROFICIENCY_SLOTS) + 1):
+            specs.append(('slot', slot, pool_size))
+
+        # Complementary roles come from outside the domain
+        for role in self.taxonomy.complementary_roles_for(self.proj_domains[project_index]):
+            specs.append(('role', self.taxonomy.role_bit(role), pool_size))
+
+        # Best remaining employees for the final fill
+        specs.append(('available', None, pool_size))
+        return specs
+
+    def pool_mask(self, kind: str, arg, project_index: int, available: np.ndarray,
+                  columns: Optional[np.ndarray] = None) -> np.ndarray:
+        """Employees eligible for a candidate pool ('top' ignores exclusivity); with columns, only
+        those employees' entries, and available is aligned with them"""
+        cols = slice(None) if columns is None else columns
+        eligible = self.eligible(project_index)
+        if eligible is not None:
+            eligible = eligible[cols]
+            available = available & eligible
+        if kind == 'top':
+            active = self.emp_active[cols]
+            return active if eligible is None else active & eligible
+        if kind == 'available':
+            return available
+        if columns is None:
+            in_domain = self._in_domain(project_index)
+        else:
+            in_domain = (self.emp_domain_mask[columns] & np.uint64(1 << int(self.proj_team_domain[project_index]))) != 0
+        if kind == 'slot':
+            return available & in_domain & (self.emp_slot[cols] == arg)
+        return available & ~in_domain & ((self.emp_role_mask[cols] & np.uint64(arg)) != 0)
+
+    def _in_domain(self, project_index: int) -> np.ndarray:
+        """Employees holding skills of the project's team domain (last project cached)"""
+        key = (project_index, int(self.proj_team_domain[project_index]))
+        if self._in_domain_key != key:
+            domain_bit = np.uint64(1 << key[1])
+            self._in_domain_mask = (self.emp_domain_mask & domain_bit) != 0
+            self._in_domain_key = key
+        return self._in_domain_mask
+
+    def pool_accepts(self, kind: str, arg, project_index: int, employee_index: int) -> bool:
+        """Whether an employee belongs to a candidate pool, ignoring exclusivity"""
+        eligible = self.eligible(project_index)
+        if eligible is not None and not eligible[employee_index]:
+            return False
+        if kind in ('top', 'available'):
+            return True
+        domain_bit = 1 << int(self.proj_team_domain[project_index])
+        in_domain = bool(int(self.emp_domain_mask[employee_index]) & domain_bit)
+        if kind == 'slot':
+            return in_domain and int(self.emp_slot[employee_index]) == arg
+        return not in_domain and bool(int(self.emp_role_mask[employee_index]) & arg)
+
+    def shortlists(self, overall: np.ndarray, project_index: int, length: int,
+                   top_k: int = DEFAULT_TOP_K, pool_size: int = TEAM_POOL_SIZE) -> List[Tuple[np.ndarray, bool]]:
+        """Ordered leaders of every pool before any exclusivity, with a flag for complete lists"""
+        approx = np.round(overall * 100, 2)
+        lists = []
+        for kind, arg, size in self.pool_specs(project_index, top_k, pool_size):
+            mask = self.pool_mask(kind, arg, project_index, self.emp_active)
+            leaders = self._top(overall, approx, mask, max(size, length))
+            lists.append((leaders, len(leaders) < max(size, length)))
+        return lists
+
+    def select_candidates(self, overall: np.ndarray, project_index: int, used_mask: np.ndarray,
+                          top_k: int = DEFAULT_TOP_K, pool_size: int = TEAM_POOL_SIZE,
+                          pools_out: Optional[List] = None,
+                          shortlists: Optional[List[Tuple[np.ndarray, bool]]] = None,
+                          columns: Optional[np.ndarray] = None) -> np.ndarray:
+        """Employee indices for the top matches plus the pools the team builder draws from
+
+        With columns (sorted employee indices), overall holds only their scores and the pools are
+        drawn from those employees alone.
+        """
+        approx = None
+        if columns is None:
+            available = self.emp_active & ~used_mask
+        else:
+            available = self.emp_active[columns] & ~used_mask[columns]
+
+        pools = []
+        for i, (kind, arg, size) in enumerate(self.pool_specs(project_index, top_k, pool_size)):
+            pool = None
+            if shortlists is not None:
+                # Precomputed leaders answer the pool unless exclusivity used too many of them
+                leaders, complete = shortlists[i]
+                if kind != 'top':
+                    leaders = leaders[~used_mask[leaders]]
+                if len(leaders) >= size or complete:
+                    pool = leaders[:size]
+            if pool is None:
+                if approx is None:
+                    approx = np.round(overall * 100, 2)
+                pool = self._top(overall, approx, self.pool_mask(kind, arg, project_index, available, columns), size)
+            pools.append(pool)
+            if pools_out is not None:
+                # A full pool only admits scores at or above its last entry
+                threshold = round(float(overall[pool[-1]]) * 100, 2) if len(pool) >= size else None
+                pools_out.append((kind, arg, threshold))
+
+        selected = self._ordered(overall, np.unique(np.concatenate(pools)))
+        return selected if columns is None else columns[selected]
+
+    def block_size(self) -> int:
+        """Number of projects scored together in one block"""
+        return max(1, self.block_cells // max(1, self.num_employees))
+
+    def score_block(self, start: int, stop: int, columns: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Compute all component score matrices for projects[start:stop] (optionally a subset of employees)"""
+        return self.score_rows(slice(start, stop), columns)
+
+    def score_rows(self, rows, columns: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Compute all component score matrices for project rows given as a slice or index array"""
+        if isinstance(rows, slice):
+            project_indices = range(*rows.indices(self.num_projects))
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            project_indices = rows.tolist()
+        num_rows = len(project_indices)
+        if columns is None:
+            cols = slice(None)
+            num_cols = self.num_employees
+            emp_skill_matrix_t = self.emp_skill_matrix_t
+            emp_text_matrix_t = self.emp_text_matrix_t
+        else:
+            columns = np.asarray(columns, dtype=np.int64)
+            cols = columns
+            num_cols = len(columns)
+            emp_skill_matrix_t = self.emp_skill_matrix[columns].T.tocsr()
+            emp_text_matrix_t = self.emp_text_matrix[columns].T.tocsr()
+
+        # Skill match: Jaccard overlap plus the first applicable domain bonus
+        intersection = (self.proj_skill_matrix[rows] @ emp_skill_matrix_t).toarray()
+        union = self.emp_skill_counts[cols][None, :] + self.proj_token_counts[rows, None] - intersection
+        base_score = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+        emp_domain_counts = self.emp_domain_counts[cols]
+        emp_scoring_mask = self.emp_scoring_mask[cols]
+        skill_bonus = np.zeros((num_rows, num_cols))
+        for col in reversed(range(len(self.domain_names))):
+            counts = emp_domain_counts[:, col]
+            has_domain = (emp_scoring_mask & np.uint64(1 << col)) != 0
+            applies = self.proj_domain_hits[rows, col][:, None] & has_domain[None, :]
+            skill_bonus = np.where(applies, np.minimum(0.3, counts * 0.1)[None, :], skill_bonus)
+
+        emp_empty = self.emp_empty[cols]
+        skill = np.minimum(1.0, base_score + skill_bonus)
+        skill_zero = self.proj_empty[rows, None] | emp_empty[None, :]
+        skill[skill_zero] = 0
+
+        # Proficiency match from the ordinal level gap
+        emp_levels = self.emp_levels[cols][None, :]
+        proj_levels = self.proj_levels[rows, None]
+        proficiency = np.where(
+            emp_levels >= proj_levels,
+            1.0 + (emp_levels - proj_levels) * 0.1,
+            np.maximum(0.1, emp_levels / proj_levels)
+        )
+
+        # Availability relative to the hard deadline
+        with np.errstate(over='ignore'):
+            delta = self.emp_available_ns[cols][None, :] - self.proj_deadline_ns[rows, None]
+        days_late = delta // NS_PER_DAY
+        availability = np.where(delta <= 0, 1.0, np.maximum(0.1, 1.0 - (days_late / 30)))
+        availability[self.proj_deadline_nat[rows, None] | self.emp_available_nat[cols][None, :]] = 0.5
+
+        capacity = np.broadcast_to(self.capacity_scores[cols][None, :], (num_rows, num_cols))
+
+        # Semantic relevance: cosine of the L2-normalized TF-IDF rows, one sparse product per block
+        semantic = (self.proj_text_matrix[rows] @ emp_text_matrix_t).toarray()
+
+        # Domain bonus for employees holding skills from the project's exact domain
+        domain_key = self.proj_domain_key[rows]
+        domain_bonus = np.zeros((num_rows, num_cols))
+        bonus_zero = (domain_key < 0)[:, None] | self.proj_empty[rows, None] | emp_empty[None, :]
+        keyed = domain_key >= 0
+        if keyed.any():
+            counts = emp_domain_counts[:, domain_key[keyed]].T
+            domain_bonus[keyed] = np.minimum(0.2, counts * 0.05)
+        domain_bonus[bonus_zero] = 0
+
+        conflict_penalty = np.zeros((num_rows, num_cols))
+        for offset, project_index in enumerate(project_indices):
+            conflicted = self.conflicting_employees(project_index)
+            if conflicted:
+                if columns is not None:
+                    conflicted = np.flatnonzero(np.isin(columns, conflicted))
+                conflict_penalty[offset, conflicted] = 0.3
+
+        overall = (
+            skill * 0.4 +
+            proficiency * 0.3 +
+            availability * 0.2 +
+            capacity * 0.1 +
+            semantic * self.semantic_weight
+        ) + domain_bonus - conflict_penalty
+        overall = np.clip(overall, 0, 1)
+
+        # Pairs ruled out by a hard constraint keep their components but can never be picked
+        for offset, project_index in enumerate(project_indices):
+            eligible = self.eligible(project_index)
+            if eligible is not None:
+                overall[offset, ~eligible[cols]] = INELIGIBLE_SCORE
+
+        return {
+            'columns': columns,
+            'skill': skill,
+            'skill_zero': skill_zero,
+            'proficiency': proficiency,
+            'availability': availability,
+            'capacity': capacity,
+            'semantic': semantic,
+            'domain_bonus': domain_bonus,
+            'bonus_zero': bonus_zero,
+            'conflict_penalty': conflict_penalty,
+            'overall': overall
+        }
+
+    def iter_blocks(self):
+        """Yield (start, stop, scores) for consecutive blocks of projects"""
+        step = self.block_size()
+        for start in range(0, self.num_projects, step):
+            stop = min(self.num_projects, start + step)
+            yield start, stop, self.score_block(start, stop)
+
+    def build_matches(self, scores: Dict[str, np.ndarray], offset: int, employee_indices,
+                      project_id: str, project_title: str) -> List[Dict]:
+        """Materialize match dicts for the given employees of one scored project"""
+        skill = scores['skill'][offset]
+        skill_zero = scores['skill_zero'][offset]
+        proficiency = scores['proficiency'][offset]
+        availability = scores['availability'][offset]
+        capacity = scores['capacity'][offset]
+        semantic = scores['semantic'][offset]
+        domain_bonus = scores['domain_bonus'][offset]
+        bonus_zero = scores['bonus_zero'][offset]
+        conflict_penalty = scores['conflict_penalty'][offset]
+        overall = scores['overall'][offset]
+
+        # Positions of the employees in the scored columns
+        employee_indices = np.asarray(employee_indices, dtype=np.int64)
+        columns = scores.get('columns')
+        if columns is None:
+            positions = employee_indices
+        else:
+            order = np.argsort(columns, kind='stable')
+            positions = order[np.searchsorted(columns, employee_indices, sorter=order)]
+
+        matches = []
+        for e, i in zip(employee_indices.tolist(), positions.tolist()):
+            overall_score = float(overall[i])
+            penalty = float(conflict_penalty[i])
+            match = {
+                'employee_id': self.emp_ids[e],
+                'employee_name': self.emp_names[e],
+                'project_id': project_id,
+                'project_title': project_title,
+                'skill_match': _round_score(float(skill[i]), bool(skill_zero[i])),
+                'proficiency_match': _round_score(float(proficiency[i])),
+                'availability_match': _round_score(float(availability[i])),
+                'capacity_match': _round_score(float(capacity[i]))
+            }
+            if self.semantic_weight:
+                # Reported only when it counts towards the overall score
+                match['semantic_match'] = _round_score(float(semantic[i]))
+            match.update({
+                'overall_score': _round_score(overall_score, overall_score <= 0 or overall_score >= 1),
+                'skills': self.emp_skills[e],
+                'role': self.emp_roles[e],
+                'proficiency': self.emp_proficiency[e],
+                'capacity': self.emp_capacity[e],
+                'location': self.emp_locations[e],
+                'domain_bonus': _round_score(float(domain_bonus[i]), bool(bonus_zero[i])),
+                'conflict_penalty': _round_score(penalty, penalty == 0)
+            })
+            matches.append(match)
+        return matches
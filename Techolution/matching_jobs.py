@@ -0,0 +1,121 @@
+"""
+Matching jobs for AI-Driven Talent Management System
+Runs matching in a bounded thread pool and keeps recent jobs for progress polling
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+import logging
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Jobs running at once, and finished jobs kept for polling
+DEFAULT_POOL_SIZE = 2
+DEFAULT_RETAINED_JOBS = 20
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+class MatchingJob:
+    """State, progress and outcome of one background matching run"""
+
+    def __init__(self, mode: Optional[str]):
+        self.id = uuid.uuid4().hex
+        self.mode = mode
+        self.state = QUEUED
+        self.done = 0
+        self.total = 0
+        self.results = None
+        self.error: Optional[str] = None
+        self.created = datetime.now()
+        self.started: Optional[datetime] = None
+        self.finished: Optional[datetime] = None
+
+    def progress(self, done: int, total: int):
+        """Record how many projects are finished; the first report marks the job as running"""
+        if self.state == QUEUED:
+            self.state = RUNNING
+            self.started = datetime.now()
+        self.done, self.total = done, total
+
+    @property
+    def percent(self) -> float:
+        if self.state == DONE:
+            return 100.0
+        return round(100.0 * self.done / self.total, 1) if self.total else 0.0
+
+    def describe(self, include_results: bool = True) -> Dict:
+        """JSON-ready view of the job"""
+        info = {
+            'job_id': self.id,
+            'mode': self.mode,
+            'state': self.state,
+            'percent': self.percent,
+            'projects_done': self.done,
+            'projects_total': self.total,
+            'created': self.created.isoformat(),
+            'started': self.started.isoformat() if self.started else None,
+            'finished': self.finished.isoformat() if self.finished else None
+        }
+        if self.state == FAILED:
+            info['error'] = self.error
+        if self.state == DONE and include_results:
+            info['results'] = list(self.results)
+        return info
+
+
+class JobManager:
+    """Submits matching runs to a thread pool and retains a bounded number of finished jobs"""
+
+    def __init__(self, run: Callable, pool_size: int = DEFAULT_POOL_SIZE, retained: int = DEFAULT_RETAINED_JOBS):
+        """run has the signature run(mode, progress) and returns results or {'error': message}"""
+        self.run = run
+        self.pool_size = max(1, pool_size)
+        self.retained = max(1, retained)
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='matching-job')
+        self.jobs: 'OrderedDict[str, MatchingJob]' = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, mode: Optional[str] = None) -> MatchingJob:
+        """Queue a matching run and return its job right away"""
+        job = MatchingJob(mode)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._evict()
+        self.executor.submit(self._execute, job)
+        return job
+
+    def _execute(self, job: MatchingJob):
+        # The job stays queued until the run reports progress, e.g. while it waits for another run
+        try:
+            results = self.run(job.mode, job.progress)
+            if isinstance(results, dict) and 'error' in results:
+                job.error, state = results['error'], FAILED
+            else:
+                job.results, state = results, DONE
+        except Exception as e:
+            logger.exception(f"Matching job {job.id} failed")
+            job.error, state = str(e), FAILED
+        job.finished = datetime.now()
+        job.state = state  # set last, so pollers never see a finished job without its outcome
+        with self.lock:
+            self._evict()
+
+    def _evict(self):
+        """Forget the oldest finished jobs beyond the retention limit (queued and running jobs stay)"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.state in (DONE, FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.retained)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[MatchingJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self):
+        """All retained jobs, oldest first"""
+        with self.lock:
+            return list(self.jobs.values())
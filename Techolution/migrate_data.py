@@ -8,12 +8,23 @@ import sys
 import pandas as pd
 from datetime import datetime
 import logging
+from typing import Callable, Dict, Iterator, Optional
 from database import DatabaseManager
+from dataset_formats import dataset_format, find_dataset, read_chunks, read_frame
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Dataset files without their format suffix (any of dataset_formats.FORMATS), and the rows read at a time
+DATASET_STEMS = {'employees': 'datasets/Employees', 'projects': 'datasets/Projects'}
+CSV_CHUNK_ROWS = 50000
+
+# Columns clean_employees_data / clean_projects_data keep as stripped text
+EMPLOYEE_TEXT_COLUMNS = ['Emp ID', 'Name', 'Skills', 'Role', 'Previous Project Description', 'Proficiency', 'Location']
+PROJECT_TEXT_COLUMNS = ['ID', 'Project_Title', 'Domain', 'Eligibility', 'Duration', 'Proficiency', 'Conflicts', 'Locations']
+TEXT_DTYPES = {column: str for column in EMPLOYEE_TEXT_COLUMNS + PROJECT_TEXT_COLUMNS}
+
 def migrate_csv_to_database():
     """Migrate existing CSV files to database"""
     try:
@@ -22,18 +33,18 @@ def migrate_csv_to_database():
         # Initialize database manager
         db_manager = DatabaseManager()
         
-        # Check for existing CSV files
-        employees_csv_path = 'datasets/Employees.csv'
-        projects_csv_path = 'datasets/Projects.csv'
+        # Check for existing dataset files (CSV, compressed CSV, Parquet or Feather)
+        employees_csv_path = find_dataset(DATASET_STEMS['employees'])
+        projects_csv_path = find_dataset(DATASET_STEMS['projects'])
         
-        employees_exists = os.path.exists(employees_csv_path)
-        projects_exists = os.path.exists(projects_csv_path)
+        employees_exists = employees_csv_path is not None
+        projects_exists = projects_csv_path is not None
         
-        logger.info(f"📁 Employees CSV exists: {employees_exists}")
-        logger.info(f"📁 Projects CSV exists: {projects_exists}")
+        logger.info(f"📁 Employees file: {employees_csv_path or 'not found'}")
+        logger.info(f"📁 Projects file: {projects_csv_path or 'not found'}")
         
         if not employees_exists and not projects_exists:
-            logger.warning("⚠️ No CSV files found to migrate")
+            logger.warning("⚠️ No dataset files found to migrate")
             return False
         
         # Get current database stats
@@ -46,8 +57,8 @@ def migrate_csv_to_database():
         if employees_exists:
             logger.info("👥 Migrating employees data...")
             try:
-                employees_df = pd.read_csv(employees_csv_path)
-                logger.info(f"📋 Loaded {len(employees_df)} employee records from CSV")
+                employees_df = read_frame(employees_csv_path)
+                logger.info(f"📋 Loaded {len(employees_df)} employee records from {employees_csv_path}")
                 
                 # Clean data
                 employees_df = clean_employees_data(employees_df)
@@ -64,8 +75,8 @@ def migrate_csv_to_database():
         if projects_exists:
             logger.info("📋 Migrating projects data...")
             try:
-                projects_df = pd.read_csv(projects_csv_path)
-                logger.info(f"📋 Loaded {len(projects_df)} project records from CSV")
+                projects_df = read_frame(projects_csv_path)
+                logger.info(f"📋 Loaded {len(projects_df)} project records from {projects_csv_path}")
                 
                 # Clean data
                 projects_df = clean_projects_data(projects_df)
@@ -101,6 +112,64 @@ def migrate_csv_to_database():
         logger.error(f"❌ Migration failed: {e}")
         return False
 
+def dataset_paths() -> Dict[str, str]:
+    """Existing dataset file of each table, in the first accepted format found"""
+    paths = {table: find_dataset(stem) for table, stem in DATASET_STEMS.items()}
+    return {table: path for table, path in paths.items() if path}
+
+def csv_chunks(path: str, clean: Callable, chunk_rows: int = CSV_CHUNK_ROWS,
+               progress: Optional[Callable[[int, int, int], None]] = None) -> Iterator[pd.DataFrame]:
+    """Cleaned chunks of a dataset file (any accepted format), read chunk_rows rows at a time
+
+    progress(rows, bytes read, file size) is called once each chunk has been consumed. Text columns are read
+    as text, so every chunk converts them alike whatever the values in it look like.
+    """
+    rows = 0
+    for chunk, done, size in read_chunks(path, chunk_rows, TEXT_DTYPES):
+        yield clean(chunk)
+        rows += len(chunk)
+        if progress:
+            progress(rows, done, size)
+
+def sync_csv_to_database(db_manager: Optional[DatabaseManager] = None, paths: Optional[Dict[str, str]] = None,
+                         chunk_rows: int = CSV_CHUNK_ROWS,
+                         progress: Optional[Callable[[str, int, int, int], None]] = None) -> dict:
+    """Sync the dataset files (both, or the ones in paths) into the database, writing only the rows that changed
+
+    Files (CSV, .csv.gz, .csv.zst, Parquet or Feather) are streamed chunk_rows rows at a time, so memory stays
+    bounded for any file size;
+    progress(table, rows, bytes read, file size) reports each chunk.
+    """
+    try:
+        logger.info("🔄 Starting CSV to Database sync...")
+        db_manager = db_manager or DatabaseManager()
+        summary = {}
+        
+        for table, path in (paths or dataset_paths()).items():
+            if not os.path.exists(path):
+                continue
+            report = (lambda rows, done, size, table=table: progress(table, rows, done, size)) if progress else None
+            if table == 'employees':
+                chunks = csv_chunks(path, clean_employees_data, chunk_rows, report)
+                summary[table] = db_manager.sync_employee_chunks(chunks)
+            else:
+                chunks = csv_chunks(path, clean_projects_data, chunk_rows, report)
+                summary[table] = db_manager.sync_project_chunks(chunks)
+        
+        if not summary:
+            logger.warning("⚠️ No dataset files found to sync")
+            return {}
+        
+        logger.info("📈 Sync Summary:")
+        for table, changes in summary.items():
+            logger.info(f"   {table}: ➕ {changes['inserted']} inserted, ✏️ {changes['updated']} updated, "
+                        f"➖ {changes['deleted']} deleted, {changes['unchanged']} unchanged in {changes['seconds']}s")
+        return summary
+        
+    except Exception as e:
+        logger.error(f"❌ Sync failed: {e}")
+        return {}
+
 def clean_employees_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and validate employees data"""
     logger.info("🧹 Cleaning employees data...")
@@ -117,8 +186,7 @@ def clean_employees_data(df: pd.DataFrame) -> pd.DataFrame:
         df['Available Date'] = pd.to_datetime(df['Available Date'], errors='coerce')
     
     # Clean text columns
-    text_columns = ['Emp ID', 'Name', 'Skills', 'Role', 'Previous Project Description', 'Proficiency', 'Location']
-    for col in text_columns:
+    for col in EMPLOYEE_TEXT_COLUMNS:
         if col in df.columns:
             df[col] = df[col].astype(str).str.strip()
     
@@ -149,8 +217,7 @@ def clean_projects_data(df: pd.DataFrame) -> pd.DataFrame:
         df['Hard_Deadline'] = pd.to_datetime(df['Hard_Deadline'], errors='coerce')
     
     # Clean text columns
-    text_columns = ['ID', 'Project_Title', 'Domain', 'Eligibility', 'Duration', 'Proficiency', 'Conflicts']
-    for col in text_columns:
+    for col in PROJECT_TEXT_COLUMNS:
         if col in df.columns:
             df[col] = df[col].astype(str).str.strip()
     
@@ -175,18 +242,18 @@ def backup_csv_files():
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Backup employees CSV
-        employees_csv_path = 'datasets/Employees.csv'
-        if os.path.exists(employees_csv_path):
-            backup_path = f'{backup_dir}/Employees_backup_{timestamp}.csv'
+        # Backup employees file
+        employees_csv_path = find_dataset(DATASET_STEMS['employees'])
+        if employees_csv_path:
+            backup_path = f'{backup_dir}/Employees_backup_{timestamp}{dataset_format(employees_csv_path)}'
             import shutil
             shutil.copy2(employees_csv_path, backup_path)
             logger.info(f"✅ Backed up employees CSV to: {backup_path}")
         
-        # Backup projects CSV
-        projects_csv_path = 'datasets/Projects.csv'
-        if os.path.exists(projects_csv_path):
-            backup_path = f'{backup_dir}/Projects_backup_{timestamp}.csv'
+        # Backup projects file
+        projects_csv_path = find_dataset(DATASET_STEMS['projects'])
+        if projects_csv_path:
+            backup_path = f'{backup_dir}/Projects_backup_{timestamp}{dataset_format(projects_csv_path)}'
             import shutil
             shutil.copy2(projects_csv_path, backup_path)
             logger.info(f"✅ Backed up projects CSV to: {backup_path}")
@@ -250,9 +317,11 @@ def main():
             success = backup_csv_files()
         elif command == 'verify':
             success = verify_migration()
+        elif command == 'sync':
+            success = bool(sync_csv_to_database())
         else:
             print(f"❌ Unknown command: {command}")
-            print("Available commands: migrate, backup, verify")
+            print("Available commands: migrate, backup, verify, sync")
             success = False
     else:
         # Default: migrate with backup
@@ -0,0 +1,278 @@
+"""
+Parallel matching for AI-Driven Talent Management System
+Scores project shards in worker processes that share the employee arrays through shared memory
+"""
+
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from scipy import sparse
+from typing import Dict, List, Optional, Tuple
+import logging
+from matching_engine import MatchingEngine, DEFAULT_TOP_K, TEAM_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Leaders kept per pool so the merge step rarely has to rescan a full score row
+DEFAULT_SHORTLIST_LENGTH = 100
+
+# Shards handed out per worker, so uneven shards still balance
+SHARDS_PER_WORKER = 4
+
+# Employee arrays the workers read (the score matrix they write is added per run)
+SHARED_EMPLOYEE_FIELDS = (
+    'emp_skill_counts', 'emp_domain_counts', 'emp_scoring_mask', 'emp_empty', 'emp_levels',
+    'emp_available_ns', 'emp_available_nat', 'capacity_scores', 'emp_active', 'emp_domain_mask',
+    'emp_role_mask', 'emp_slot'
+)
+
+# Project attributes pickled once per worker
+PROJECT_STATE_FIELDS = (
+    'proj_skill_matrix', 'proj_token_counts', 'proj_domain_hits', 'proj_domain_key', 'proj_team_domain',
+    'proj_levels', 'proj_deadline_ns', 'proj_deadline_nat', 'proj_empty', 'proj_domains',
+    'proj_text_matrix', 'semantic_weight', 'taxonomy', 'domain_names', 'block_cells'
+)
+
+# Worker start methods in order of preference; a fork of the threaded web process could inherit locks
+# other threads hold, so workers come from a single-threaded fork server or a fresh interpreter
+START_METHODS = ('forkserver', 'spawn')
+
+
+def default_context():
+    """Multiprocessing context the worker pools start from"""
+    available = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(next(method for method in START_METHODS if method in available))
+
+
+class SharedArrays:
+    """NumPy arrays packed into one shared memory block"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """Copy the arrays into a new shared memory block"""
+        self.layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            self.layout[name] = (offset, array.shape, array.dtype.str)
+            offset += -(-array.nbytes // 8) * 8  # keep every array 8-byte aligned
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 8))
+        self.arrays = self.views(self.shm, self.layout)
+        for name, array in arrays.items():
+            self.arrays[name][...] = array
+
+    @staticmethod
+    def views(shm: shared_memory.SharedMemory, layout: Dict) -> Dict[str, np.ndarray]:
+        """NumPy views of every array in a shared memory block"""
+        return {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            for name, (offset, shape, dtype) in layout.items()
+        }
+
+    def release(self):
+        """Drop the views and free the shared memory block"""
+        self.arrays = {}
+        self.shm.close()
+        self.shm.unlink()
+
+
+class SharedConstraints:
+    """Worker-side hard constraints: each project's row in a shared stack of the distinct eligibility masks"""
+
+    def __init__(self, masks: np.ndarray, rows: np.ndarray):
+        self.masks = masks
+        self.rows = rows
+
+    def requirement(self, project_index: int) -> int:
+        """Projects on the same mask row accept the same employees"""
+        return int(self.rows[project_index])
+
+    def eligible(self, project_index: int) -> Optional[np.ndarray]:
+        row = self.rows[project_index]
+        return None if row < 0 else self.masks[row]
+
+
+def constraint_arrays(engine: MatchingEngine) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct eligibility masks of the projects stacked into one array, and each project's row (-1 for none)"""
+    stage = engine.constraint_stage()
+    rows = np.empty(engine.num_projects, dtype=np.int64)
+    masks, row_of = [], {}
+    for p in range(engine.num_projects):
+        key = stage.requirement(p)
+        if key not in row_of:
+            mask = stage.eligible(p)
+            row_of[key] = -1 if mask is None else len(masks)
+            if mask is not None:
+                masks.append(mask)
+        rows[p] = row_of[key]
+    return np.array(masks, dtype=bool).reshape(len(masks), engine.num_employees), rows
+
+
+def group_arrays(engine: MatchingEngine, groups: List[Tuple[np.ndarray, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Candidate groups flattened: group g lists group_columns[group_offsets[g]:group_offsets[g + 1]]"""
+    proj_group = np.full(engine.num_projects, -1, dtype=np.int64)
+    for g, (rows, _) in enumerate(groups):
+        proj_group[rows] = g
+    columns = [np.asarray(columns, dtype=np.int64) for _, columns in groups]
+    return {
+        'proj_group': proj_group,
+        'group_columns': np.concatenate(columns + [np.empty(0, dtype=np.int64)]),
+        'group_offsets': np.concatenate([[0], np.cumsum([len(c) for c in columns])]).astype(np.int64)
+    }
+
+
+class SharedMatchingEngine(MatchingEngine):
+    """Worker-side engine built on shared employee arrays instead of DataFrames"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], state: Dict):
+        for name in SHARED_EMPLOYEE_FIELDS:
+            setattr(self, name, arrays[name])
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.emp_skill_matrix_t = sparse.csr_matrix(
+            (arrays['skill_data'], arrays['skill_indices'], arrays['skill_indptr']),
+            shape=tuple(state['skill_shape'])
+        )
+        self.emp_text_matrix_t = sparse.csr_matrix(
+            (arrays['text_data'], arrays['text_indices'], arrays['text_indptr']),
+            shape=tuple(state['text_shape'])
+        )
+        # Employee-major views over the same buffers, for scoring a subset of employees
+        self.emp_skill_matrix = self.emp_skill_matrix_t.T
+        self.emp_text_matrix = self.emp_text_matrix_t.T
+        self.overall_out = arrays['overall']
+        self.shared_constraints = SharedConstraints(arrays['eligible_masks'], arrays['proj_eligible_row'])
+        self.proj_group = arrays.get('proj_group')
+        self.group_columns = arrays.get('group_columns')
+        self.group_offsets = arrays.get('group_offsets')
+        self._rows_changed()
+
+    @property
+    def num_employees(self) -> int:
+        return len(self.emp_active)
+
+    def constraint_stage(self):
+        # Masks built in the parent, which holds the categorical columns
+        return self.shared_constraints
+
+    def shard_groups(self, start: int, stop: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """(project rows, candidates) of the parent's candidate groups, limited to projects[start:stop]"""
+        groups = self.proj_group[start:stop]
+        return [(start + np.flatnonzero(groups == g), self.group_columns[self.group_offsets[g]:self.group_offsets[g + 1]])
+                for g in np.unique(groups).tolist()]
+
+    def conflicting_employees(self, project_index: int) -> List[int]:
+        # Resolved against employee ids in the parent, which the workers never see
+        return self.proj_conflict_rows[project_index]
+
+
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_engine: Optional[SharedMatchingEngine] = None
+
+
+def _init_worker(shm_name: str, layout: Dict, state: Dict):
+    """Attach a worker process to the shared employee arrays"""
+    global _worker_shm, _worker_engine
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_engine = SharedMatchingEngine(SharedArrays.views(_worker_shm, layout), state)
+
+
+def _score_shard(start: int, stop: int, top_k: int, pool_size: int, length: int) -> Tuple[List[Tuple], int, int]:
+    """Score projects[start:stop], write their score rows and return pool leaders with their scores,
+    plus the pairs fully scored and the pairs ruled out by hard constraints"""
+    engine = _worker_engine
+    prepared = []
+    scored = ruled_out = 0
+    step = engine.block_size()
+    for block_start in range(start, stop, step):
+        block_stop = min(stop, block_start + step)
+        if engine.proj_group is None:
+            scores = engine.score_block(block_start, block_stop)
+            engine.overall_out[block_start:block_stop] = scores['overall']
+            scored += (block_stop - block_start) * engine.num_employees
+        else:
+            # Only the candidates the parent picked are fully scored, as in a serial pruned run
+            scores = None
+            index = engine.candidate_index()
+            for rows, columns in engine.shard_groups(block_start, block_stop):
+                group_scored, group_ruled_out = index.score_group(rows, columns, engine.overall_out)
+                scored += group_scored
+                ruled_out += group_ruled_out
+
+        for offset in range(block_stop - block_start):
+            p = block_start + offset
+            shortlists = engine.shortlists(engine.overall_out[p], p, length, top_k, pool_size)
+
+            # Component scores of every listed employee, so the merge can build match dicts directly
+            columns = np.unique(np.concatenate([leaders for leaders, _ in shortlists]))
+            if scores is None:
+                compact = engine.score_block(p, p + 1, columns=columns)
+            else:
+                compact = {'columns': columns}
+                for name, values in scores.items():
+                    if name != 'columns':
+                        compact[name] = np.asarray(values[offset:offset + 1])[:, columns]
+            prepared.append((shortlists, compact))
+    return prepared, scored, ruled_out
+
+
+def worker_inputs(engine: MatchingEngine, groups: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None
+                  ) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """Arrays for the shared memory block (employee data included) and the project state pickled to workers"""
+    arrays = {name: getattr(engine, name) for name in SHARED_EMPLOYEE_FIELDS}
+    skill_matrix_t = engine.emp_skill_matrix_t
+    arrays['skill_data'] = skill_matrix_t.data
+    arrays['skill_indices'] = skill_matrix_t.indices
+    arrays['skill_indptr'] = skill_matrix_t.indptr
+    text_matrix_t = engine.emp_text_matrix_t
+    arrays['text_data'] = text_matrix_t.data
+    arrays['text_indices'] = text_matrix_t.indices
+    arrays['text_indptr'] = text_matrix_t.indptr
+    arrays['overall'] = np.zeros((engine.num_projects, engine.num_employees))
+    arrays['eligible_masks'], arrays['proj_eligible_row'] = constraint_arrays(engine)
+    if groups is not None:
+        arrays.update(group_arrays(engine, groups))
+
+    state = {name: getattr(engine, name) for name in PROJECT_STATE_FIELDS}
+    state['skill_shape'] = skill_matrix_t.shape
+    state['text_shape'] = text_matrix_t.shape
+    state['proj_conflict_rows'] = [engine.conflicting_employees(p) for p in range(engine.num_projects)]
+    return arrays, state
+
+
+def score_parallel(engine: MatchingEngine, workers: int, top_k: int = DEFAULT_TOP_K,
+                   pool_size: int = TEAM_POOL_SIZE, length: int = DEFAULT_SHORTLIST_LENGTH,
+                   groups: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None,
+                   mp_context=None) -> Tuple[np.ndarray, List[Tuple], Dict[str, int]]:
+    """Overall score matrix, per-project pool leaders and work counts, computed by a pool of worker processes
+
+    groups are the (project rows, candidates) of a pruned or approximate run, picked by the caller; the
+    workers then fully score only those candidates. Without groups every pair is scored.
+    """
+    arrays, state = worker_inputs(engine, groups)
+
+    # Shards of consecutive projects; results are merged back in project order
+    shard = max(1, min(engine.block_size(), -(-engine.num_projects // (workers * SHARDS_PER_WORKER))))
+    bounds = [(start, min(engine.num_projects, start + shard)) for start in range(0, engine.num_projects, shard)]
+
+    shared = SharedArrays(arrays)
+    counts = {'scored': 0, 'ineligible': 0}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context or default_context(),
+                                 initializer=_init_worker,
+                                 initargs=(shared.shm.name, shared.layout, state)) as executor:
+            futures = [executor.submit(_score_shard, start, stop, top_k, pool_size, length)
+                       for start, stop in bounds]
+            prepared = []
+            for future in futures:
+                shard, scored, ruled_out = future.result()
+                prepared.extend(shard)
+                counts['scored'] += scored
+                counts['ineligible'] += ruled_out
+        overall = shared.arrays['overall'].copy()
+    finally:
+        shared.release()
+
+    logger.info(f"Scored {engine.num_projects} projects in {len(bounds)} shards on {workers} workers")
+    return overall, prepared, counts
@@ -0,0 +1,133 @@
+"""
+Result cache for AI-Driven Talent Management System
+Matching results keyed by a fingerprint of the datasets and the scoring configuration
+"""
+
+import pandas as pd
+from collections import OrderedDict
+from typing import Dict, Optional
+import hashlib
+import json
+import os
+import pickle
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Matching runs kept in memory, and on disk when a cache folder is configured
+DEFAULT_MEMORY_ENTRIES = 8
+DEFAULT_DISK_ENTRIES = 32
+
+
+def dataframe_fingerprint(df: Optional[pd.DataFrame]) -> str:
+    """Content hash of a DataFrame's columns and values"""
+    digest = hashlib.sha256()
+    if df is not None:
+        digest.update(json.dumps([str(column) for column in df.columns]).encode('utf-8'))
+        # List-valued columns (e.g. Skills_List) are hashed through their text form
+        values = df.astype(str) if len(df) else df
+        digest.update(pd.util.hash_pandas_object(values, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(*parts) -> str:
+    """Key of a matching run from JSON-serializable parts (fingerprints and settings)"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Bounded LRU of matching runs with an optional on-disk tier"""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_ENTRIES, directory: Optional[str] = None,
+                 max_files: int = DEFAULT_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_files = max_files
+        self.entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'invalidations': 0}
+        self.lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"results_{key}.pkl")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Stored run for a key, from memory or disk, or None"""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return self.entries[key]
+
+        value = self._read(key) if self.directory else None
+        with self.lock:
+            if value is None:
+                self.counters['misses'] += 1
+                return None
+            self.counters['hits'] += 1
+            self.counters['disk_hits'] += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Dict):
+        """Store a run in memory and, when configured, on disk"""
+        with self.lock:
+            self._remember(key, value)
+            self.counters['stores'] += 1
+        if self.directory:
+            self._write(key, value)
+
+    def _remember(self, key: str, value: Dict):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)  # recently used files survive pruning
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable result cache file {path}: {e}")
+            return None
+
+    def _write(self, key: str, value: Dict):
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+            self._prune_files()
+        except OSError as e:
+            logger.warning(f"Could not write result cache file {path}: {e}")
+
+    def _prune_files(self):
+        """Delete all but the most recently used files"""
+        files = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.startswith('results_') and name.endswith('.pkl')]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[self.max_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def invalidate(self):
+        """Drop the in-memory runs (disk files are keyed by content and stay valid)"""
+        with self.lock:
+            self.entries.clear()
+            self.counters['invalidations'] += 1
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self.lock:
+            total = self.counters['hits'] + self.counters['misses']
+            return dict(self.counters, entries=len(self.entries), max_entries=self.max_entries,
+                        disk=bool(self.directory), hit_rate=round(self.counters['hits'] / total, 4) if total else 0.0)
@@ -0,0 +1,249 @@
+"""
+Result index for AI-Driven Talent Management System
+Filters, sorts and pages matching results from lookups built once per result set
+"""
+
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import base64
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Page sizes accepted by page()
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Domain and employee views kept per result set; min_score is applied while a page is read
+MAX_CACHED_VIEWS = 16
+
+SORT_KEYS = ('project', 'project_id', 'title', 'best_score', 'team_score')
+
+# Buckets of the results page charts, as (label, lower bound) from the top
+SCORE_RANGES = (('90-100%', 90), ('80-89%', 80), ('70-79%', 70), ('60-69%', 60), ('Below 60%', float('-inf')))
+CAPACITY_RANGES = (('0-20 hrs', 20), ('21-30 hrs', 30), ('31-40 hrs', 40))
+TOP_EMPLOYEES = 10
+TOP_SKILLS = 8
+
+
+def _score(match: Dict) -> float:
+    try:
+        score = float(match.get('overall_score', 0))
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if np.isnan(score) else score
+
+
+def encode_cursor(sort: str, key: Tuple) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    return base64.urlsafe_b64encode(json.dumps([sort, *key]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple:
+    """(sort value, project id, position) of a cursor; ValueError when it is malformed or for another sort"""
+    try:
+        name, *key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if name != sort or len(key) != 3:
+        raise ValueError(f"Cursor does not belong to sort '{sort}'")
+    return tuple(key)
+
+
+class ResultIndex:
+    """Lookups by domain and employee, and one sorted order per sort key, over one list of matching results"""
+
+    def __init__(self, results: List[Dict]):
+        self.results = results
+        self.project_ids = [str(result.get('project_id')) for result in results]
+        self.best_scores = np.array([_score(result['matches'][0]) if result.get('matches') else 0.0
+                                     for result in results])
+
+        # Positions of every domain's projects, and of the projects listing an employee anywhere
+        by_domain: Dict[str, List[int]] = {}
+        by_employee: Dict[str, List[int]] = {}
+        for position, result in enumerate(results):
+            by_domain.setdefault(str(result.get('project_domain', '')).strip().lower(), []).append(position)
+            employees = {str(match['employee_id'])
+                         for field in ('matches', 'top_3', 'intelligent_team') for match in result.get(field, [])}
+            for emp_id in employees:
+                by_employee.setdefault(emp_id, []).append(position)
+        self.by_domain = {domain: np.array(positions, dtype=np.int64) for domain, positions in by_domain.items()}
+        self.by_employee = {emp_id: np.array(positions, dtype=np.int64) for emp_id, positions in by_employee.items()}
+
+        # Every sort key's ascending order of positions, sorted once; filtered views keep this order
+        self.sort_values: Dict[str, List] = {}
+        self.orders: Dict[str, np.ndarray] = {}
+        self.ranks: Dict[str, np.ndarray] = {}
+        for sort in SORT_KEYS:
+            values = self._values(sort)
+            order = sorted(range(len(results)), key=lambda p: (values[p], self.project_ids[p], p))
+            self.orders[sort] = np.array(order, dtype=np.int64)
+            self.ranks[sort] = np.empty(len(order), dtype=np.int64)
+            self.ranks[sort][self.orders[sort]] = np.arange(len(order))
+        self.sorted_best = np.sort(self.best_scores)
+
+        self.views: 'OrderedDict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray]]' = OrderedDict()
+        self._summary: Optional[Dict] = None
+        self.lock = threading.Lock()
+
+    def _values(self, sort: str) -> List:
+        """Sort value of every project"""
+        if sort not in self.sort_values:
+            if sort == 'project':
+                values = list(range(len(self.results)))
+            elif sort == 'project_id':
+                values = self.project_ids
+            elif sort == 'title':
+                values = [str(result.get('project_title', '')).lower() for result in self.results]
+            elif sort == 'best_score':
+                values = self.best_scores.tolist()
+            else:
+                values = [float(np.mean([_score(match) for match in result['intelligent_team']]))
+                          if result.get('intelligent_team') else 0.0 for result in self.results]
+            self.sort_values[sort] = values
+        return self.sort_values[sort]
+
+    def view(self, sort: str = 'project', domain: Optional[str] = None,
+             employee_id: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Positions passing the filters in ascending sort order, their ranks in the full order and their sorted best scores"""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{sort}' (use one of {', '.join(SORT_KEYS)})")
+
+        key = (sort, domain.strip().lower() if domain else None, employee_id or None)
+        if key[1] is None and key[2] is None:
+            return self.orders[sort], np.arange(len(self.results), dtype=np.int64), self.sorted_best
+        with self.lock:
+            if key in self.views:
+                self.views.move_to_end(key)
+                return self.views[key]
+
+        positions = np.arange(len(self.results), dtype=np.int64)
+        if key[1] is not None:
+            positions = self.by_domain.get(key[1], np.empty(0, dtype=np.int64))
+        if key[2] is not None:
+            positions = np.intersect1d(positions, self.by_employee.get(key[2], np.empty(0, dtype=np.int64)))
+
+        # Only the matching positions are ordered, by their rank in the presorted order
+        ranks = np.sort(self.ranks[sort][positions])
+        view = (self.orders[sort][ranks], ranks, np.sort(self.best_scores[positions]))
+        with self.lock:
+            self.views[key] = view
+            while len(self.views) > MAX_CACHED_VIEWS:
+                self.views.popitem(last=False)
+        return view
+
+    def _rank(self, sort: str, after: Tuple, right: bool) -> int:
+        """Rows of the full order before a cursor key (and the row itself when right), by binary search"""
+        values, order = self._values(sort), self.orders[sort]
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            p = int(order[middle])
+            key = (values[p], self.project_ids[p], p)
+            if key < after or (right and key == after):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _take(self, ordered: np.ndarray, first: int, step: int, limit: int,
+              min_score: Optional[float]) -> Tuple[List[int], bool]:
+        """Up to limit view indices from first walking by step, skipping projects below min_score,
+        and whether more follow; only the rows walked past are read"""
+        taken: List[int] = []
+        index, chunk = first, limit + 1
+        while 0 <= index < len(ordered) and len(taken) <= limit:
+            stop = min(len(ordered), index + chunk) if step > 0 else max(-1, index - chunk)
+            indices = np.arange(index, stop, step)
+            if min_score is not None:
+                indices = indices[self.best_scores[ordered[indices]] >= min_score]
+            taken.extend(indices[:limit + 1 - len(taken)].tolist())
+            index, chunk = stop, chunk * 2
+        return taken[:limit], len(taken) > limit
+
+    def page(self, sort: str = 'project', descending: bool = False, limit: int = DEFAULT_LIMIT,
+             page: Optional[int] = None, cursor: Optional[str] = None, domain: Optional[str] = None,
+             employee_id: Optional[str] = None, min_score: Optional[float] = None) -> Dict:
+        """One page of results with paging details; a cursor continues after the row it was issued for"""
+        ordered, ranks, best = self.view(sort, domain, employee_id)
+        total = len(ordered) if min_score is None else len(best) - int(np.searchsorted(best, min_score))
+        limit = max(1, min(MAX_LIMIT, limit))
+
+        # Indices into the ascending view, walked backwards for descending order
+        if cursor is not None:
+            after = decode_cursor(cursor, sort)
+            first = int(np.searchsorted(ranks, self._rank(sort, after, right=not descending)))
+            if descending:
+                first -= 1
+        else:
+            offset = (max(1, page or 1) - 1) * limit
+            if min_score is None or offset == 0:
+                first = len(ordered) - 1 - offset if descending else offset
+            else:
+                passing = np.flatnonzero(self.best_scores[ordered] >= min_score)
+                if offset >= len(passing):
+                    first = -1 if descending else len(ordered)
+                else:
+                    first = int(passing[-1 - offset] if descending else passing[offset])
+        indices, remaining = self._take(ordered, first, -1 if descending else 1, limit, min_score)
+
+        values = self._values(sort)
+        last = int(ordered[indices[-1]]) if indices else None
+        return {
+            'results': [self.results[ordered[i]] for i in indices],
+            'total': total,
+            'limit': limit,
+            'page': None if cursor is not None else max(1, page or 1),
+            'sort': sort,
+            'order': 'desc' if descending else 'asc',
+            'next_cursor': encode_cursor(sort, (values[last], self.project_ids[last], last)) if remaining else None
+        }
+
+    def summary(self) -> Dict:
+        """Totals, rankings and chart counts the results page shows, computed once per result set"""
+        if self._summary is None:
+            matched, assigned = set(), set()
+            scores = []
+            best: Dict[str, Dict] = {}
+            counts: Dict[str, Dict] = {name: {} for name in ('role', 'domain', 'score', 'skill', 'proficiency', 'capacity')}
+
+            def count(name, value):
+                counts[name][value] = counts[name].get(value, 0) + 1
+
+            for result in self.results:
+                count('domain', str(result.get('project_domain', '')))
+                for match in result.get('matches', []):
+                    score = _score(match)
+                    matched.add(match['employee_id'])
+                    scores.append(score)
+                    if match['employee_id'] not in best or _score(best[match['employee_id']]) < score:
+                        best[match['employee_id']] = match
+                    count('role', str(match.get('role', '')))
+                    count('proficiency', str(match.get('proficiency', '')))
+                    count('score', next(label for label, bound in SCORE_RANGES if score >= bound))
+                    for skill in match.get('skills', []):
+                        count('skill', skill)
+                    try:
+                        capacity = float(match.get('capacity'))
+                    except (TypeError, ValueError):
+                        capacity = float('nan')
+                    count('capacity', next((label for label, bound in CAPACITY_RANGES if capacity <= bound), '40+ hrs'))
+                for match in result.get('intelligent_team', []):
+                    assigned.add(match['employee_id'])
+
+            counts['skill'] = dict(sorted(counts['skill'].items(), key=lambda item: -item[1])[:TOP_SKILLS])
+            self._summary = {
+                'projects': len(self.results),
+                'matched_employees': len(matched),
+                'assigned_employees': len(assigned),
+                'avg_match_score': round(float(np.mean(scores)), 2) if scores else 0.0,
+                'high_quality_matches': int(sum(score >= 80 for score in scores)),
+                'domains': sorted(counts['domain']),
+                'top_employees': sorted(best.values(), key=lambda match: -_score(match))[:TOP_EMPLOYEES],
+                'counts': counts
+            }
+        return self._summary
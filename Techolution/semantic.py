@@ -0,0 +1,174 @@
+"""
+Semantic relevance for AI-Driven Talent Management System
+TF-IDF vectors of employees' previous projects and project titles, cached on disk per dataset version
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from typing import List, Optional, Sequence
+import hashlib
+import json
+import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Vectorizer settings; part of the cache key so a change refits
+TFIDF_PARAMS = {'stop_words': 'english', 'sublinear_tf': True, 'dtype': np.float64}
+CACHE_FORMAT = 1
+
+# Fitted models kept in the cache directory, newest first
+MAX_CACHED_MODELS = 4
+
+
+def _text(value) -> str:
+    """A text field as a string, empty for missing values"""
+    try:
+        if value is None or pd.isna(value):
+            return ''
+    except (TypeError, ValueError):
+        pass
+    return str(value).strip()
+
+
+def employee_text(description) -> str:
+    """Text an employee is matched on: the Previous Project Description"""
+    return _text(description)
+
+
+def project_text(title, domain) -> str:
+    """Text a project is matched on: its title and domain"""
+    return ' '.join(part for part in (_text(title), _text(domain)) if part)
+
+
+def content_hash(employee_texts: Sequence[str], project_texts: Sequence[str]) -> str:
+    """Key of one dataset version's texts and the vectorizer settings"""
+    digest = hashlib.sha256()
+    settings = dict(TFIDF_PARAMS, dtype=np.dtype(TFIDF_PARAMS['dtype']).str, format=CACHE_FORMAT)
+    digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    for texts in (employee_texts, project_texts):
+        digest.update(json.dumps(list(texts)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class TextModel:
+    """TF-IDF model fitted on one dataset version, with the L2-normalized rows of its texts"""
+
+    def __init__(self, vectorizer: Optional[TfidfVectorizer], emp_matrix: sparse.csr_matrix,
+                 proj_matrix: sparse.csr_matrix):
+        self.vectorizer = vectorizer  # None when the texts hold no words beyond stop words
+        self.emp_matrix = emp_matrix
+        self.proj_matrix = proj_matrix
+
+    @property
+    def num_terms(self) -> int:
+        return 0 if self.vectorizer is None else len(self.vectorizer.vocabulary_)
+
+    @staticmethod
+    def _sorted(matrix) -> sparse.csr_matrix:
+        """CSR matrix with sorted column indices, so products sum terms in the same order everywhere"""
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+        matrix.sort_indices()
+        return matrix
+
+    def transform(self, texts: List[str]) -> sparse.csr_matrix:
+        """Rows for new texts in the fitted vocabulary (unseen words are dropped)"""
+        if not texts:
+            return sparse.csr_matrix((0, self.num_terms), dtype=np.float64)
+        if not self.num_terms:
+            return sparse.csr_matrix((len(texts), 0), dtype=np.float64)
+        return self._sorted(self.vectorizer.transform(texts))
+
+    def similarity(self, employee: str, project: str) -> float:
+        """Cosine similarity of one employee text and one project text"""
+        return float((self.transform([project]) @ self.transform([employee]).T).toarray()[0, 0])
+
+    @classmethod
+    def fit(cls, employee_texts: List[str], project_texts: List[str]) -> 'TextModel':
+        """Fit the vocabulary and IDF weights on all texts of a dataset version"""
+        vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+        try:
+            matrix = cls._sorted(vectorizer.fit_transform(list(employee_texts) + list(project_texts)))
+        except ValueError:
+            # Nothing but stop words (or no text at all): an empty vocabulary
+            vectorizer = None
+            matrix = sparse.csr_matrix((len(employee_texts) + len(project_texts), 0), dtype=np.float64)
+        return cls(vectorizer, matrix[:len(employee_texts)], matrix[len(employee_texts):])
+
+    def save(self, path: str):
+        """Write the model and both matrices to one .npz file"""
+        arrays = {'terms': np.array(self.vectorizer.get_feature_names_out() if self.num_terms else [], dtype=str),
+                  'idf': self.vectorizer.idf_ if self.num_terms else np.empty(0)}
+        for prefix, matrix in (('emp', self.emp_matrix), ('proj', self.proj_matrix)):
+            arrays[f'{prefix}_data'] = matrix.data
+            arrays[f'{prefix}_indices'] = matrix.indices
+            arrays[f'{prefix}_indptr'] = matrix.indptr
+            arrays[f'{prefix}_shape'] = np.array(matrix.shape)
+
+        # Written under a temporary name so a crash never leaves a partial cache entry (one per thread,
+        # as background jobs may fit the same model at once)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, 'wb') as handle:
+            np.savez(handle, **arrays)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'TextModel':
+        """Read a model written by save()"""
+        with np.load(path) as arrays:
+            terms = arrays['terms'].tolist()
+            vectorizer = None
+            if terms:
+                vectorizer = TfidfVectorizer(vocabulary=terms, **TFIDF_PARAMS)
+                vectorizer.idf_ = arrays['idf']
+            matrices = [
+                sparse.csr_matrix(
+                    (arrays[f'{prefix}_data'], arrays[f'{prefix}_indices'], arrays[f'{prefix}_indptr']),
+                    shape=tuple(arrays[f'{prefix}_shape'])
+                )
+                for prefix in ('emp', 'proj')
+            ]
+        return cls(vectorizer, *matrices)
+
+    @classmethod
+    def load_or_fit(cls, employee_texts: List[str], project_texts: List[str],
+                    cache_dir: Optional[str] = None) -> 'TextModel':
+        """Model of a dataset version, read from the cache directory when it was fitted before"""
+        if not cache_dir:
+            return cls.fit(employee_texts, project_texts)
+
+        key = content_hash(employee_texts, project_texts)
+        path = os.path.join(cache_dir, f"tfidf_{key}.npz")
+        if os.path.exists(path):
+            try:
+                model = cls.load(path)
+                os.utime(path)  # recently used entries survive pruning
+                logger.info(f"Loaded TF-IDF model {key[:12]} from cache ({model.num_terms} terms)")
+                return model
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable TF-IDF cache {path}: {e}")
+
+        model = cls.fit(employee_texts, project_texts)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            model.save(path)
+            prune_cache(cache_dir)
+            logger.info(f"Fitted TF-IDF model {key[:12]} ({model.num_terms} terms) and cached it")
+        except OSError as e:
+            logger.warning(f"Could not cache TF-IDF model in {cache_dir}: {e}")
+        return model
+
+
+def prune_cache(cache_dir: str, keep: int = MAX_CACHED_MODELS):
+    """Delete all but the most recently used cached models"""
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+               if name.startswith('tfidf_') and name.endswith('.npz')]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -226,17 +226,25 @@ async function performMatching() {
     showLoading('Performing AI matching...', 'Analyzing data and generating optimal allocations');
     
     try {
+        // Matching runs as a background job; poll it until it finishes
         const response = await fetch('/api/match', {
-            method: 'POST'
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ async: true })
         });
         
         const result = await response.json();
+        if (result.status !== 'success') {
+            showNotification('Error performing matching: ' + result.message, 'error');
+            return;
+        }
         
-        if (result.status === 'success') {
+        const job = await waitForJob(result.data.job_id);
+        if (job.state === 'done') {
             // Redirect to results page
             window.location.href = '/results';
         } else {
-            showNotification('Error performing matching: ' + result.message, 'error');
+            showNotification('Error performing matching: ' + (job.error || job.message), 'error');
         }
     } catch (error) {
         showNotification('Error performing matching: ' + error.message, 'error');
@@ -245,6 +253,23 @@ async function performMatching() {
     }
 }
 
+async function waitForJob(jobId) {
+    while (true) {
+        const response = await fetch(`/api/jobs/${jobId}?results=0`);
+        const result = await response.json();
+        if (result.status !== 'success') {
+            return { state: 'failed', message: result.message };
+        }
+        
+        const job = result.data;
+        if (job.state === 'done' || job.state === 'failed') {
+            return job;
+        }
+        showLoading('Performing AI matching...', `${job.projects_done} of ${job.projects_total || '?'} projects matched (${job.percent}%)`);
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+}
+
 async function loadDataStatus() {
     try {
         const response = await fetch('/api/data');
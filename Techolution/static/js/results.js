@@ -1,6 +1,9 @@
 // Results page JavaScript functionality
-let matchingData = null;
-let filteredData = null;
+const PAGE_SIZE = 20;
+let matchingData = null;  // projects of the pages loaded so far
+let resultSummary = null;  // totals, rankings and chart counts of the whole result set, from the server
+let nextCursor = null;
+let filterTimer = null;
 
 document.addEventListener('DOMContentLoaded', function() {
     loadResults();
@@ -8,89 +11,68 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeFilters();
 });
 
-async function loadResults() {
+function resultsQuery() {
+    // Filtering, sorting and paging happen on the server; the browser only holds the pages shown
+    const [sort, order] = document.getElementById('sort-filter').value.split(':');
+    const params = new URLSearchParams({ limit: PAGE_SIZE, sort: sort, order: order });
+    const employeeId = document.getElementById('search-input').value.trim();
+    const domain = document.getElementById('domain-filter').value;
+    const minScore = document.getElementById('score-filter').value;
+    if (employeeId) params.set('employee_id', employeeId);
+    if (domain) params.set('domain', domain);
+    if (minScore) params.set('min_score', minScore);
+    return params;
+}
+
+async function loadResults(cursor = null) {
     try {
-        const response = await fetch('/api/results');
+        const params = resultsQuery();
+        if (cursor) params.set('cursor', cursor);
+        const response = await fetch('/api/results?' + params.toString());
         const result = await response.json();
+        if (result.status !== 'success') {
+            showError(resultSummary ? 'Error loading results: ' + result.message
+                                    : 'No matching results available. Please perform matching first.');
+            return;
+        }
         
-        if (result.status === 'success') {
-            matchingData = result.data;
-            filteredData = result.data;
-            displayResults();
+        const firstLoad = !resultSummary;
+        matchingData = cursor ? matchingData.concat(result.data) : result.data;
+        nextCursor = result.pagination.next_cursor;
+        resultSummary = result.summary;
+        
+        displayResults(result.pagination);
+        populateRecommendations();
+        if (firstLoad) {
             updateSummary();
-            populateRecommendations();
             populateRankings();
             updateFilters();
-        } else {
-            showError('No matching results available. Please perform matching first.');
+            initializeCharts();
         }
     } catch (error) {
         showError('Error loading results: ' + error.message);
     }
 }
 
-function displayResults() {
+function loadMoreResults() {
+    if (nextCursor) loadResults(nextCursor);
+}
+
+function displayResults(pagination) {
     if (!matchingData) return;
     
-    // Calculate summary statistics
-    const totalProjects = matchingData.length;
-    const totalEmployees = new Set();
-    let totalMatches = 0;
-    let totalScore = 0;
-    let highQualityMatches = 0;
-    
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            totalEmployees.add(match.employee_id);
-            totalMatches++;
-            totalScore += match.overall_score;
-            if (match.overall_score >= 80) {
-                highQualityMatches++;
-            }
-        });
-    });
-    
-    const avgScore = totalMatches > 0 ? Math.round(totalScore / totalMatches) : 0;
-    
-    // Update summary
-    document.getElementById('total-projects').textContent = totalProjects;
-    document.getElementById('total-employees').textContent = totalEmployees.size;
-    document.getElementById('avg-match-score').textContent = avgScore + '%';
-    document.getElementById('top-matches').textContent = highQualityMatches;
-    
-    // Populate results table
     populateResultsTable();
+    
+    const status = document.getElementById('results-page-status');
+    if (status && pagination) {
+        status.textContent = `Showing ${matchingData.length} of ${pagination.total} projects`;
+    }
+    const loadMore = document.getElementById('load-more');
+    if (loadMore) loadMore.style.display = nextCursor ? '' : 'none';
 }
 
 function updateSummary() {
-    if (!matchingData) return;
-    
-    // Calculate summary statistics
-    const totalProjects = matchingData.length;
-    const totalEmployees = new Set();
-    const assignedEmployees = new Set(); // Track employees assigned to intelligent teams
-    let totalMatches = 0;
-    let totalScore = 0;
-    let highQualityMatches = 0;
-    
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            totalEmployees.add(match.employee_id);
-            totalMatches++;
-            totalScore += match.overall_score;
-            if (match.overall_score >= 80) {
-                highQualityMatches++;
-            }
-        });
-        
-        // Count employees in intelligent teams
-        const intelligentTeam = project.intelligent_team || project.top_3 || [];
-        intelligentTeam.forEach(match => {
-            assignedEmployees.add(match.employee_id);
-        });
-    });
-    
-    const avgScore = totalMatches > 0 ? Math.round(totalScore / totalMatches) : 0;
+    if (!resultSummary) return;
     
     // Update summary elements
     const totalProjectsEl = document.getElementById('total-projects');
@@ -98,14 +80,14 @@ function updateSummary() {
     const avgScoreEl = document.getElementById('avg-match-score');
     const topMatchesEl = document.getElementById('top-matches');
     
-    if (totalProjectsEl) totalProjectsEl.textContent = totalProjects;
-    if (totalEmployeesEl) totalEmployeesEl.textContent = assignedEmployees.size; // Show assigned employees
-    if (avgScoreEl) avgScoreEl.textContent = avgScore + '%';
-    if (topMatchesEl) topMatchesEl.textContent = highQualityMatches;
+    if (totalProjectsEl) totalProjectsEl.textContent = resultSummary.projects;
+    if (totalEmployeesEl) totalEmployeesEl.textContent = resultSummary.assigned_employees; // Show assigned employees
+    if (avgScoreEl) avgScoreEl.textContent = Math.round(resultSummary.avg_match_score) + '%';
+    if (topMatchesEl) topMatchesEl.textContent = resultSummary.high_quality_matches;
     
     // Add a note about no duplicates
     const summaryCard = document.querySelector('.summary-card');
-    if (summaryCard && assignedEmployees.size > 0) {
+    if (summaryCard && resultSummary.assigned_employees > 0) {
         const existingNote = summaryCard.querySelector('.no-duplicates-note');
         if (!existingNote) {
             const note = document.createElement('div');
@@ -123,9 +105,9 @@ function populateResultsTable() {
     const tbody = document.getElementById('results-tbody');
     tbody.innerHTML = '';
     
-    if (!filteredData) return;
+    if (!matchingData) return;
     
-    filteredData.forEach(project => {
+    matchingData.forEach(project => {
         project.matches.forEach(match => {
             const row = document.createElement('tr');
             row.innerHTML = `
@@ -421,26 +403,10 @@ function populateRankings() {
     const container = document.getElementById('ranking-list');
     container.innerHTML = '';
     
-    if (!matchingData) return;
+    if (!resultSummary) return;
     
-    // Collect all employees with their best scores
-    const employeeScores = new Map();
-    
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            const empId = match.employee_id;
-            if (!employeeScores.has(empId) || employeeScores.get(empId).overall_score < match.overall_score) {
-                employeeScores.set(empId, match);
-            }
-        });
-    });
-    
-    // Sort by score
-    const sortedEmployees = Array.from(employeeScores.values())
-        .sort((a, b) => b.overall_score - a.overall_score)
-        .slice(0, 10);
-    
-    sortedEmployees.forEach((employee, index) => {
+    // Best match of each employee across all projects, ranked on the server
+    resultSummary.top_employees.forEach((employee, index) => {
         const rankingItem = document.createElement('div');
         rankingItem.className = 'ranking-item';
         rankingItem.innerHTML = `
@@ -455,75 +421,39 @@ function populateRankings() {
 }
 
 function updateFilters() {
-    const projectFilter = document.getElementById('project-filter');
-    const roleFilter = document.getElementById('role-filter');
+    const domainFilter = document.getElementById('domain-filter');
     
-    // Populate project filter
-    projectFilter.innerHTML = '<option value="">All Projects</option>';
-    if (matchingData) {
-        matchingData.forEach(project => {
+    // Populate domain filter
+    domainFilter.innerHTML = '<option value="">All Domains</option>';
+    if (resultSummary) {
+        resultSummary.domains.forEach(domain => {
             const option = document.createElement('option');
-            option.value = project.project_id;
-            option.textContent = project.project_title;
-            projectFilter.appendChild(option);
-        });
-    }
-    
-    // Populate role filter
-    const roles = new Set();
-    if (matchingData) {
-        matchingData.forEach(project => {
-            project.matches.forEach(match => {
-                roles.add(match.role);
-            });
+            option.value = domain;
+            option.textContent = domain || '(No domain)';
+            domainFilter.appendChild(option);
         });
     }
-    
-    roleFilter.innerHTML = '<option value="">All Roles</option>';
-    roles.forEach(role => {
-        const option = document.createElement('option');
-        option.value = role;
-        option.textContent = role;
-        roleFilter.appendChild(option);
-    });
 }
 
 function initializeFilters() {
     const searchInput = document.getElementById('search-input');
-    const projectFilter = document.getElementById('project-filter');
-    const roleFilter = document.getElementById('role-filter');
+    const domainFilter = document.getElementById('domain-filter');
+    const scoreFilter = document.getElementById('score-filter');
+    const sortFilter = document.getElementById('sort-filter');
     
-    searchInput.addEventListener('input', applyFilters);
-    projectFilter.addEventListener('change', applyFilters);
-    roleFilter.addEventListener('change', applyFilters);
+    searchInput.addEventListener('input', () => {
+        clearTimeout(filterTimer);
+        filterTimer = setTimeout(applyFilters, 300);
+    });
+    domainFilter.addEventListener('change', applyFilters);
+    scoreFilter.addEventListener('change', applyFilters);
+    sortFilter.addEventListener('change', applyFilters);
 }
 
 function applyFilters() {
-    const searchTerm = document.getElementById('search-input').value.toLowerCase();
-    const projectFilter = document.getElementById('project-filter').value;
-    const roleFilter = document.getElementById('role-filter').value;
-    
-    if (!matchingData) return;
-    
-    filteredData = matchingData.map(project => {
-        const filteredMatches = project.matches.filter(match => {
-            const matchesSearch = !searchTerm || 
-                match.employee_name.toLowerCase().includes(searchTerm) ||
-                match.project_title.toLowerCase().includes(searchTerm);
-            
-            const matchesProject = !projectFilter || project.project_id === projectFilter;
-            const matchesRole = !roleFilter || match.role === roleFilter;
-            
-            return matchesSearch && matchesProject && matchesRole;
-        });
-        
-        return {
-            ...project,
-            matches: filteredMatches
-        };
-    });
-    
-    displayResults();
+    // A new filter or sort starts again from the first page
+    if (!resultSummary) return;
+    loadResults();
 }
 
 function showTab(tabName) {
@@ -550,7 +480,7 @@ function showTab(tabName) {
 }
 
 function initializeCharts() {
-    if (!matchingData) return;
+    if (!resultSummary) return;
     
     // Role distribution chart
     createRoleChart();
@@ -575,12 +505,7 @@ function createRoleChart() {
     const ctx = document.getElementById('roleChart');
     if (!ctx) return;
     
-    const roleCounts = {};
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            roleCounts[match.role] = (roleCounts[match.role] || 0) + 1;
-        });
-    });
+    const roleCounts = resultSummary.counts.role;
     
     new Chart(ctx, {
         type: 'doughnut',
@@ -608,10 +533,7 @@ function createDomainChart() {
     const ctx = document.getElementById('domainChart');
     if (!ctx) return;
     
-    const domainCounts = {};
-    matchingData.forEach(project => {
-        domainCounts[project.project_domain] = (domainCounts[project.project_domain] || 0) + 1;
-    });
+    const domainCounts = resultSummary.counts.domain;
     
     new Chart(ctx, {
         type: 'pie',
@@ -639,23 +561,9 @@ function createScoreChart() {
     const ctx = document.getElementById('scoreChart');
     if (!ctx) return;
     
-    const scoreRanges = {
-        '90-100%': 0,
-        '80-89%': 0,
-        '70-79%': 0,
-        '60-69%': 0,
-        'Below 60%': 0
-    };
-    
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            const score = match.overall_score;
-            if (score >= 90) scoreRanges['90-100%']++;
-            else if (score >= 80) scoreRanges['80-89%']++;
-            else if (score >= 70) scoreRanges['70-79%']++;
-            else if (score >= 60) scoreRanges['60-69%']++;
-            else scoreRanges['Below 60%']++;
-        });
+    const scoreRanges = {};
+    ['90-100%', '80-89%', '70-79%', '60-69%', 'Below 60%'].forEach(range => {
+        scoreRanges[range] = resultSummary.counts.score[range] || 0;
     });
     
     new Chart(ctx, {
@@ -689,18 +597,9 @@ function createSkillChart() {
     const ctx = document.getElementById('skillChart');
     if (!ctx) return;
     
-    const skillCounts = {};
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            match.skills.forEach(skill => {
-                skillCounts[skill] = (skillCounts[skill] || 0) + 1;
-            });
-        });
-    });
-    
-    const sortedSkills = Object.entries(skillCounts)
-        .sort(([,a], [,b]) => b - a)
-        .slice(0, 8);
+    // The server keeps the eight most listed skills
+    const sortedSkills = Object.entries(resultSummary.counts.skill)
+        .sort(([,a], [,b]) => b - a);
     
     new Chart(ctx, {
         type: 'doughnut',
@@ -736,12 +635,7 @@ function createProficiencyChart() {
     const ctx = document.getElementById('proficiencyChart');
     if (!ctx) return;
     
-    const proficiencyCounts = {};
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            proficiencyCounts[match.proficiency] = (proficiencyCounts[match.proficiency] || 0) + 1;
-        });
-    });
+    const proficiencyCounts = resultSummary.counts.proficiency;
     
     new Chart(ctx, {
         type: 'doughnut',
@@ -767,21 +661,9 @@ function createCapacityChart() {
     const ctx = document.getElementById('capacityChart');
     if (!ctx) return;
     
-    const capacityRanges = {
-        '0-20 hrs': 0,
-        '21-30 hrs': 0,
-        '31-40 hrs': 0,
-        '40+ hrs': 0
-    };
-    
-    matchingData.forEach(project => {
-        project.matches.forEach(match => {
-            const capacity = match.capacity;
-            if (capacity <= 20) capacityRanges['0-20 hrs']++;
-            else if (capacity <= 30) capacityRanges['21-30 hrs']++;
-            else if (capacity <= 40) capacityRanges['31-40 hrs']++;
-            else capacityRanges['40+ hrs']++;
-        });
+    const capacityRanges = {};
+    ['0-20 hrs', '21-30 hrs', '31-40 hrs', '40+ hrs'].forEach(range => {
+        capacityRanges[range] = resultSummary.counts.capacity[range] || 0;
     });
     
     new Chart(ctx, {
@@ -819,7 +701,7 @@ function viewDetails(employeeId, projectId) {
     );
     
     if (match) {
-        alert(`Employee: ${match.employee_name}\nProject: ${match.project_title}\nOverall Score: ${match.overall_score}%\nSkill Match: ${match.skill_match}%\nProficiency Match: ${match.proficiency_match}%\nAvailability Match: ${match.availability_match}%\nCapacity Match: ${match.capacity_match}%`);
+        alert(`Employee: ${match.employee_name}\nProject: ${match.project_title}\nOverall Score: ${match.overall_score}%\nSkill Match: ${match.skill_match}%\nProficiency Match: ${match.proficiency_match}%\nAvailability Match: ${match.availability_match}%\nCapacity Match: ${match.capacity_match}%${match.semantic_match !== undefined ? `\nSemantic Match: ${match.semantic_match}%` : ''}`);
     }
 }
 
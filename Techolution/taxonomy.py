@@ -0,0 +1,170 @@
+"""
+Domain taxonomy for AI-Driven Talent Management System
+Loads domain skill mappings from a config file and compiles them into bitmasks
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'domain_taxonomy.json')
+
+
+class DomainTaxonomy:
+    """Compiled domain taxonomy with per-skill-set domain and role bitmasks"""
+
+    def __init__(self, config: Dict):
+        """Compile a taxonomy config dict"""
+        domains = config.get('domains', [])
+
+        # Team-building domains, in config order (used for partial matching)
+        self.domain_names = [str(domain['name']).lower() for domain in domains]
+        self.domain_index = {}
+        for index, name in enumerate(self.domain_names):
+            self.domain_index.setdefault(name, index)
+        self.team_skills = [list(domain.get('skills', [])) for domain in domains]
+        self.team_skills.append(list(config.get('default_team_skills', [])))
+        self.default_domain = len(domains)
+        self._team_skills_lower = [[skill.lower() for skill in skills] for skills in self.team_skills]
+
+        # Scoring domains feed the skill-match and domain bonuses
+        self.scoring_names = [
+            name for name, domain in zip(self.domain_names, domains) if domain.get('scoring', True)
+        ]
+        self.scoring_sets = [
+            set(skill.lower() for skill in domain.get('skills', []))
+            for domain in domains if domain.get('scoring', True)
+        ]
+        self.scoring_index = {}
+        for index, name in enumerate(self.scoring_names):
+            self.scoring_index.setdefault(name, index)
+
+        # Complementary roles per domain, each role gets its own bit
+        self.complementary_roles = {}
+        for name, domain in zip(self.domain_names, domains):
+            self.complementary_roles.setdefault(name, list(domain.get('complementary_roles', [])))
+        self.default_complementary_roles = list(config.get('default_complementary_roles', []))
+        self.roles: List[str] = []
+        for roles in list(self.complementary_roles.values()) + [self.default_complementary_roles]:
+            for role in roles:
+                if role not in self.roles:
+                    self.roles.append(role)
+        self.role_index = {role: index for index, role in enumerate(self.roles)}
+        self._roles_lower = [role.lower() for role in self.roles]
+
+        if len(self.team_skills) > 64 or len(self.roles) > 64:
+            raise ValueError("Taxonomy supports at most 64 domains and 64 complementary roles")
+
+        self._profiles: Dict[Tuple[str, ...], Tuple[int, int, int, Tuple[int, ...]]] = {}
+
+    def __getstate__(self):
+        # The skill-set memo is rebuilt on demand, so worker processes don't receive it
+        state = self.__dict__.copy()
+        state['_profiles'] = {}
+        return state
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TAXONOMY_PATH) -> 'DomainTaxonomy':
+        """Load and compile a taxonomy from a JSON config file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def team_domain(self, project_domain) -> int:
+        """Resolve a project domain to its team-building domain index"""
+        project_domain_lower = str(project_domain).lower().strip()
+
+        # Try exact match first, then partial match
+        index = self.domain_index.get(project_domain_lower)
+        if index is None:
+            for candidate, name in enumerate(self.domain_names):
+                if name in project_domain_lower or project_domain_lower in name:
+                    index = candidate
+                    break
+
+        # If still no match (or the domain lists no skills), use the default set
+        if index is None or not self.team_skills[index]:
+            index = self.default_domain
+        return index
+
+    def complementary_roles_for(self, project_domain) -> List[str]:
+        """Complementary roles for a project domain (exact match only)"""
+        return self.complementary_roles.get(str(project_domain).lower().strip(), self.default_complementary_roles)
+
+    def role_bit(self, role: str) -> int:
+        """Bit assigned to a complementary role"""
+        return 1 << self.role_index[role]
+
+    def profile(self, skills) -> Tuple[int, int, int, Tuple[int, ...]]:
+        """Return (team domain mask, role mask, scoring mask, scoring counts) for a skills list"""
+        key = tuple(skills)
+        profile = self._profiles.get(key)
+        if profile is None:
+            skills_lower = [str(skill).lower() for skill in key]
+
+            # Team domains match on substrings of the employee's skills
+            domain_mask = 0
+            for index, domain_skills in enumerate(self._team_skills_lower):
+                if any(domain_skill in skill for skill in skills_lower for domain_skill in domain_skills):
+                    domain_mask |= 1 << index
+
+            role_mask = 0
+            for index, role in enumerate(self._roles_lower):
+                if any(skill in role or role in skill for skill in skills_lower):
+                    role_mask |= 1 << index
+
+            # Scoring domains count exact skill names
+            skill_set = set(skill.strip() for skill in skills_lower)
+            counts = tuple(len(skill_set & domain_skills) for domain_skills in self.scoring_sets)
+            scoring_mask = 0
+            for index, count in enumerate(counts):
+                if count:
+                    scoring_mask |= 1 << index
+
+            profile = (domain_mask, role_mask, scoring_mask, counts)
+            self._profiles[key] = profile
+        return profile
+
+    def skill_masks(self, skills) -> Tuple[int, int]:
+        """Return the (team domain mask, role mask) for a skills list"""
+        profile = self.profile(skills)
+        return profile[0], profile[1]
+
+
+class TaxonomyLoader:
+    """Keeps a compiled taxonomy and recompiles it when the config file changes"""
+
+    def __init__(self, path: str = DEFAULT_TAXONOMY_PATH):
+        self.path = path
+        self.version = 0
+        self._taxonomy: Optional[DomainTaxonomy] = None
+        self._mtime: Optional[float] = None
+
+    def get(self) -> DomainTaxonomy:
+        """Get the compiled taxonomy, recompiling if the config file changed"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+
+        if self._taxonomy is None or mtime != self._mtime:
+            try:
+                self._taxonomy = DomainTaxonomy.load(self.path)
+                self._mtime = mtime
+                self.version += 1
+                logger.info(f"Compiled domain taxonomy from {self.path} (version {self.version})")
+            except Exception as e:
+                if self._taxonomy is None:
+                    raise
+                self._mtime = mtime
+                logger.error(f"Error reloading taxonomy, keeping previous version: {e}")
+        return self._taxonomy
+
+    @property
+    def current(self) -> DomainTaxonomy:
+        """Get the compiled taxonomy without checking the config file"""
+        if self._taxonomy is None:
+            return self.get()
+        return self._taxonomy
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script to verify capacity-splitting allocation
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_capacity_allocation_respects_hours():
+    """Capacity mode splits hours within employee capacity and project demand"""
+    from allocation import CapacityAllocator
+    employees_df, projects_df = make_datasets(num_employees=40, num_projects=8, seed=5)
+    projects_df['Demand_Hours'] = [60, 20, 100, 35, 80, 10, 45, 70]
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+
+    results = app.perform_matching('capacity')
+    assert app.matching_session is None
+    spent = {}
+    for result, demand in zip(results, projects_df['Demand_Hours']):
+        assert result['demand_hours'] == demand
+        assert result['allocated_hours'] <= demand + 1e-6
+        for member in result['intelligent_team']:
+            assert member['allocated_hours'] > 0
+            spent[member['employee_id']] = spent.get(member['employee_id'], 0) + member['allocated_hours']
+    engine = app.get_matching_engine()
+    capacity = dict(zip(engine.emp_ids, engine.emp_hours))
+    assert all(hours <= capacity[emp_id] + 1e-6 for emp_id, hours in spent.items())
+    assert any(hours < capacity[emp_id] for emp_id, hours in spent.items())
+
+    # Candidate pruning reaches the objective of the LP over every eligible pair
+    matcher = app.IncrementalMatcher(engine, None)
+    matcher.score()
+    approx = np.round(matcher.overall * 100, 2)
+
+    def objective(allocator):
+        allocations = allocator.solve(matcher.overall)
+        return sum(approx[p, e] * hours for p, people in enumerate(allocations) for e, hours in people)
+
+    full = CapacityAllocator(engine, candidates_per_project=engine.num_employees,
+                             projects_per_employee=engine.num_projects, max_rounds=0)
+    assert objective(CapacityAllocator(engine)) >= objective(full) * 0.99
+
+
+if __name__ == "__main__":
+    test_capacity_allocation_respects_hours()
+    print("✅ Capacity allocation respects hours")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script to verify global team assignment
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_global_assignment_is_exclusive_and_optimal():
+    """Global mode staffs each employee once and matches a dense assignment optimum"""
+    from scipy.optimize import linear_sum_assignment
+    from assignment import GlobalAssigner, team_slots, OPEN_SLOT_MIN_SCORE, UNFILLED_COST
+    from matching_engine import PROFICIENCY_SLOTS
+    employees_df, projects_df = make_datasets(num_employees=60, num_projects=10, seed=4)
+    projects_df['Team_Size'] = [2, 5, 6, 3, 5, 4, 1, 5, 7, 5]
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+
+    results = app.perform_matching('global')
+    assert app.matching_session is None
+    assigned = [member['employee_id'] for result in results for member in result['intelligent_team']]
+    assert len(assigned) == len(set(assigned))
+    for result, size in zip(results, projects_df['Team_Size']):
+        team = result['intelligent_team']
+        assert len(team) <= size
+        for member in team:
+            for slot in PROFICIENCY_SLOTS:
+                if f"the {slot} slot" in member['selection_reason']:
+                    assert member['proficiency'] == slot
+
+    # Dense reference over every eligible (slot, employee) pair
+    engine = app.get_matching_engine()
+    matcher = app.IncrementalMatcher(engine, None)
+    matcher.score()
+    approx = np.round(matcher.overall * 100, 2)
+    slots = [(p, slot) for p in range(engine.num_projects) for slot in team_slots(engine.proj_team_size[p])]
+    costs = np.full((len(slots), engine.num_employees + len(slots)), 1e9)
+    for row, (p, slot) in enumerate(slots):
+        for e in range(engine.num_employees):
+            if slot is None:
+                eligible = approx[p, e] >= OPEN_SLOT_MIN_SCORE
+            else:
+                eligible = engine.emp_slot[e] == PROFICIENCY_SLOTS.index(slot)
+            if eligible:
+                costs[row, e] = 101 - approx[p, e]
+        costs[row, engine.num_employees + row] = UNFILLED_COST
+    rows, cols = linear_sum_assignment(costs)
+
+    teams = GlobalAssigner(engine, candidates_per_slot=engine.num_employees).solve(matcher.overall)
+    filled = sum(len(team) for team in teams)
+    total = sum(101 - approx[p, e] for p, team in enumerate(teams) for e, _ in team)
+    assert abs(total + UNFILLED_COST * (len(slots) - filled) - costs[rows, cols].sum()) < 1e-6
+
+
+if __name__ == "__main__":
+    test_global_assignment_is_exclusive_and_optimal()
+    print("✅ Global assignment is exclusive and optimal")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test script to verify candidate pruning through the skill index
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_candidate_index_pruning_is_exact():
+    """Scoring only the index candidates gives the same matrix as scoring every pair"""
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=20, seed=9)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    engine = app.get_matching_engine()
+
+    matcher = app.IncrementalMatcher(engine, None)
+    matcher.score()
+    full = matcher.overall.copy()
+    matcher.score(prune=True)
+    assert np.array_equal(matcher.overall, full)
+    assert matcher.stats['pruned'] > 0
+    assert matcher.stats['scored'] + matcher.stats['pruned'] == full.size
+
+    app.perform_matching()
+    assert app.matching_stats['pruned'] == matcher.stats['pruned']
+
+
+if __name__ == "__main__":
+    test_candidate_index_pruning_is_exact()
+    print("✅ Candidate pruning is exact")
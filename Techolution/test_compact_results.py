@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script to verify packed matching results
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_compact_results_round_trip():
+    """Packed results rebuild the exact dicts, key order and int scores included, in every mode"""
+    import pickle
+    from compact_results import CompactResults
+    employees_df, projects_df = make_datasets(num_employees=120, num_projects=15, seed=37)
+    app.result_cache = app.ResultCache(0)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+
+    for mode in ('greedy', 'global', 'capacity'):
+        results = app.perform_matching(mode)
+        assert isinstance(app.matching_results, CompactResults)
+        assert all(packed.raw is None for packed in app.matching_results.projects)
+        assert json.dumps(results, default=str) == json.dumps(list(app.matching_results), default=str)
+
+        restored = pickle.loads(pickle.dumps(CompactResults.from_dicts(results)))
+        assert json.dumps(restored[:], default=str) == json.dumps(results, default=str)
+        assert list(restored.team_ids()) == [rec['employee_id'] for r in results for rec in r['intelligent_team']]
+        types = [type(match[key]) for r in results for match in r['matches'] for key in ('skill_match', 'domain_bonus')]
+        assert types == [type(match[key]) for r in restored for match in r['matches']
+                         for key in ('skill_match', 'domain_bonus')]
+
+    # Results the columns can't hold are kept as they are
+    odd = [{'project_id': 'X', 'matches': [{'employee_id': 'E1'}], 'top_3': [], 'intelligent_team': []}]
+    packed = CompactResults.from_dicts(odd)
+    assert packed.projects[0].raw is odd[0] and list(packed) == odd
+
+
+if __name__ == "__main__":
+    test_compact_results_round_trip()
+    print("✅ Compact results round-trip")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script to verify pooled database connections
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_pooled_connections_reuse_and_read_during_writes():
+    """Calls reuse WAL-mode connections, and readers see committed rows while a write is open"""
+    import tempfile
+    import threading
+    from database import DatabaseManager
+    db = DatabaseManager(os.path.join(tempfile.mkdtemp(), 'pool.db'), pool_size=4)
+    employee = {'emp_id': 'E001', 'name': 'A', 'skills': 'AI, UI/UX', 'role': 'Intern', 'capacity_per_week': 40,
+                'proficiency': 'Senior', 'available_date': '2025-09-01', 'location': 'India'}
+    db.insert_employee(employee)
+    for _ in range(50):
+        assert db.get_employee_by_id('E001')['name'] == 'A'
+    stats = db.pool_stats()
+    assert stats['opened'] == 1 and stats['reused'] >= 50
+    with db.connect() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    # A writer holds an open transaction; a reader in another thread is not blocked by it
+    writer = db.pool.acquire()
+    writer.execute("UPDATE employees SET name = 'B' WHERE emp_id = 'E001'")
+    seen = []
+    reader = threading.Thread(target=lambda: seen.append(db.get_employee_by_id('E001')['name']))
+    reader.start()
+    reader.join(timeout=2)
+    assert seen == ['A']
+    writer.commit()
+    db.pool.release(writer)
+    assert db.get_employee_by_id('E001')['name'] == 'B'
+    assert db.get_employee_skills('E001') == ['AI', 'UI/UX']
+
+    # A rolled back call leaves a clean connection behind
+    try:
+        with db.connect() as conn:
+            conn.execute("UPDATE employees SET name = 'C' WHERE emp_id = 'E001'")
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert db.get_employee_by_id('E001')['name'] == 'B'
+
+
+if __name__ == "__main__":
+    test_pooled_connections_reuse_and_read_during_writes()
+    print("✅ Pooled connections are reused and readable during writes")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script to verify hard constraints
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_hard_constraints_exclude_ineligible_pairs():
+    """Eligibility, experience and location limits apply in every mode without changing scores"""
+    from constraints import HardConstraint, HARD_CONSTRAINTS
+    from matching_engine import MatchingEngine
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=12, seed=11)
+    employees_df['Experience_years'] = [i % 6 if i % 7 else np.nan for i in range(len(employees_df))]
+    projects_df['Eligibility'] = ['Senior, Intermediate', 'All', 'Intern,Full Time', 'Python, ML'] * 3
+    projects_df['Locations'] = [None, 'USA', None, 'India, USA', None, None] * 2
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    engine = app.get_matching_engine()
+
+    roles = dict(zip(employees_df['Emp ID'], employees_df['Role']))
+    levels = dict(zip(employees_df['Emp ID'], employees_df['Proficiency']))
+    locations = dict(zip(employees_df['Emp ID'], employees_df['Location']))
+    experience = dict(zip(employees_df['Emp ID'], employees_df['Experience_years']))
+
+    def check(results):
+        for result, (_, project) in zip(results, projects_df.iterrows()):
+            for member in result['matches'] + result['intelligent_team']:
+                emp_id = member['employee_id']
+                if project['Eligibility'] == 'Senior, Intermediate':
+                    assert 'Senior' in (roles[emp_id], levels[emp_id]) or levels[emp_id] == 'Intermediate'
+                elif project['Eligibility'] == 'Intern,Full Time':
+                    assert roles[emp_id] in ('Intern', 'Full Time')
+                if isinstance(project['Locations'], str):
+                    assert locations[emp_id] in project['Locations']
+                assert np.isnan(experience[emp_id]) or experience[emp_id] >= project['Experience_years']
+
+    for mode in ('greedy', 'global', 'capacity'):
+        check(app.perform_matching(mode))
+    assert app.matching_stats['ineligible'] > 0
+
+    matcher = app.IncrementalMatcher(engine, None)
+    matcher.score()
+    full = matcher.overall.copy()
+    matcher.score(prune=True)
+    assert np.array_equal(matcher.overall, full)
+    assert np.isinf(full).sum() == matcher.stats['ineligible']
+
+    # Extra constraints plug in as HardConstraint subclasses
+    class NoInterns(HardConstraint):
+        def __init__(self, engine):
+            self.mask_value = np.array([role != 'Intern' for role in engine.emp_roles])
+
+        def requirement(self, project_index):
+            return 'no-interns'
+
+        def mask(self, project_index):
+            return self.mask_value
+
+    # Both methods are required
+    class RequirementOnly(HardConstraint):
+        def requirement(self, project_index):
+            return None
+    try:
+        RequirementOnly(engine)
+        raise AssertionError("HardConstraint without mask() was instantiated")
+    except TypeError:
+        pass
+
+    custom = MatchingEngine(employees_df, projects_df, engine.taxonomy, constraints=HARD_CONSTRAINTS + [NoInterns])
+    app.matching_engine = custom
+    results = app.perform_matching('greedy')
+    assert all(roles[m['employee_id']] != 'Intern' for result in results for m in result['intelligent_team'])
+
+
+if __name__ == "__main__":
+    test_hard_constraints_exclude_ineligible_pairs()
+    print("✅ Hard constraints exclude ineligible pairs")
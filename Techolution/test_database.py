@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test script to verify bulk imports, row-hash syncs and snapshots of the database
+"""
+
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_bulk_insert_upserts_rows_and_replaces_skills():
+    """Bulk imports match row-by-row inserts, keep row ids on re-import and leave no orphaned skills"""
+    import sqlite3
+    import tempfile
+    from database import DatabaseManager, convert_to_date_string
+    employees_df, projects_df = make_datasets(num_employees=80, num_projects=10, seed=43)
+    employees_df['Capacity per week (hrs)'] = employees_df['Capacity per week (hrs)'].fillna(40)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    folder = tempfile.mkdtemp()
+    bulk = DatabaseManager(os.path.join(folder, 'bulk.db'))
+    single = DatabaseManager(os.path.join(folder, 'single.db'))
+
+    def dump(db):
+        with sqlite3.connect(db.db_path) as conn:
+            return [conn.execute(query).fetchall() for query in (
+                'SELECT emp_id, name, skills, role, capacity_per_week, previous_project_description, proficiency, '
+                'available_date, location FROM employees ORDER BY emp_id',
+                'SELECT project_id, project_title, domain, eligibility, duration, proficiency, conflicts, '
+                'hard_deadline, experience_years FROM projects ORDER BY project_id',
+                'SELECT e.emp_id, s.skill FROM employee_skills s JOIN employees e ON s.employee_id = e.id ORDER BY 1, 2',
+                'SELECT p.project_id, r.requirement FROM project_requirements r JOIN projects p '
+                'ON r.project_id = p.id ORDER BY 1, 2',
+                'SELECT COUNT(*) FROM employee_skills WHERE employee_id NOT IN (SELECT id FROM employees)',
+                'SELECT emp_id, id FROM employees ORDER BY emp_id'
+            )]
+
+    assert bulk.bulk_insert_employees(employees_df) == 80
+    assert bulk.bulk_insert_projects(projects_df) == 10
+    before = dump(bulk)
+
+    # Re-importing changed rows (and one listed twice) updates them in place
+    changed = employees_df.iloc[:20].assign(Skills='DevOps, AI, DevOps')
+    changed = pd.concat([changed, changed.iloc[:1].assign(Skills='UI/UX')])
+    assert bulk.bulk_insert_employees(changed) == 21
+    after = dump(bulk)
+    assert after[5] == before[5] and after[4] == [(0,)]
+    skills = {}
+    for emp_id, skill in after[2]:
+        skills.setdefault(emp_id, []).append(skill)
+    first = str(changed['Emp ID'].iloc[0])
+    assert skills[first] == ['UI/UX']
+    assert all(skills[str(emp_id)] == ['AI', 'DevOps'] for emp_id in changed['Emp ID'].iloc[1:20])
+
+    # The single-row path gives the same tables
+    for _, row in pd.concat([employees_df, changed]).iterrows():
+        single.insert_employee({
+            'emp_id': str(row['Emp ID']), 'name': str(row['Name']), 'skills': str(row['Skills']),
+            'role': str(row['Role']), 'capacity_per_week': float(row['Capacity per week (hrs)']),
+            'previous_project_description': str(row['Previous Project Description']),
+            'proficiency': str(row['Proficiency']), 'available_date': convert_to_date_string(row['Available Date']),
+            'location': str(row['Location'])
+        })
+    single.bulk_insert_projects(projects_df)
+    assert dump(single)[:5] == after[:5]
+
+
+def test_sync_writes_only_changed_rows():
+    """Syncing a re-exported file inserts, updates and deletes only what changed, like a fresh import"""
+    import sqlite3
+    import tempfile
+    from database import DatabaseManager
+    from migrate_data import clean_employees_data, clean_projects_data
+    employees_df, projects_df = make_datasets(num_employees=200, num_projects=20, seed=47)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    employees_df = clean_employees_data(employees_df)
+    projects_df = clean_projects_data(projects_df)
+    folder = tempfile.mkdtemp()
+    db = DatabaseManager(os.path.join(folder, 'sync.db'))
+
+    assert db.sync_employees(employees_df)['inserted'] == 200
+    assert db.sync_projects(projects_df)['inserted'] == 20
+    unchanged = db.sync_employees(employees_df)
+    assert (unchanged['inserted'], unchanged['updated'], unchanged['deleted'], unchanged['unchanged']) == (0, 0, 0, 200)
+
+    edited = employees_df.copy()
+    edited.loc[edited.index[3], 'Skills'] = 'DevOps'
+    edited.loc[edited.index[4], 'Available Date'] = pd.Timestamp('2026-02-01')
+    edited = edited.drop(index=edited.index[[5, 6]])
+    edited = pd.concat([edited, employees_df.iloc[:1].assign(**{'Emp ID': 'E999'})])
+    with sqlite3.connect(db.db_path) as conn:
+        ids_before = dict(conn.execute('SELECT emp_id, id FROM employees'))
+    changes = db.sync_employees(edited)
+    assert (changes['inserted'], changes['updated'], changes['deleted'], changes['unchanged']) == (1, 2, 2, 196)
+
+    fresh = DatabaseManager(os.path.join(folder, 'fresh.db'))
+    fresh.bulk_insert_employees(edited)
+    queries = ('SELECT emp_id, name, skills, capacity_per_week, available_date, row_hash FROM employees ORDER BY emp_id',
+               'SELECT e.emp_id, s.skill FROM employee_skills s JOIN employees e ON s.employee_id = e.id ORDER BY 1, 2',
+               'SELECT COUNT(*) FROM employee_skills WHERE employee_id NOT IN (SELECT id FROM employees)')
+    with sqlite3.connect(db.db_path) as synced, sqlite3.connect(fresh.db_path) as imported:
+        for query in queries:
+            assert synced.execute(query).fetchall() == imported.execute(query).fetchall()
+        ids_after = dict(synced.execute('SELECT emp_id, id FROM employees'))
+    assert all(ids_after[emp_id] == row_id for emp_id, row_id in ids_before.items() if emp_id in ids_after)
+
+
+def test_database_snapshot_reloads_only_on_new_versions():
+    """Matching on the database snapshot equals matching on the CSV files; only outside writes reload it"""
+    import tempfile
+    import database
+    from database import DatabaseManager
+    from migrate_data import clean_employees_data, clean_projects_data
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=12, seed=53)
+    employees_df['Capacity per week (hrs)'] = employees_df['Capacity per week (hrs)'].fillna(40)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    folder = tempfile.mkdtemp()
+    employees_df.to_csv(os.path.join(folder, 'Employees.csv'), index=False)
+    projects_df.to_csv(os.path.join(folder, 'Projects.csv'), index=False)
+    employees_df = pd.read_csv(os.path.join(folder, 'Employees.csv'))
+    projects_df = pd.read_csv(os.path.join(folder, 'Projects.csv'))
+    app.employees_df = employees_df.copy()
+    app.projects_df = projects_df.copy()
+    app.preprocess_data()
+    expected = json.dumps(app.perform_matching(), default=str)
+
+    db = DatabaseManager(os.path.join(folder, 'snapshot.db'))
+    db.sync_employees(clean_employees_data(employees_df))
+    db.sync_projects(clean_projects_data(projects_df))
+    default_db, database.db_manager = database.db_manager, db
+    try:
+        app.load_data()
+        assert app.data_version == db.get_data_version()
+        assert json.dumps(app.perform_matching(), default=str) == expected
+
+        with app.app.test_client() as client:
+            # Unchanged data is not reloaded, nor are the app's own edits
+            loaded = app.employees_df
+            client.get('/api/data')
+            app.upsert_employee('E001', {'location': 'USA'})
+            edited = app.employees_df
+            client.get('/api/data')
+            assert app.employees_df is edited and edited is not loaded
+            assert app.data_version == db.get_data_version()
+
+            # Another writer moves the version, and the next request reads its row
+            DatabaseManager(db.db_path).insert_employee({
+                'emp_id': 'E999', 'name': 'Employee 999', 'skills': 'AI', 'role': 'Senior',
+                'capacity_per_week': 40, 'proficiency': 'Senior', 'location': 'India'
+            })
+            assert client.get('/api/data').get_json()['employees_count'] == 151
+            assert app.data_version == db.get_data_version()
+            assert app.employees_df.loc[0, 'Location'] == 'USA'
+    finally:
+        database.db_manager = default_db
+        app.data_version = None
+
+
+def test_optional_columns_reach_matching_through_the_database():
+    """Team_Size, Demand_Hours, Locations and employee Experience_years survive a sync and a snapshot load"""
+    import sqlite3
+    import tempfile
+    import database
+    from database import DatabaseManager
+    from migrate_data import sync_csv_to_database
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=8, seed=71)
+    employees_df['Capacity per week (hrs)'] = employees_df['Capacity per week (hrs)'].fillna(40)
+    employees_df['Experience_years'] = [i % 6 if i % 5 else np.nan for i in range(len(employees_df))]
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    projects_df['Team_Size'] = [2, 3, 1, 4, 2, 3, None, 2]
+    projects_df['Demand_Hours'] = [60, 20, None, 35, 80, 10, 45, 70]
+    projects_df['Locations'] = ['USA', None, 'India', None, 'USA, India', None, None, 'USA']
+    folder = tempfile.mkdtemp()
+    paths = {'employees': os.path.join(folder, 'Employees.csv'), 'projects': os.path.join(folder, 'Projects.csv')}
+    employees_df.to_csv(paths['employees'], index=False)
+    projects_df.to_csv(paths['projects'], index=False)
+    app.employees_df = pd.read_csv(paths['employees'])
+    app.projects_df = pd.read_csv(paths['projects'])
+    app.preprocess_data()
+    expected = {mode: json.dumps(app.perform_matching(mode), default=str) for mode in ('greedy', 'global', 'capacity')}
+
+    # A database from before the optional columns gains them in place
+    path = os.path.join(folder, 'old.db')
+    DatabaseManager(path)
+    with sqlite3.connect(path) as conn:
+        for table, column in (('employees', 'experience_years'), ('projects', 'locations'),
+                              ('projects', 'team_size'), ('projects', 'demand_hours')):
+            conn.execute(f'ALTER TABLE {table} DROP COLUMN {column}')
+    db = DatabaseManager(path)
+    sync_csv_to_database(db, paths)
+    default_db, database.db_manager = database.db_manager, db
+    try:
+        app.load_data()
+        engine = app.get_matching_engine()
+        assert engine.proj_team_size.tolist() == [2, 3, 1, 4, 2, 3, 5, 2]
+        assert engine.proj_demand_hours.tolist() == [60, 20, 40, 35, 80, 10, 45, 70]
+        assert np.isnan(engine.emp_experience).sum() == 30
+        for mode in ('greedy', 'global', 'capacity'):
+            assert json.dumps(app.perform_matching(mode), default=str) == expected[mode]
+        assert app.matching_stats['ineligible'] > 0
+
+        results = app.perform_matching('global')
+        locations = dict(zip(employees_df['Emp ID'], employees_df['Location']))
+        for result, size, allowed in zip(results, [2, 3, 1, 4, 2, 3, 5, 2], projects_df['Locations']):
+            assert len(result['intelligent_team']) <= size
+            if isinstance(allowed, str):
+                assert all(locations[member['employee_id']] in allowed for member in result['intelligent_team'])
+        demands = [result['demand_hours'] for result in app.perform_matching('capacity')]
+        assert demands == [60, 20, 40, 35, 80, 10, 45, 70]
+    finally:
+        database.db_manager = default_db
+        app.data_version = None
+
+
+if __name__ == "__main__":
+    test_bulk_insert_upserts_rows_and_replaces_skills()
+    test_sync_writes_only_changed_rows()
+    test_database_snapshot_reloads_only_on_new_versions()
+    test_optional_columns_reach_matching_through_the_database()
+    print("✅ Database imports, syncs and snapshots work")
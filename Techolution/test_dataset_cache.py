@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the preprocessed dataset cache
+"""
+
+import sys
+import os
+import json
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_dataset_cache_restores_preprocessed_frames():
+    """Warm loads read the preprocessed frames of a data version back unchanged; new versions parse again"""
+    import tempfile
+    import database
+    from database import DatabaseManager
+    from dataset_cache import DatasetCache, load_frame, save_frame
+    from migrate_data import clean_employees_data, clean_projects_data
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=12, seed=59)
+    folder = tempfile.mkdtemp()
+
+    # Missing skills become empty lists, missing dates NaT, missing texts NaN
+    employees = app.preprocess_employees(employees_df.assign(Name=employees_df['Name'] + ' Müller'))
+    save_frame(employees, os.path.join(folder, 'frame'))
+    pd.testing.assert_frame_equal(load_frame(os.path.join(folder, 'frame')), employees)
+    cache = DatasetCache(os.path.join(folder, 'cache'))
+    assert not cache.put('mixed', employees.assign(Location=[1, 'India'] * 75), projects_df)
+    assert cache.stats()['skipped'] == 1
+
+    employees_df['Capacity per week (hrs)'] = employees_df['Capacity per week (hrs)'].fillna(40)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    db = DatabaseManager(os.path.join(folder, 'cached.db'))
+    db.sync_employees(clean_employees_data(employees_df))
+    db.sync_projects(clean_projects_data(projects_df))
+    default_db, database.db_manager = database.db_manager, db
+    default_cache, app.dataset_cache = app.dataset_cache, cache
+    try:
+        app.load_data()
+        cold = (app.employees_df, app.projects_df, json.dumps(app.perform_matching(), default=str))
+        app.load_data()
+        assert (cache.stats()['hits'], cache.stats()['stores']) == (1, 1)
+        pd.testing.assert_frame_equal(app.employees_df, cold[0])
+        pd.testing.assert_frame_equal(app.projects_df, cold[1])
+        assert json.dumps(app.perform_matching(), default=str) == cold[2]
+
+        db.delete_employee('E001')
+        app.load_data()
+        assert cache.stats()['stores'] == 2 and len(app.employees_df) == 149
+    finally:
+        database.db_manager = default_db
+        app.dataset_cache = default_cache
+        app.data_version = None
+
+
+if __name__ == "__main__":
+    test_dataset_cache_restores_preprocessed_frames()
+    print("✅ Dataset cache restores preprocessed frames")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script to verify compressed and columnar dataset files
+"""
+
+import sys
+import os
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_compressed_uploads_sync_like_csv():
+    """Gzip CSV uploads are streamed into the database like plain CSV and replace the previous dataset file"""
+    import io
+    import gzip
+    import tempfile
+    import database
+    from database import DatabaseManager
+    from dataset_cache import DatasetCache
+    from dataset_formats import dataset_format, read_frame, write_frame
+    from migrate_data import sync_csv_to_database
+    assert [dataset_format(name) for name in ('E.CSV.GZ', 'e.csv.zst', 'e.parquet', 'e.feather', 'e.csv.xlsx')] == \
+        ['.csv.gz', '.csv.zst', '.parquet', '.feather', None]
+    employees_df, projects_df = make_datasets(num_employees=200, num_projects=10, seed=67)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    folder = tempfile.mkdtemp()
+    plain = {'employees': os.path.join(folder, 'plain_employees.csv'), 'projects': os.path.join(folder, 'plain_projects.csv')}
+    packed = {'employees': os.path.join(folder, 'packed_employees.csv.gz'), 'projects': plain['projects']}
+    write_frame(employees_df, plain['employees'])
+    write_frame(projects_df, plain['projects'])
+    write_frame(employees_df, packed['employees'])
+    assert os.path.getsize(packed['employees']) < os.path.getsize(plain['employees']) / 3
+    pd.testing.assert_frame_equal(read_frame(packed['employees']), read_frame(plain['employees']))
+
+    csv_db = DatabaseManager(os.path.join(folder, 'plain.db'))
+    gz_db = DatabaseManager(os.path.join(folder, 'packed.db'))
+    sync_csv_to_database(csv_db, plain, chunk_rows=70)
+    sync_csv_to_database(gz_db, packed, chunk_rows=70)
+    query = 'SELECT emp_id, name, skills, capacity_per_week, available_date, row_hash FROM employees ORDER BY emp_id'
+    with csv_db.connect() as left, gz_db.connect() as right:
+        assert left.execute(query).fetchall() == right.execute(query).fetchall()
+
+    default_db, database.db_manager = database.db_manager, DatabaseManager(os.path.join(folder, 'uploads.db'))
+    default_cache, app.dataset_cache = app.dataset_cache, DatasetCache(os.path.join(folder, 'cache'))
+    default_folder, app.app.config['UPLOAD_FOLDER'] = app.app.config['UPLOAD_FOLDER'], folder
+    try:
+        write_frame(employees_df.iloc[:5], os.path.join(folder, 'Employees.csv'))
+        with app.app.test_client() as client:
+            with client.session_transaction() as session:
+                session['user_id'] = 'tester'
+            with open(packed['employees'], 'rb') as employees:
+                response = client.post('/api/upload', data={'employees': (io.BytesIO(employees.read()), 'hr_export.csv.gz')},
+                                       content_type='multipart/form-data').get_json()
+        assert response['status'] == 'success' and response['sync']['employees']['inserted'] == 200
+        assert not os.path.exists(os.path.join(folder, 'Employees.csv'))
+        with gzip.open(os.path.join(folder, 'Employees.csv.gz'), 'rt') as kept:
+            assert len(pd.read_csv(kept)) == 200
+    finally:
+        database.db_manager = default_db
+        app.dataset_cache = default_cache
+        app.app.config['UPLOAD_FOLDER'] = default_folder
+        app.data_version = None
+
+
+if __name__ == "__main__":
+    test_compressed_uploads_sync_like_csv()
+    print("✅ Compressed uploads sync like CSV")
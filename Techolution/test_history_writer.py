@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script to verify matching history persistence
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_matching_history_is_persisted_per_run():
+    """Every run's listed pairs land in matching_results under its run id, off the request thread"""
+    import sqlite3
+    import tempfile
+    from database import DatabaseManager
+    path = os.path.join(tempfile.mkdtemp(), 'history.db')
+
+    # A table from before run ids keeps its rows through the migration
+    DatabaseManager(path)
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO employees (emp_id, name, skills, role, capacity_per_week, proficiency, location) "
+                     "VALUES ('E001', 'A', 'AI', 'Intern', 40, 'Senior', 'India')")
+        conn.execute("DROP TABLE matching_results")
+        conn.execute("CREATE TABLE matching_results (id INTEGER PRIMARY KEY AUTOINCREMENT, employee_id INTEGER NOT NULL, "
+                     "project_id INTEGER NOT NULL, skill_match REAL NOT NULL, proficiency_match REAL NOT NULL, "
+                     "availability_match REAL NOT NULL, capacity_match REAL NOT NULL, overall_score REAL NOT NULL, "
+                     "domain_bonus REAL DEFAULT 0, conflict_penalty REAL DEFAULT 0, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+        conn.execute("INSERT INTO matching_results (employee_id, project_id, skill_match, proficiency_match, "
+                     "availability_match, capacity_match, overall_score) VALUES (1, 7, 1, 1, 1, 1, 88)")
+    db = DatabaseManager(path)
+    old = db.get_matching_history()
+    assert len(old) == 1 and old['emp_code'][0] == 'E001' and old['run_id'][0] is None
+
+    employees_df, projects_df = make_datasets(num_employees=120, num_projects=15, seed=41)
+    app.result_cache = app.ResultCache(4)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+
+    original_db = app.get_db_manager().db_path
+    app.get_db_manager().db_path = path
+    app.app.config['MATCHING_HISTORY'] = True
+    try:
+        runs = []
+        for mode in ('greedy', 'capacity', 'greedy'):
+            results = app.perform_matching(mode)
+            runs.append((app.matching_stats['run_id'], results))
+        assert app.history_writer.flush(timeout=30)
+        assert runs[2][0] == runs[0][0]  # a cached run is not written again
+
+        for run_id, results in runs[:2]:
+            history = db.get_matching_history(limit=10 ** 6, run_id=run_id)
+            expected = {(match['employee_id'], r['project_id']): (match['overall_score'], match['skill_match'])
+                        for r in results for group in ('matches', 'intelligent_team') for match in r[group]}
+            stored = {(e, p): (overall, skill) for e, p, overall, skill
+                      in zip(history['emp_code'], history['project_code'], history['overall_score'], history['skill_match'])}
+            assert stored == expected
+            team = {(match['employee_id'], r['project_id']) for r in results for match in r['intelligent_team']}
+            assert {(e, p) for e, p, t in zip(history['emp_code'], history['project_code'], history['in_team']) if t} == team
+        assert history.loc[history['emp_code'] == 'E001', 'employee_id'].eq(1).all()
+        assert len(db.get_matching_runs()) == 2
+        assert app.history_writer.stats()['failed'] == 0
+    finally:
+        app.app.config['MATCHING_HISTORY'] = False
+        app.get_db_manager().db_path = original_db
+
+
+if __name__ == "__main__":
+    test_matching_history_is_persisted_per_run()
+    print("✅ Matching history is persisted per run")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script to verify chunked upload ingestion
+"""
+
+import sys
+import os
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_chunked_upload_ingestion_reports_progress():
+    """Uploads stream into the database in chunks, like a whole-file sync, with progress while they run"""
+    import io
+    import tempfile
+    import database
+    from database import DatabaseManager
+    from dataset_cache import DatasetCache
+    from migrate_data import TEXT_DTYPES, clean_employees_data, sync_csv_to_database
+    employees_df, projects_df = make_datasets(num_employees=300, num_projects=12, seed=61)
+    projects_df['Hard_Deadline'] = projects_df['Hard_Deadline'].fillna('2025-12-01')
+    # A key repeated in a later chunk keeps its first row
+    employees_df = pd.concat([employees_df, employees_df.iloc[[2]].assign(Name='Duplicate')], ignore_index=True)
+    folder = tempfile.mkdtemp()
+    paths = {'employees': os.path.join(folder, 'Employees.csv'), 'projects': os.path.join(folder, 'Projects.csv')}
+    employees_df.to_csv(paths['employees'], index=False)
+    projects_df.to_csv(paths['projects'], index=False)
+
+    reports = []
+    db = DatabaseManager(os.path.join(folder, 'chunked.db'))
+    summary = sync_csv_to_database(db, paths, chunk_rows=64, progress=lambda *report: reports.append(report))
+    assert summary['employees']['inserted'] == 300 and summary['projects']['inserted'] == 12
+    assert [rows for table, rows, _, _ in reports if table == 'employees'] == [64, 128, 192, 256, 301]
+    assert all(done == size for table, rows, done, size in reports if rows in (301, 12))
+
+    whole = DatabaseManager(os.path.join(folder, 'whole.db'))
+    whole.sync_employees(clean_employees_data(pd.read_csv(paths['employees'], dtype=TEXT_DTYPES)))
+    query = 'SELECT emp_id, name, skills, capacity_per_week, available_date, row_hash FROM employees ORDER BY emp_id'
+    with db.connect() as chunked, whole.connect() as full:
+        assert chunked.execute(query).fetchall() == full.execute(query).fetchall()
+    resync = sync_csv_to_database(db, paths, chunk_rows=50)
+    assert resync['employees']['unchanged'] == 300 and resync['employees']['deleted'] == 0
+
+    default_db, database.db_manager = database.db_manager, DatabaseManager(os.path.join(folder, 'uploads.db'))
+    default_cache, app.dataset_cache = app.dataset_cache, DatasetCache(os.path.join(folder, 'cache'))
+    default_folder, app.app.config['UPLOAD_FOLDER'] = app.app.config['UPLOAD_FOLDER'], folder
+    try:
+        with app.app.test_client() as client:
+            with client.session_transaction() as session:
+                session['user_id'] = 'tester'
+            with open(paths['employees'], 'rb') as employees, open(paths['projects'], 'rb') as projects:
+                response = client.post('/api/upload', data={
+                    'employees': (io.BytesIO(employees.read()), 'Employees.csv'),
+                    'projects': (io.BytesIO(projects.read()), 'Projects.csv'),
+                    'async': '1'
+                }, content_type='multipart/form-data').get_json()
+            job_id = response['data']['job_id']
+            app.ingest_jobs.executor.submit(lambda: None).result()  # ingestions run one at a time
+            job = client.get(f'/api/upload/jobs/{job_id}').get_json()['data']
+        assert job['state'] == 'done' and job['percent'] == 100.0
+        assert job['rows'] == {'employees': 301, 'projects': 12} and job['sync']['employees']['inserted'] == 300
+        assert len(app.employees_df) == 300 and app.data_version == database.db_manager.get_data_version()
+        assert not any(name.startswith('.upload_') for name in os.listdir(folder))
+    finally:
+        database.db_manager = default_db
+        app.dataset_cache = default_cache
+        app.app.config['UPLOAD_FOLDER'] = default_folder
+        app.data_version = None
+
+
+if __name__ == "__main__":
+    test_chunked_upload_ingestion_reports_progress()
+    print("✅ Chunked uploads ingest with progress")
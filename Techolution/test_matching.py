@@ -7,6 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import fixtures  # loads into a scratch database, not the bundled talent_management.db
 from app import load_data, perform_matching
 
 def test_matching():
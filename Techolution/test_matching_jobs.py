@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script to verify background matching jobs
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_matching_jobs_report_progress_and_results():
+    """Background jobs finish with the same results as a direct run and old jobs are evicted"""
+    import time
+    from matching_jobs import JobManager
+    employees_df, projects_df = make_datasets(num_employees=80, num_projects=6, seed=23)
+    app.result_cache = app.ResultCache(0)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    expected = json.loads(app.app.json.dumps(app.perform_matching()))
+
+    with app.app.test_client() as client:
+        job_id = client.post('/api/jobs', json={}).get_json()['data']['job_id']
+        for _ in range(600):
+            job = client.get(f'/api/jobs/{job_id}').get_json()['data']
+            if job['state'] in ('done', 'failed'):
+                break
+            time.sleep(0.05)
+        assert job['state'] == 'done' and job['percent'] == 100.0
+        assert job['projects_done'] == job['projects_total'] == len(projects_df)
+        assert job['results'] == expected
+        assert 'results' not in client.get(f'/api/jobs/{job_id}?results=0').get_json()['data']
+        assert client.get('/api/jobs/unknown').get_json()['status'] == 'error'
+
+    # Jobs score outside the matching lock, and publish only results of the datasets they read
+    import threading
+    free = []
+
+    def check():
+        free.append(app.matching_lock.acquire(timeout=10))
+        if free[-1]:
+            app.matching_lock.release()
+
+    def probe(done, total):
+        if done == 1:
+            checker = threading.Thread(target=check)
+            checker.start()
+            checker.join()
+
+    app.matching_results = None
+    results = app.perform_matching_job(None, probe)
+    assert free == [True] and app.matching_results is results
+    assert json.loads(app.app.json.dumps(list(results))) == expected
+
+    def edit(done, total):
+        if done == 1:
+            with app.matching_lock:
+                app.employees_df = app.employees_df.copy()
+
+    stale = app.perform_matching_job(None, edit)
+    assert app.matching_results is results and stale is not results
+    assert json.loads(app.app.json.dumps(list(stale))) == expected
+
+    manager = JobManager(lambda mode, progress: [], pool_size=1, retained=2)
+    jobs = [manager.submit() for _ in range(4)]
+    manager.executor.shutdown(wait=True)
+    assert [job.id for job in manager.list()] == [job.id for job in jobs[2:]]
+    assert manager.get(jobs[0].id) is None
+
+
+if __name__ == "__main__":
+    test_matching_jobs_report_progress_and_results()
+    print("✅ Matching jobs report progress and results")
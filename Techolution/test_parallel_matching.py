@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script to verify parallel matching gives the serial results
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_parallel_matching_matches_serial():
+    """Worker processes and the shortlist merge give the serial results"""
+    from incremental_matching import IncrementalMatcher
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=15, seed=9)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    engine = app.get_matching_engine()
+    serial = json.dumps(IncrementalMatcher(engine, app.create_intelligent_team).run(), default=str)
+    for shortlist_length in (3, 100):
+        parallel = IncrementalMatcher(engine, app.create_intelligent_team).run(workers=2, shortlist_length=shortlist_length)
+        assert json.dumps(parallel, default=str) == serial
+
+
+def test_parallel_matching_prunes_like_serial():
+    """Pruned and approximate runs skip the same pairs in workers, which get employee data only through shared memory"""
+    import numpy as np
+    import parallel_matching
+    from incremental_matching import IncrementalMatcher
+    employees_df, projects_df = make_datasets(num_employees=157, num_projects=15, seed=21)
+    projects_df['Locations'] = [None, 'India', 'USA, India', 'USA', None] * 3
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    engine = app.get_matching_engine()
+    assert parallel_matching.default_context().get_start_method() != 'fork'
+
+    # Nothing sized by the roster is pickled to the workers
+    _, state = parallel_matching.worker_inputs(engine, engine.candidate_index().groups())
+    assert not any(isinstance(value, np.ndarray) and engine.num_employees in value.shape for value in state.values())
+
+    for prune, ann in ((True, None), (False, {'clusters': 6, 'probes': 2, 'candidates': 20})):
+        serial = IncrementalMatcher(engine, app.create_intelligent_team)
+        expected = json.dumps(serial.run(prune=prune, ann=ann), default=str)
+        parallel = IncrementalMatcher(engine, app.create_intelligent_team)
+        assert json.dumps(parallel.run(workers=2, prune=prune, ann=ann), default=str) == expected
+        assert parallel.stats == serial.stats and parallel.stats['pruned'] > 0
+        assert np.array_equal(parallel.dense_overall(), serial.dense_overall())
+
+
+if __name__ == "__main__":
+    test_parallel_matching_matches_serial()
+    test_parallel_matching_prunes_like_serial()
+    print("✅ Parallel matching matches serial matching")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the matching result cache
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+import database
+from fixtures import make_datasets, scratch_database
+
+
+def test_result_cache_hits_until_data_changes():
+    """Repeated runs on unchanged data come from the cache; new data or settings miss it"""
+    import tempfile
+    from result_cache import ResultCache
+    employees_df, projects_df = make_datasets(num_employees=100, num_projects=8, seed=19)
+    app.result_cache = ResultCache(4, tempfile.mkdtemp())
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+
+    first = json.dumps(app.perform_matching(), default=str)
+    assert json.dumps(app.perform_matching(), default=str) == first
+    assert app.perform_matching('global') is not None
+    stats = app.result_cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 2, 2)
+
+    # A restart reads the on-disk tier
+    app.result_cache = ResultCache(4, app.result_cache.directory)
+    assert json.dumps(app.perform_matching(), default=str) == first
+    assert app.result_cache.stats()['disk_hits'] == 1
+
+    # Changed content misses, and load_data drops the runs held in memory
+    app.employees_df = employees_df.iloc[:-1].copy()
+    app.preprocess_data()
+    app.perform_matching()
+    assert app.result_cache.stats()['misses'] == 1
+    default_db, database.db_manager = database.db_manager, scratch_database()
+    try:
+        app.load_data()
+    finally:
+        database.db_manager = default_db
+        app.data_version = None
+    assert app.result_cache.stats()['entries'] == 0
+
+    with app.app.test_client() as client:
+        assert client.get('/api/match/cache').get_json()['data']['invalidations'] == 1
+
+
+if __name__ == "__main__":
+    test_result_cache_hits_until_data_changes()
+    print("✅ Result cache hits until data changes")
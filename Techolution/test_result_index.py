@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script to verify paged, filtered and sorted results
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets
+
+
+def test_result_pages_follow_filters_and_cursor():
+    """Paged, filtered and sorted results equal a full scan, and cursors walk every row exactly once"""
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=40, seed=31)
+    app.result_cache = app.ResultCache(0)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    results = app.perform_matching()
+
+    def best(result):
+        return result['matches'][0]['overall_score'] if result['matches'] else 0.0
+
+    def walk(client, query):
+        rows, cursor = [], None
+        while True:
+            url = f"/api/results?{query}" + (f"&cursor={cursor}" if cursor else '')
+            body = client.get(url).get_json()
+            rows += [row['project_id'] for row in body['data']]
+            cursor = body['pagination']['next_cursor']
+            if cursor is None:
+                return rows, body
+
+    with app.app.test_client() as client:
+        order = sorted(range(len(results)), key=lambda p: (best(results[p]), str(results[p]['project_id']), p),
+                       reverse=True)
+        rows, body = walk(client, 'sort=best_score&order=desc&limit=7')
+        assert rows == [results[p]['project_id'] for p in order]
+        assert body['pagination']['total'] == len(results)
+        assert body['summary']['projects'] == len(results)
+
+        # The page's rankings and charts come from the summary of the whole result set
+        summary = body['summary']
+        matches = [m for r in results for m in r['matches']]
+        assert sum(summary['counts']['score'].values()) == sum(summary['counts']['role'].values()) == len(matches)
+        assert sum(summary['counts']['domain'].values()) == len(results)
+        assert summary['domains'] == sorted({r['project_domain'] for r in results})
+        best_by_employee = {}
+        for m in matches:
+            best_by_employee[m['employee_id']] = max(best_by_employee.get(m['employee_id'], 0), m['overall_score'])
+        assert [m['overall_score'] for m in summary['top_employees']] == sorted(best_by_employee.values(), reverse=True)[:10]
+        index = app.result_index
+
+        domain = results[0]['project_domain']
+        expected = [r['project_id'] for r in results if r['project_domain'] == domain and best(r) >= 70]
+        assert walk(client, f'domain={domain.lower()}&min_score=70&limit=3')[0] == expected
+
+        emp_id = results[0]['intelligent_team'][0]['employee_id']
+        expected = [r['project_id'] for r in results
+                    if any(m['employee_id'] == emp_id for f in ('matches', 'top_3', 'intelligent_team') for m in r[f])]
+        assert walk(client, f'employee_id={emp_id}&limit=2')[0] == expected
+
+        page = client.get('/api/results?page=2&limit=5&sort=title').get_json()
+        titles = sorted(results, key=lambda r: (r['project_title'].lower(), str(r['project_id'])))
+        assert [row['project_id'] for row in page['data']] == [r['project_id'] for r in titles[5:10]]
+        assert app.result_index is index
+
+        assert client.get('/api/results?sort=salary').get_json()['status'] == 'error'
+        assert client.get('/api/results?sort=title&cursor=abc').get_json()['status'] == 'error'
+        assert len(client.get('/api/results').get_json()['data']) == len(results)
+
+
+def test_result_views_are_presorted_for_every_min_score():
+    """Every sort, order and filter pages like a full sort, and score thresholds reuse the presorted views"""
+    from result_index import ResultIndex, SORT_KEYS
+    employees_df, projects_df = make_datasets(num_employees=120, num_projects=60, seed=37)
+    app.employees_df = employees_df
+    app.projects_df = projects_df
+    app.preprocess_data()
+    results = list(app.perform_matching())
+    index = ResultIndex(results)
+    values = {sort: index.sort_values[sort] for sort in SORT_KEYS}
+    domain = results[1]['project_domain']
+
+    for sort in SORT_KEYS:
+        for descending in (False, True):
+            for min_score in (None, 0, 55.5, 72.25, 1000):
+                for filters in ({}, {'domain': domain}):
+                    expected = sorted((p for p in range(len(results))
+                                       if (min_score is None or index.best_scores[p] >= min_score)
+                                       and (not filters or results[p]['project_domain'] == domain)),
+                                      key=lambda p: (values[sort][p], index.project_ids[p], p), reverse=descending)
+                    rows, cursor = [], None
+                    while True:
+                        page = index.page(sort, descending, 4, cursor=cursor, min_score=min_score, **filters)
+                        rows += [results.index(row) for row in page['results']]
+                        assert page['total'] == len(expected)
+                        cursor = page['next_cursor']
+                        if cursor is None:
+                            break
+                    assert rows == expected
+                    page = index.page(sort, descending, 4, page=3, min_score=min_score, **filters)
+                    assert [results.index(row) for row in page['results']] == expected[8:12]
+    assert len(index.views) == len(SORT_KEYS)
+
+
+if __name__ == "__main__":
+    test_result_pages_follow_filters_and_cursor()
+    test_result_views_are_presorted_for_every_min_score()
+    print("✅ Result pages follow filters and cursors")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script to verify semantic relevance scoring
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from fixtures import make_datasets, run_both
+
+
+def test_semantic_relevance_is_cached_and_exact():
+    """TF-IDF cosines come from the disk cache after a restart and weight scores like the reference"""
+    import tempfile
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    from matching_engine import MatchingEngine
+    from semantic import TextModel, TFIDF_PARAMS
+    employees_df, projects_df = make_datasets(num_employees=150, num_projects=12, seed=13)
+    cache_dir = tempfile.mkdtemp()
+    engine = MatchingEngine(employees_df, projects_df, app.taxonomy_loader.get(), text_cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Same cosines as fitting the vectorizer by hand
+    texts = engine.emp_texts + engine.proj_texts
+    vectors = TfidfVectorizer(**TFIDF_PARAMS).fit_transform(texts)
+    expected = cosine_similarity(vectors[len(engine.emp_texts):], vectors[:len(engine.emp_texts)])
+    semantic = engine.score_block(0, engine.num_projects)['semantic']
+    assert np.allclose(semantic, expected) and semantic.max() > 0
+
+    # A restart with the same datasets reads the cached matrices instead of refitting
+    fit = TextModel.fit
+    TextModel.fit = None
+    try:
+        restarted = MatchingEngine(employees_df, projects_df, engine.taxonomy, text_cache_dir=cache_dir)
+    finally:
+        TextModel.fit = fit
+    assert np.array_equal(restarted.score_block(0, engine.num_projects)['semantic'], semantic)
+
+    app.app.config['SEMANTIC_WEIGHT'] = 0.2
+    try:
+        app.matching_engine = None
+        reference, engine_results = run_both(employees_df, projects_df)
+        assert reference == engine_results
+        assert all('semantic_match' in match for result in app.matching_results for match in result['matches'])
+
+        matcher = app.IncrementalMatcher(app.get_matching_engine(), None)
+        matcher.score()
+        full = matcher.overall.copy()
+        matcher.score(prune=True)
+        assert np.array_equal(matcher.overall, full)
+    finally:
+        app.app.config['SEMANTIC_WEIGHT'] = 0
+        app.matching_engine = None
+
+
+def test_semantic_match_only_reported_when_weighted():
+    """With the default SEMANTIC_WEIGHT of 0 match dicts keep their keys from before semantic scoring"""
+    from compact_results import PLAIN_MATCH_KEYS
+    employees_df, projects_df = make_datasets(num_employees=60, num_projects=8, seed=23)
+    app.matching_engine = None
+    reference, engine_results = run_both(employees_df, projects_df)
+    assert reference == engine_results
+    for result in app.matching_results:
+        for group in ('matches', 'top_3', 'intelligent_team'):
+            assert all(tuple(match)[:len(PLAIN_MATCH_KEYS)] == PLAIN_MATCH_KEYS for match in result[group])
+    assert not any(packed.raw for packed in app.matching_results.projects)
+
+
+if __name__ == "__main__":
+    test_semantic_relevance_is_cached_and_exact()
+    test_semantic_match_only_reported_when_weighted()
+    print("✅ Semantic relevance is cached and exact")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the domain taxonomy loader
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_taxonomy_recompiles_when_file_changes():
+    """Editing the taxonomy file recompiles it and changes the employee bitmasks"""
+    import tempfile
+    from taxonomy import TaxonomyLoader
+    config = {
+        'domains': [{'name': 'ai', 'skills': ['AI'], 'complementary_roles': ['UI/UX']}],
+        'default_team_skills': ['AI'],
+        'default_complementary_roles': ['UI/UX']
+    }
+    path = os.path.join(tempfile.mkdtemp(), 'taxonomy.json')
+    with open(path, 'w') as f:
+        json.dump(config, f)
+    loader = TaxonomyLoader(path)
+    first = loader.get()
+    assert first.skill_masks(['Data Science']) == (0, 0)
+    assert loader.get() is first
+
+    config['domains'][0]['skills'].append('Data Science')
+    with open(path, 'w') as f:
+        json.dump(config, f)
+    os.utime(path, (0, os.path.getmtime(path) + 10))
+    second = loader.get()
+    assert second is not first
+    assert second.skill_masks(['Data Science'])[0] & (1 << second.team_domain('AI'))
+
+
+if __name__ == "__main__":
+    test_taxonomy_recompiles_when_file_changes()
+    print("✅ Taxonomy recompiles when its file changes")